@@ -29,6 +29,10 @@ class Bookmark(models.Model):
             models.UniqueConstraint(fields=["user", "event"], name="uq_bookmark_user_event")
         
         ]
+        indexes = [
+            # 트렌딩 계산 (events.services.compute_trending_events)의 created_at 범위 조회
+            models.Index(fields=["created_at"], name="bookmark_created_idx"),
+        ]
     
     def __str__(self):
         return f"Bookmark(user_id={self.user_id}, event_id={self.event_id})"
\ No newline at end of file
@@ -1,3 +1,81 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import IntegrityError
 from django.test import TestCase
 
-# Create your tests here.
+from common.utils import create_access_token
+from events.models import Event
+from users.models import User
+from .models import Bookmark
+
+
+class ToggleBookmarkTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        self.event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.url = f"/api/bookmarks/{self.event.event_id}"
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user.user_id)}"}
+
+    def _favorite_count(self):
+        self.event.refresh_from_db()
+        return self.event.favorite_count
+
+    def test_toggle_updates_favorite_count(self):
+        res = self.client.post(self.url, **self.auth)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.json()["data"]["state"], "on")
+        self.assertEqual(self._favorite_count(), 1)
+
+        res = self.client.post(self.url, **self.auth)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["data"]["state"], "off")
+        self.assertEqual(self._favorite_count(), 0)
+        self.assertFalse(Bookmark.objects.exists())
+
+    def test_concurrent_create_returns_conflict(self):
+        # 동시 요청이 먼저 bookmark를 만든 상황 (유니크 제약 위반)
+        with mock.patch("bookmarks.views.Bookmark.objects.create", side_effect=IntegrityError):
+            res = self.client.post(self.url, **self.auth)
+        self.assertEqual(res.status_code, 409)
+        self.assertEqual(self._favorite_count(), 0)
+
+    def test_missing_event(self):
+        res = self.client.post("/api/bookmarks/999999", **self.auth)
+        self.assertEqual(res.status_code, 404)
+
+
+class ReconcileFavoriteCountsTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(email=f"u{i}@example.com", nickname=f"u{i}", provider="kakao", provider_id=str(i))
+            for i in range(2)
+        ]
+        self.events = [
+            Event.objects.create(
+                kopis_id=f"PF{i}", title=f"공연{i}",
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+            for i in range(2)
+        ]
+
+    def test_reconcile_fixes_drift(self):
+        # API를 거치지 않은 bookmark + 잘못된 카운트
+        for user in self.users:
+            Bookmark.objects.create(user=user, event=self.events[0])
+        Event.objects.filter(pk=self.events[1].pk).update(favorite_count=3)
+
+        out = StringIO()
+        call_command("reconcile_favorite_counts", "--dry-run", stdout=out)
+        self.assertIn("불일치 2건 발견", out.getvalue())
+        self.assertEqual(Event.objects.get(pk=self.events[0].pk).favorite_count, 0)
+
+        out = StringIO()
+        call_command("reconcile_favorite_counts", stdout=out)
+        self.assertIn("불일치 2건 보정", out.getvalue())
+        counts = dict(Event.objects.values_list("event_id", "favorite_count"))
+        self.assertEqual(counts, {self.events[0].event_id: 2, self.events[1].event_id: 0})
@@ -7,7 +7,8 @@ from events.models import Event
 from bookmarks.models import Bookmark
 from django.views.decorators.csrf import csrf_exempt
 from django.core.paginator import Paginator, EmptyPage
-from django.db.models import Count
+from django.db import transaction, IntegrityError
+from django.db.models import F
 
 User = get_user_model()
 
@@ -26,15 +27,24 @@ def toggle_bookmark(request, event_id):
             return common_response(False, message="잘못된 요청입니다(유저 또는 공연 없음).", status=404)
 
         # 2. 토글 로직 (있으면 삭제, 없으면 생성)
-        bookmark = Bookmark.objects.filter(user=user, event=event).first()
+        ## events.favorite_count도 같은 트랜잭션에서 F()로 증감
+        events = Event.objects.filter(event_id=event.event_id)
+        with transaction.atomic():
+            deleted, _ = Bookmark.objects.filter(user=user, event=event).delete()
 
-        if bookmark:
-            bookmark.delete()
+            if deleted:
+                events.update(favorite_count=F("favorite_count") - 1)
+            else:
+                Bookmark.objects.create(user=user, event=event)
+                events.update(favorite_count=F("favorite_count") + 1)
+
+        if deleted:
             return common_response(True, message="북마크 취소됨", data={"state": "off"}, status=200)
-        else:
-            Bookmark.objects.create(user=user, event=event)
-            return common_response(True, message="북마크 성공!", data={"state": "on"}, status=201)
+        return common_response(True, message="북마크 성공!", data={"state": "on"}, status=201)
 
+    except IntegrityError:
+        # 동시 요청으로 같은 북마크가 먼저 생성된 경우
+        return common_response(False, message="북마크 처리 중 충돌이 발생했습니다.", status=409)
     except Exception as e:
         print(f"Bookmark Error: {e}")
         return common_response(False, message="서버 에러 발생", status=500)
@@ -50,8 +60,7 @@ def mypage(request):
                                         .order_by('-created_at')\
                                         .values_list('event_id', flat=True)
 
-        qs = Event.objects.filter(event_id__in=list(my_booked_ids))\
-                          .annotate(favorite_count=Count('bookmarks'))
+        qs = Event.objects.filter(event_id__in=list(my_booked_ids))
 
         qs = qs.order_by('-start_date')
 
@@ -0,0 +1,289 @@
+# 설명: 목록 API 공통 페이지네이션 헬퍼
+## keyset(cursor) 페이지네이션: OFFSET/COUNT 없이 "마지막 행의 정렬 키" 이후만 조회
+## total_count 캐시: 엔드포인트 + 정규화 필터별 COUNT(*) 결과를 TTL + 쓰기 시 무효화로 재사용
+import base64
+import binascii
+import datetime
+import hashlib
+import json
+from decimal import Decimal
+from functools import cached_property, reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _cursor_value(v):
+    if isinstance(v, (datetime.date, datetime.datetime)):
+        return v.isoformat()
+    if isinstance(v, Decimal):
+        return str(v)
+    return v
+
+
+def encode_cursor(tag: str, values) -> str:
+    """
+    tag: 정렬 식별자 (다른 정렬의 cursor 재사용 방지)
+    values: 마지막 행의 정렬 키 값들 (ordering 순서)
+    """
+    payload = json.dumps({"o": tag, "v": [_cursor_value(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, tag: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = payload["v"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursor("잘못된 cursor 입니다.")
+
+    if payload.get("o") != tag or not isinstance(values, list):
+        raise InvalidCursor("정렬 기준과 cursor가 일치하지 않습니다.")
+    return values
+
+
+def _is_nullable(model, name: str) -> bool:
+    try:
+        return model._meta.get_field(name).null
+    except FieldDoesNotExist:
+        # annotate 값은 NOT NULL로 취급
+        return False
+
+
+def _coerce_cursor_value(model, name: str, value):
+    """
+    cursor 값(클라이언트가 보낸 JSON)을 정렬 필드 타입으로 변환, 변환 불가면 InvalidCursor
+    - annotate 값(search_score 등)은 숫자만 허용
+    """
+    if value is None:
+        if not _is_nullable(model, name):
+            raise InvalidCursor("잘못된 cursor 입니다.")
+        return None
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise InvalidCursor("잘못된 cursor 입니다.")
+        return value
+
+    if isinstance(value, (dict, list)):
+        raise InvalidCursor("잘못된 cursor 입니다.")
+    try:
+        value = field.to_python(value)
+    except (ValidationError, TypeError, ValueError):
+        raise InvalidCursor("잘못된 cursor 입니다.")
+    if value is None:
+        raise InvalidCursor("잘못된 cursor 입니다.")
+    return value
+
+
+def keyset_filter(model, ordering, values) -> Q:
+    """
+    ordering(예: ["-start_date", "-event_id"]) 기준으로 values 행 "다음"에 오는 행 조건
+    (a < v1) OR (a = v1 AND b < v2) OR ...
+
+    NULL 정렬은 MariaDB/SQLite 기준 (ASC: NULL 먼저, DESC: NULL 마지막)
+    """
+    if len(ordering) != len(values):
+        raise InvalidCursor("정렬 기준과 cursor가 일치하지 않습니다.")
+    values = [_coerce_cursor_value(model, spec.lstrip("-"), v) for spec, v in zip(ordering, values)]
+
+    branches = []
+    equal = Q()
+    for spec, value in zip(ordering, values):
+        desc = spec.startswith("-")
+        name = spec.lstrip("-")
+        nullable = _is_nullable(model, name)
+
+        if value is None:
+            # DESC: NULL 블록이 마지막이라 "이후" 없음 / ASC: NULL 다음은 NOT NULL 전체
+            after = None if desc else Q(**{f"{name}__isnull": False})
+            same = Q(**{f"{name}__isnull": True})
+        else:
+            after = Q(**{f"{name}__{'lt' if desc else 'gt'}": value})
+            if desc and nullable:
+                after |= Q(**{f"{name}__isnull": True})
+            same = Q(**{name: value})
+
+        if after is not None:
+            branches.append(equal & after)
+        equal &= same
+
+    if not branches:
+        return Q(pk__in=[])
+
+    cond = reduce(or_, branches)
+
+    # 첫 정렬 키 범위 조건을 한 번 더 명시 → 인덱스 range scan 유도
+    first, first_value = ordering[0], values[0]
+    first_name = first.lstrip("-")
+    if first_value is not None and not _is_nullable(model, first_name):
+        cond &= Q(**{f"{first_name}__{'lte' if first.startswith('-') else 'gte'}": first_value})
+    return cond
+
+
+def cursor_paginate(qs, ordering, tag: str, cursor: str, size: int):
+    """
+    반환: (rows, next_cursor)  (next_cursor가 None이면 마지막 페이지)
+    - cursor가 빈 문자열이면 첫 페이지
+    - ordering의 이름은 모델 필드 또는 annotate 이름이어야 함 (__ 경로 X)
+    """
+    ordering = list(ordering)
+    if cursor:
+        values = decode_cursor(cursor, tag)
+        qs = qs.filter(keyset_filter(qs.model, ordering, values))
+
+    rows = list(qs.order_by(*ordering)[:size + 1])
+    if len(rows) <= size:
+        return rows, None
+
+    rows = rows[:size]
+    last = rows[-1]
+    return rows, encode_cursor(tag, [getattr(last, spec.lstrip("-")) for spec in ordering])
+
+
+def reverse_ordering(ordering) -> list:
+    return [spec[1:] if spec.startswith("-") else f"-{spec}" for spec in ordering]
+
+
+def cursor_paginate_both(qs, ordering, tag: str, cursor: str, size: int, direction: str = "next"):
+    """
+    양방향 keyset 페이지네이션 (예: 댓글 "이전 댓글 더보기" / "새 댓글 불러오기")
+    반환: (rows, next_cursor, prev_cursor, has_next, has_prev)  rows는 항상 ordering 순서
+    - direction=next: cursor 행 "다음" (cursor가 빈 문자열이면 첫 페이지)
+    - direction=prev: cursor 행 "이전" (역순으로 조회 후 뒤집음)
+    - prev_cursor는 새 행이 아직 없어도 반환 (이후 다시 prev로 조회)
+        - 행이 하나도 없는 첫 페이지: 빈 값 cursor(맨 앞 위치)를 반환 → prev 조회 시 전체가 대상
+    """
+    ordering = list(ordering)
+    if direction not in ("next", "prev"):
+        raise InvalidCursor("direction은 next/prev 중 하나여야 합니다.")
+
+    if direction == "prev":
+        if not cursor:
+            raise InvalidCursor("direction=prev는 cursor가 필요합니다.")
+        values = decode_cursor(cursor, tag)
+        backward = reverse_ordering(ordering)
+        if values:
+            qs = qs.filter(keyset_filter(qs.model, backward, values))
+        rows = list(qs.order_by(*backward)[:size + 1])
+        has_prev = len(rows) > size
+        rows = rows[:size][::-1]
+        has_next = True
+    else:
+        if cursor:
+            values = decode_cursor(cursor, tag)
+            if values:
+                qs = qs.filter(keyset_filter(qs.model, ordering, values))
+        rows = list(qs.order_by(*ordering)[:size + 1])
+        has_next = len(rows) > size
+        rows = rows[:size]
+        has_prev = bool(cursor)
+
+    def _encode(row):
+        return encode_cursor(tag, [getattr(row, spec.lstrip("-")) for spec in ordering])
+
+    if not rows:
+        # 빈 페이지: 같은 위치에서 다시 조회할 수 있도록 받은 cursor 유지
+        if direction == "prev":
+            return rows, cursor, cursor, True, False
+        return rows, None, cursor or encode_cursor(tag, []), False, has_prev
+    next_cursor = _encode(rows[-1]) if has_next else None
+    return rows, next_cursor, _encode(rows[0]), has_next, has_prev
+
+
+# ---------------------------------------------------------------------------
+# total_count 캐시
+# - key: count:<namespace>:v<버전>:<endpoint>:<필터 해시>
+# - 무효화: namespace 버전 증가 (invalidate_counts) -> 이전 키는 TTL로 자연 만료
+# ---------------------------------------------------------------------------
+
+def _version_key(namespace: str) -> str:
+    return f"count_ver:{namespace}"
+
+
+def _count_version(namespace: str) -> int:
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key) or 1
+    return version
+
+
+def invalidate_counts(namespace: str) -> None:
+    """
+    namespace(예: "events", "posts", "comments:<post_id>")의 캐시된 count 전부 무효화
+    """
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+        cache.incr(key)
+
+
+def _normalize_filters(filters) -> str:
+    items = sorted((k, str(v)) for k, v in (filters or {}).items() if v not in (None, ""))
+    return hashlib.md5(json.dumps(items, ensure_ascii=False).encode()).hexdigest()
+
+
+def _estimated_table_rows(table: str):
+    # MariaDB: information_schema 통계값 (InnoDB는 근사치), 그 외 DB는 None
+    if connection.vendor != "mysql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            [table],
+        )
+        row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else None
+
+
+def cached_count(qs, namespace: str, endpoint: str, filters=None) -> int:
+    """
+    qs.count() 결과를 캐시
+    - 필터가 전혀 없고 COUNT_CACHE_ESTIMATE_UNFILTERED=True면 테이블 통계 근사치 사용
+    """
+    key = f"count:{namespace}:v{_count_version(namespace)}:{endpoint}:{_normalize_filters(filters)}"
+    count = cache.get(key)
+    if count is not None:
+        return count
+
+    count = None
+    has_filter = any(v not in (None, "") for v in (filters or {}).values())
+    if not has_filter and getattr(settings, "COUNT_CACHE_ESTIMATE_UNFILTERED", False):
+        count = _estimated_table_rows(qs.model._meta.db_table)
+    if count is None:
+        count = qs.count()
+
+    cache.set(key, count, timeout=getattr(settings, "COUNT_CACHE_TTL", 60))
+    return count
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator.count만 cached_count로 대체 (응답 형태는 기존 Paginator와 동일)
+    """
+
+    def __init__(self, object_list, per_page, *, namespace: str, endpoint: str, filters=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.namespace = namespace
+        self.endpoint = endpoint
+        self.filters = filters or {}
+
+    @cached_property
+    def count(self):
+        return cached_count(self.object_list, self.namespace, self.endpoint, self.filters)
@@ -0,0 +1,22 @@
+# 설명: 테스트 공용 헬퍼 (목록 쿼리 실행 계획 검증)
+from django.db import connection
+
+# DB별 "정렬을 인덱스로 못 하고 별도 정렬" 표시
+## SQLite: EXPLAIN QUERY PLAN / MariaDB: EXPLAIN Extra 컬럼
+FILESORT_MARKERS = {
+    "sqlite": ("USE TEMP B-TREE FOR ORDER BY",),
+    "mysql": ("Using filesort",),
+}
+
+
+class QueryPlanAssertionsMixin:
+    """
+    TestCase용 mixin: 목록 쿼리가 풀스캔 + 정렬(filesort)로 떨어지면 실패
+    """
+
+    def assertIndexOrdered(self, qs, msg=None):
+        plan = qs.explain()
+        for marker in FILESORT_MARKERS.get(connection.vendor, ()):
+            if marker in plan:
+                self.fail(msg or f"인덱스 정렬 아님 ({marker}):\n{qs.query}\n---\n{plan}")
+        return plan
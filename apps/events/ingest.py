@@ -0,0 +1,301 @@
+# 설명: KOPIS 덤프(XML/JSON) 스트리밍 적재 (ingest_events 커맨드에서 사용)
+## - XML: <dbs><db>...</db></dbs> 를 iterparse로 한 건씩 처리 (메모리 일정)
+## - JSON: JSON Lines(한 줄 = 공연 1건) 스트리밍, 배열/{"dbs": {"db": [...]}} 문서도 허용
+## - kopis_id 기준 bulk upsert (bulk_create(update_conflicts=True))
+## - content_hash가 같은 행(변경 없음)은 건너뜀 -> 인덱스 churn/update_date 갱신 방지
+import datetime
+import io
+import json
+import xml.etree.ElementTree as ET
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Event
+from .services import artist_resolver, event_content_hash
+
+
+# KOPIS 필드명 -> Event 필드명 (모델 필드명 그대로 들어와도 허용)
+KOPIS_FIELD_MAP = {
+    "mt20id": "kopis_id",
+    "prfnm": "title",
+    "prfcast": "artist",
+    "prfpdfrom": "start_date",
+    "prfpdto": "end_date",
+    "fcltynm": "venue",
+    "area": "area",
+    "prfage": "age",
+    "poster": "poster",
+    "dtguidance": "time",
+    "pcseguidance": "price",
+    "updatedate": "update_date",
+    "relateurl": "relate_url",
+    "entrpsnm": "host",
+    "genrenm": "genre",
+}
+
+# upsert 시 갱신할 컬럼 (event_id/kopis_id/favorite_count 제외)
+UPSERT_FIELDS = [
+    "title", "artist", "start_date", "end_date", "venue", "area", "age", "poster",
+    "time", "price", "update_date", "relate_url", "host", "genre", "group_name", "content_hash",
+    "content_updated_at",
+]
+
+_MODEL_FIELDS = {"kopis_id", *UPSERT_FIELDS} - {"content_hash", "content_updated_at"}
+
+
+class IngestError(ValueError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# 입력 파싱 (스트리밍)
+# ---------------------------------------------------------------------------
+
+def _iter_xml(stream):
+    context = ET.iterparse(stream, events=("start", "end"))
+    _, root = next(context)
+    for event, elem in context:
+        if event != "end" or elem.tag != "db":
+            continue
+        record = {}
+        for child in elem.iter():
+            if child is elem or len(child):
+                continue
+            # relates/relate/relateurl 처럼 중첩된 값은 첫 번째만 사용
+            record.setdefault(child.tag, (child.text or "").strip())
+        yield record
+        # 처리한 노드 해제 (대용량 덤프에서 메모리 증가 방지)
+        elem.clear()
+        root.clear()
+
+
+def _unwrap_document(doc):
+    if isinstance(doc, dict):
+        doc = doc.get("dbs", doc)
+        if isinstance(doc, dict):
+            doc = doc.get("db", [doc])
+    if isinstance(doc, dict):
+        doc = [doc]
+    if not isinstance(doc, list):
+        raise IngestError("JSON 덤프 형식을 알 수 없습니다.")
+    return doc
+
+
+def _iter_json(stream):
+    text = io.TextIOWrapper(stream, encoding="utf-8")
+    first = ""
+    for line in text:
+        if line.strip():
+            first = line
+            break
+
+    if first.lstrip().startswith("{"):
+        try:
+            record = json.loads(first)
+        except json.JSONDecodeError:
+            record = None
+        if record is not None:
+            # JSON Lines
+            yield from _unwrap_document(record)
+            for line in text:
+                if line.strip():
+                    yield from _unwrap_document(json.loads(line))
+            return
+
+    # 단일 JSON 문서 (배열 등)
+    yield from _unwrap_document(json.loads(first + text.read()))
+
+
+def iter_records(stream, fmt: str = "auto"):
+    """
+    stream: 바이너리 스트림 (파일/sys.stdin.buffer)
+    fmt: auto | xml | json
+    """
+    if not isinstance(stream, io.BufferedReader):
+        stream = io.BufferedReader(stream)
+
+    if fmt == "auto":
+        head = stream.peek(256).lstrip(b"\xef\xbb\xbf \t\r\n")
+        fmt = "xml" if head.startswith(b"<") else "json"
+
+    if fmt == "xml":
+        return _iter_xml(stream)
+    if fmt == "json":
+        return _iter_json(stream)
+    raise IngestError(f"지원하지 않는 형식: {fmt}")
+
+
+# ---------------------------------------------------------------------------
+# 레코드 정규화
+# ---------------------------------------------------------------------------
+
+def _parse_date(value):
+    if not value:
+        return None
+    v = str(value).strip().replace(".", "-").replace("/", "-")
+    if len(v) == 8 and v.isdigit():
+        v = f"{v[:4]}-{v[4:6]}-{v[6:]}"
+    try:
+        return datetime.date.fromisoformat(v[:10])
+    except ValueError:
+        return None
+
+
+def _parse_datetime(value):
+    if not value:
+        return None
+    try:
+        dt = datetime.datetime.fromisoformat(str(value).strip().replace(".", "-"))
+    except ValueError:
+        return None
+    if timezone.is_naive(dt):
+        dt = timezone.make_aware(dt)
+    return dt
+
+
+def _clean(value, max_length):
+    if value is None:
+        return None
+    v = str(value).strip()
+    if not v:
+        return None
+    return v[:max_length] if max_length else v
+
+
+def normalize_record(raw: dict):
+    """
+    KOPIS 레코드 1건 -> Event 필드 dict (kopis_id/title/기간 없으면 None)
+    """
+    data = {}
+    for key, value in raw.items():
+        field = KOPIS_FIELD_MAP.get(key, key)
+        if field in _MODEL_FIELDS and field not in data:
+            data[field] = value
+
+    data["start_date"] = _parse_date(data.get("start_date"))
+    data["end_date"] = _parse_date(data.get("end_date"))
+    data["update_date"] = _parse_datetime(data.get("update_date"))
+
+    for name in _MODEL_FIELDS - {"start_date", "end_date", "update_date"}:
+        data[name] = _clean(data.get(name), Event._meta.get_field(name).max_length)
+
+    if not data["kopis_id"] or not data["title"] or not data["start_date"]:
+        return None
+    if not data["end_date"]:
+        data["end_date"] = data["start_date"]
+    return data
+
+
+def resolve_group_names(rows) -> None:
+    """
+    배치 단위로 artist -> group_name (artist_resolver 메모리 조회, DB 조회 없음)
+    - "A, B" 형태 출연진은 처음 매핑되는 이름 사용
+    """
+    names = set()
+    for row in rows:
+        if row["artist"]:
+            names.add(row["artist"])
+            names.update(n.strip() for n in row["artist"].split(","))
+    resolved = artist_resolver.resolve_many(names)
+
+    for row in rows:
+        artist = row["artist"]
+        stage = None
+        if artist:
+            stage = resolved.get(artist) or next(
+                (resolved[n.strip()] for n in artist.split(",") if n.strip() in resolved), None,
+            )
+        # 매핑이 없으면 덤프에 있던 group_name 유지
+        row["group_name"] = stage or row.get("group_name")
+
+
+# ---------------------------------------------------------------------------
+# upsert
+# ---------------------------------------------------------------------------
+
+def _changed_rows(by_kopis: dict) -> list:
+    """
+    저장된 content_hash와 비교해 신규/변경 행만 반환
+    - 변경 행의 update_date가 덤프에 없으면 현재 시각
+    - 변경 행의 content_updated_at은 현재 시각 (공연 상세 Last-Modified)
+    """
+    stored = dict(
+        Event.objects.filter(kopis_id__in=list(by_kopis)).values_list("kopis_id", "content_hash")
+    )
+    now = timezone.now()
+    changed = []
+    for kopis_id, row in by_kopis.items():
+        row["content_hash"] = event_content_hash(row)
+        if kopis_id in stored and stored[kopis_id] == row["content_hash"]:
+            continue
+        if row.get("update_date") is None:
+            row["update_date"] = now
+        row["content_updated_at"] = now
+        changed.append(row)
+    return changed
+
+
+def upsert_events(rows) -> list:
+    """
+    rows: normalize_record 결과 목록 -> kopis_id 기준 upsert
+    반환: 실제로 생성/변경된 event_id 목록 (변경 없는 행 제외)
+    """
+    resolve_group_names(rows)
+    by_kopis = {row["kopis_id"]: row for row in rows}
+    if not by_kopis:
+        return []
+
+    changed = _changed_rows(by_kopis)
+    if not changed:
+        return []
+    by_kopis = {row["kopis_id"]: row for row in changed}
+
+    # MariaDB는 ON DUPLICATE KEY UPDATE라 unique_fields 지정 불가
+    unique_fields = ["kopis_id"] if connection.features.supports_update_conflicts_with_target else None
+
+    objs = [Event(**row) for row in by_kopis.values()]
+    with transaction.atomic():
+        Event.objects.bulk_create(
+            objs,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=UPSERT_FIELDS,
+        )
+        return list(
+            Event.objects.filter(kopis_id__in=list(by_kopis)).values_list("event_id", flat=True)
+        )
+
+
+def ingest(records, batch_size: int = 2000, on_batch=None) -> dict:
+    """
+    records: 원본 레코드 iterable
+    on_batch(event_ids): 배치 upsert 후 변경된 event_id로 호출 (검색 인덱스/캐시 갱신 등)
+    반환 stats["changed_ids"]: 전체 변경 event_id 목록
+    """
+    stats = {"read": 0, "skipped": 0, "upserted": 0, "unchanged": 0, "changed_ids": []}
+    batch = []
+
+    def flush():
+        ids = upsert_events(batch)
+        stats["upserted"] += len(ids)
+        stats["unchanged"] += len({row["kopis_id"] for row in batch}) - len(ids)
+        stats["changed_ids"].extend(ids)
+        batch.clear()
+        if on_batch and ids:
+            on_batch(ids)
+
+    for raw in records:
+        stats["read"] += 1
+        row = normalize_record(raw)
+        if row is None:
+            stats["skipped"] += 1
+            continue
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+    return stats
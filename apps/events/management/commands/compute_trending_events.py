@@ -0,0 +1,61 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from events.services import compute_trending_events
+
+
+class Command(BaseCommand):
+    help = "sort=trending 랭킹(event_trending) 갱신 (기본: 마지막 워터마크 이후 증분)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="윈도우 내 bookmark로 처음부터 재계산")
+        parser.add_argument("--half-life-hours", type=float, default=settings.TRENDING_HALF_LIFE_HOURS)
+        parser.add_argument("--window-days", type=int, default=settings.TRENDING_WINDOW_DAYS)
+        parser.add_argument(
+            "--overlap-minutes", type=float, default=settings.TRENDING_OVERLAP_MINUTES,
+            help="매 실행 다시 집계하는 최근 구간(분), 늦게 커밋된 bookmark 대응",
+        )
+        parser.add_argument(
+            "--interval", type=float, default=0,
+            help="증분 계산 주기(초), 0이면 1번 계산하고 종료 (cron용)",
+        )
+        parser.add_argument(
+            "--full-interval", type=float, default=settings.TRENDING_FULL_INTERVAL,
+            help="--interval 실행 중 전체 재계산 주기(초), 0이면 하지 않음",
+        )
+
+    def handle(self, *args, **options):
+        if options["half_life_hours"] <= 0 or options["window_days"] <= 0:
+            raise CommandError("--half-life-hours/--window-days는 0보다 커야 합니다.")
+        if options["overlap_minutes"] < 0:
+            raise CommandError("--overlap-minutes는 0 이상이어야 합니다.")
+
+        interval = options["interval"]
+        full_interval = options["full_interval"]
+        full = options["full"]
+        last_full = time.monotonic()
+        try:
+            while True:
+                close_old_connections()
+                result = compute_trending_events(
+                    half_life_hours=options["half_life_hours"],
+                    window_days=options["window_days"],
+                    full=full,
+                    overlap_minutes=options["overlap_minutes"],
+                )
+                mode = "전체" if result["full"] else "증분"
+                self.stdout.write(self.style.SUCCESS(
+                    f"트렌딩 {mode} 계산 완료: 공연 {result['events']}개 반영 "
+                    f"(확정 구간 ~ {result['settled_until'].isoformat()})"
+                ))
+                if interval <= 0:
+                    break
+                if result["full"]:
+                    last_full = time.monotonic()
+                time.sleep(interval)
+                full = full_interval > 0 and time.monotonic() - last_full >= full_interval
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,66 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from events.ingest import IngestError, ingest, iter_records
+from events.models import Event
+from events.services import refresh_event_facets
+from events.signals import events_changed
+
+
+class Command(BaseCommand):
+    help = "KOPIS 공연 덤프(XML/JSON)를 스트리밍으로 읽어 kopis_id 기준 bulk upsert"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="덤프 파일 경로 ('-'이면 stdin)")
+        parser.add_argument("--format", choices=["auto", "xml", "json"], default="auto")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--changed-ids-out",
+            help="실제로 생성/변경된 event_id 목록을 저장할 파일 (한 줄에 하나)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        path = options["path"]
+        stream = sys.stdin.buffer if path == "-" else None
+        started = time.monotonic()
+
+        try:
+            if stream is None:
+                stream = open(path, "rb")
+        except OSError as e:
+            raise CommandError(f"파일을 열 수 없습니다: {e}")
+
+        def on_batch(event_ids):
+            # 변경된 공연만 검색 인덱스/상세 캐시/count 캐시 갱신
+            events_changed.send(sender=Event, event_ids=event_ids)
+            self.stdout.write(f"  변경 {len(event_ids)}건 upsert")
+
+        try:
+            records = iter_records(stream, options["format"])
+            stats = ingest(records, batch_size=options["batch_size"], on_batch=on_batch)
+        except (IngestError, ValueError, SyntaxError) as e:
+            # SyntaxError: XML ParseError
+            raise CommandError(f"덤프 파싱 실패: {e}")
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        # 변경이 있을 때만 facet 집계 재계산 (적재 1회당 1번)
+        if stats["changed_ids"]:
+            refresh_event_facets()
+
+        if options["changed_ids_out"]:
+            with open(options["changed_ids_out"], "w") as f:
+                f.writelines(f"{event_id}\n" for event_id in stats["changed_ids"])
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write(self.style.SUCCESS(
+            f"읽음 {stats['read']}건 / 변경 {stats['upserted']}건 / 변경 없음 {stats['unchanged']}건 / "
+            f"건너뜀 {stats['skipped']}건 "
+            f"({elapsed:.2f}s, {stats['read'] / elapsed:,.0f} rows/s)"
+        ))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from events.services import rebuild_event_calendar
+
+
+class Command(BaseCommand):
+    help = "공연 달력 월 버킷(event_calendar_months) 재생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event-id",
+            type=int,
+            action="append",
+            dest="event_ids",
+            help="특정 공연만 재생성 (여러 번 지정 가능)",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_event_calendar(options["event_ids"])
+        self.stdout.write(self.style.SUCCESS(f"달력 버킷 {count}건 생성 완료"))
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from events.services import refresh_event_search_index
+
+
+class Command(BaseCommand):
+    help = "공연 검색 인덱스(event_search_tokens) 재생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event-id",
+            type=int,
+            action="append",
+            dest="event_ids",
+            help="특정 공연만 재색인 (여러 번 지정 가능, 미지정 시 전체)",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        total = refresh_event_search_index(options["event_ids"])
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"검색 토큰 {total}개 생성 ({elapsed:.2f}s)"))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from events.services import reconcile_favorite_counts
+
+
+class Command(BaseCommand):
+    help = "events.favorite_count를 실제 bookmark 수와 비교해 보정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="불일치만 출력하고 수정하지 않음")
+
+    def handle(self, *args, **options):
+        drift = reconcile_favorite_counts(dry_run=options["dry_run"])
+        for event_id, stored, real in drift:
+            self.stdout.write(f"event_id={event_id}: {stored} -> {real}")
+
+        verb = "발견" if options["dry_run"] else "보정"
+        self.stdout.write(self.style.SUCCESS(f"불일치 {len(drift)}건 {verb}"))
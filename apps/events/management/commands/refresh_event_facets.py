@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from events.services import refresh_event_facets
+
+
+class Command(BaseCommand):
+    help = "event_list facets(area/genre/status 별 공연 수) 재계산 (status는 날짜 기준이라 하루 1회 실행 권장)"
+
+    def handle(self, *args, **options):
+        total = refresh_event_facets()
+        self.stdout.write(self.style.SUCCESS(f"facet {total}개 갱신"))
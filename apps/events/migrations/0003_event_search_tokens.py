@@ -0,0 +1,80 @@
+# Generated by Django 6.0 on 2026-10-18 15:31
+
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# 마이그레이션 시점의 토큰 규칙 고정본 (events.services의 색인 로직이 바뀌어도 이 마이그레이션은 그대로)
+## 정규화: NFKC + 소문자 + 공백 제거 / 토큰: bigram + 마지막 1글자 / 초성 bigram
+SEARCH_FIELD_WEIGHTS = {'title': 3, 'artist': 2, 'venue': 1}
+CHOSEONG_FIELD_WEIGHTS = {'title': 3, 'artist': 2, 'group_name': 2}
+
+
+def _normalize(text):
+    if not text:
+        return ''
+    s = unicodedata.normalize('NFKC', str(text)).lower()
+    return ''.join(s.split())
+
+
+def _grams(s):
+    if not s:
+        return set()
+    grams = {s[i:i + 2] for i in range(len(s) - 1)}
+    grams.add(s[-1])
+    return grams
+
+
+def _choseong(text):
+    return ''.join(
+        chr(0x1100 + (ord(c) - 0xAC00) // 588)
+        for c in _normalize(text)
+        if 0xAC00 <= ord(c) <= 0xD7A3
+    )
+
+
+def backfill_search_tokens(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventSearchToken = apps.get_model('events', 'EventSearchToken')
+
+    fields = ('event_id', 'title', 'artist', 'venue', 'group_name')
+    rows = []
+    for e in Event.objects.only(*fields).order_by('event_id').iterator(chunk_size=1000):
+        tokens = {}
+        for field, weight in SEARCH_FIELD_WEIGHTS.items():
+            for gram in _grams(_normalize(getattr(e, field))):
+                tokens[gram] = tokens.get(gram, 0) + weight
+        for field, weight in CHOSEONG_FIELD_WEIGHTS.items():
+            for gram in _grams(_choseong(getattr(e, field))):
+                tokens[gram] = tokens.get(gram, 0) + weight
+        rows.extend(EventSearchToken(event_id=e.event_id, token=t, weight=w) for t, w in tokens.items())
+        if len(rows) >= 1000:
+            EventSearchToken.objects.bulk_create(rows)
+            rows = []
+    EventSearchToken.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_group_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSearchToken',
+            fields=[
+                ('token_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('token', models.CharField(max_length=8)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('event', models.ForeignKey(db_column='event_id', on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='events.event')),
+            ],
+            options={
+                'db_table': 'event_search_tokens',
+                'constraints': [models.UniqueConstraint(fields=('token', 'event'), name='uq_event_search_token_event')],
+            },
+        ),
+        migrations.RunPython(backfill_search_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-18 15:31
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_favorite_count(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    Bookmark = apps.get_model('bookmarks', 'Bookmark')
+
+    counts = (
+        Bookmark.objects.order_by()
+        .values('event_id')
+        .annotate(c=Count('bookmark_id'))
+        .values_list('event_id', 'c')
+    )
+    for event_id, c in counts.iterator():
+        Event.objects.filter(event_id=event_id).update(favorite_count=c)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_search_tokens'),
+        ('bookmarks', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='favorite_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['favorite_count', 'update_date', 'event_id'], name='events_favorite_idx'),
+        ),
+        migrations.RunPython(backfill_favorite_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-18 15:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['group_name'], name='events_group_name_idx'),
+        ),
+    ]
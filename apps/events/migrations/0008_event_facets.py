@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_list_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventFacetCount',
+            fields=[
+                ('facet_id', models.AutoField(primary_key=True, serialize=False)),
+                ('facet', models.CharField(max_length=20)),
+                ('value', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'event_facet_counts',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['area'], name='events_area_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['genre'], name='events_genre_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='eventfacetcount',
+            constraint=models.UniqueConstraint(fields=('facet', 'value'), name='uq_event_facet_counts_facet_value'),
+        ),
+    ]
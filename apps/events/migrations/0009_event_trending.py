@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-18 15:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_event_facets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventTrendingState',
+            fields=[
+                ('state_id', models.AutoField(primary_key=True, serialize=False)),
+                ('last_bookmark_id', models.BigIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'event_trending_state',
+            },
+        ),
+        migrations.CreateModel(
+            name='EventTrending',
+            fields=[
+                ('event', models.OneToOneField(db_column='event_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trending', serialize=False, to='events.event')),
+                ('score', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'event_trending',
+                'indexes': [models.Index(fields=['score', 'event'], name='event_trending_score_idx')],
+            },
+        ),
+    ]
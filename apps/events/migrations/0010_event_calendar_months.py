@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-18 15:43
+
+import datetime
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_calendar_months(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventCalendarMonth = apps.get_model('events', 'EventCalendarMonth')
+
+    rows = []
+    for event_id, start_date, end_date in Event.objects.values_list('event_id', 'start_date', 'end_date').iterator():
+        month = start_date.replace(day=1)
+        last = max(start_date, end_date or start_date).replace(day=1)
+        while month <= last:
+            rows.append(EventCalendarMonth(month=month, event_id=event_id))
+            month = (month.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+        if len(rows) >= 1000:
+            EventCalendarMonth.objects.bulk_create(rows)
+            rows = []
+    EventCalendarMonth.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_event_trending'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventCalendarMonth',
+            fields=[
+                ('calendar_month_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('event', models.ForeignKey(db_column='event_id', on_delete=django.db.models.deletion.CASCADE, related_name='calendar_months', to='events.event')),
+            ],
+            options={
+                'db_table': 'event_calendar_months',
+                'constraints': [models.UniqueConstraint(fields=('month', 'event'), name='uq_event_calendar_month_event')],
+            },
+        ),
+        migrations.RunPython(backfill_calendar_months, migrations.RunPython.noop),
+    ]
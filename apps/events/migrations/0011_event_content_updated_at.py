@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-18 16:15
+
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def backfill_content_updated_at(apps, schema_editor):
+    # 기존 행은 변경 이력이 없으므로 update_date (없으면 배포 시각)
+    Event = apps.get_model('events', 'Event')
+    Event.objects.filter(content_updated_at__isnull=True).update(
+        content_updated_at=Coalesce('update_date', Value(timezone.now())),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_event_calendar_months'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='content_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_content_updated_at, migrations.RunPython.noop),
+    ]
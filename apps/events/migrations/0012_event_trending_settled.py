@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 16:18
+## 트렌딩 워터마크 bookmark_id -> created_at (settled_until이 비어 있으면 다음 계산은 --full)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_event_content_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='eventtrendingstate',
+            name='last_bookmark_id',
+        ),
+        migrations.AddField(
+            model_name='eventtrending',
+            name='settled_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='eventtrendingstate',
+            name='settled_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -20,9 +20,33 @@ class Event(models.Model):
     genre = models.CharField(max_length=255, blank=True, null=True)
     group_name = models.CharField(max_length=100, null=True)
 
+    # 즐겨찾기(bookmark) 수 비정규화 컬럼
+    ## toggle_bookmark에서 F()로 증감, 불일치는 reconcile_favorite_counts 커맨드로 보정
+    favorite_count = models.IntegerField(default=0)
+
+    # 표시 필드(services.CONTENT_HASH_FIELDS) 해시: 재적재 시 변경 없는 행 건너뛰기용
+    ## ORM 저장 시 pre_save에서 계산, NULL이면 다음 적재 때 변경으로 간주
+    content_hash = models.CharField(max_length=40, blank=True, null=True)
+    # content_hash가 바뀐 시각 (공연 상세 Last-Modified용, update_date는 ORM/admin 수정에 안 바뀜)
+    content_updated_at = models.DateTimeField(blank=True, null=True)
+
     class Meta:
         managed = True
         db_table = 'events'
+        indexes = [
+            # event_list 정렬별 인덱스 (ORDER BY ... LIMIT 를 filesort 없이 인덱스 순서로)
+            ## 목록 정렬을 바꾸면 EventListQueryPlanTests도 같이 확인
+            models.Index(fields=["start_date", "event_id"], name="events_latest_idx"),
+            models.Index(fields=["update_date", "event_id"], name="events_update_idx"),
+            models.Index(fields=["title", "event_id"], name="events_name_idx"),
+            # sort=favorite 정렬용
+            models.Index(fields=["favorite_count", "update_date", "event_id"], name="events_favorite_idx"),
+            # 아티스트 별칭 검색 (group_name IN (...))
+            models.Index(fields=["group_name"], name="events_group_name_idx"),
+            # 필터 (area/genre)
+            models.Index(fields=["area"], name="events_area_idx"),
+            models.Index(fields=["genre"], name="events_genre_idx"),
+        ]
 
 class ArtistMapping(models.Model):
     mapping_id = models.AutoField(primary_key=True)
@@ -32,4 +56,105 @@ class ArtistMapping(models.Model):
 
     class Meta:
         managed = True
-        db_table = 'artist_mapping'
\ No newline at end of file
+        db_table = 'artist_mapping'
+
+# 검색 인덱스: title/artist/venue 정규화 문자열의 bigram 토큰 (event_list search 전용)
+## 갱신: rebuild_event_search_index 커맨드 + Event 저장 시 signals
+class EventSearchToken(models.Model):
+    token_id = models.BigAutoField(primary_key=True)
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        db_column="event_id",
+        related_name="search_tokens",
+    )
+    token = models.CharField(max_length=8)
+    # 필드별 가중치 합 (title > artist > venue), 랭킹용
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        db_table = "event_search_tokens"
+        constraints = [
+            models.UniqueConstraint(fields=["token", "event"], name="uq_event_search_token_event"),
+        ]
+
+    def __str__(self):
+        return f"EventSearchToken({self.token}) event_id={self.event_id}"
+
+
+
+# event_list facets=1 응답용 집계 (area/genre/status 별 공연 수)
+## 요청마다 GROUP BY 하지 않고 적재 후/주기적으로 refresh_event_facets로 재계산
+class EventFacetCount(models.Model):
+    facet_id = models.AutoField(primary_key=True)
+    # area | genre | status
+    facet = models.CharField(max_length=20)
+    value = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "event_facet_counts"
+        constraints = [
+            models.UniqueConstraint(fields=["facet", "value"], name="uq_event_facet_counts_facet_value"),
+        ]
+
+    def __str__(self):
+        return f"EventFacetCount({self.facet}={self.value}) {self.count}"
+
+
+# sort=trending 랭킹 (bookmark 증가 속도, 시간 감쇠 점수)
+## compute_trending_events 커맨드가 주기적으로 갱신 (마지막 bookmark_id 워터마크 이후만 반영)
+class EventTrending(models.Model):
+    event = models.OneToOneField(
+        Event,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        db_column="event_id",
+        related_name="trending",
+    )
+    score = models.FloatField(default=0)
+    # settled_until 이전 bookmark만의 점수 (score = settled_score + 최근 구간)
+    settled_score = models.FloatField(default=0)
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "event_trending"
+        indexes = [
+            models.Index(fields=["score", "event"], name="event_trending_score_idx"),
+        ]
+
+    def __str__(self):
+        return f"EventTrending(event_id={self.event_id}) {self.score:.3f}"
+
+
+# 트렌딩 계산 상태 (단일 행): 확정 반영한 bookmark created_at 워터마크 / 계산 시각
+class EventTrendingState(models.Model):
+    state_id = models.AutoField(primary_key=True)
+    settled_until = models.DateTimeField(blank=True, null=True)
+    computed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = "event_trending_state"
+
+
+# 월 달력 버킷: 공연 기간(start_date~end_date)이 걸치는 월마다 1행
+## month: 해당 월 1일 / /api/events/calendar 조회 시 (month) 인덱스로 그 달 공연만 읽음
+class EventCalendarMonth(models.Model):
+    calendar_month_id = models.BigAutoField(primary_key=True)
+    month = models.DateField()
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        db_column="event_id",
+        related_name="calendar_months",
+    )
+
+    class Meta:
+        db_table = "event_calendar_months"
+        constraints = [
+            models.UniqueConstraint(fields=["month", "event"], name="uq_event_calendar_month_event"),
+        ]
+
+    def __str__(self):
+        return f"EventCalendarMonth({self.month:%Y-%m}, event_id={self.event_id})"
@@ -1 +1,866 @@
-# 설명: 로직/쿼리/가공 로직 분리용(페이징, 정렬, 필터 파라미터 처리 등)
\ No newline at end of file
+# 설명: 로직/쿼리/가공 로직 분리용(페이징, 정렬, 필터 파라미터 처리 등)
+import bisect
+import datetime
+import hashlib
+import heapq
+import json
+import threading
+import time
+import unicodedata
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from common.pagination import invalidate_counts
+from .models import (
+    ArtistMapping,
+    Event,
+    EventCalendarMonth,
+    EventFacetCount,
+    EventSearchToken,
+    EventTrending,
+    EventTrendingState,
+)
+
+
+# ---------------------------------------------------------------------------
+# 검색 인덱스 (bigram 역색인)
+# - icontains 3개(title/artist/venue) 풀스캔 대신 event_search_tokens 테이블 조회
+# - 정규화: NFKC + 소문자 + 공백 제거 ("뮤지컬 시카고" == "뮤지컬시카고")
+# - 토큰: 연속 2글자(bigram) + 마지막 1글자 (1글자 검색어 대응)
+# ---------------------------------------------------------------------------
+
+SEARCH_FIELD_WEIGHTS = {
+    "title": 3,
+    "artist": 2,
+    "venue": 1,
+}
+
+_TOKEN_BATCH_SIZE = 1000
+
+
+def normalize_search_text(text) -> str:
+    if not text:
+        return ""
+    s = unicodedata.normalize("NFKC", str(text)).lower()
+    return "".join(s.split())
+
+
+def _text_grams(text) -> set:
+    s = normalize_search_text(text)
+    if not s:
+        return set()
+    grams = {s[i:i + 2] for i in range(len(s) - 1)}
+    grams.add(s[-1])
+    return grams
+
+
+# 초성 검색 ("ㅅㅋㄱ" -> 시카고)
+## 한글 음절의 초성만 이어 붙인 문자열의 bigram을 같은 토큰 테이블에 저장 (색인 시 1회 분해)
+## NFKC 정규화 시 호환 자모 "ㅅ"(U+3145)는 초성 자모 "ᄉ"(U+1109)로 바뀌므로 초성 자모로 저장
+CHOSEONG_FIELD_WEIGHTS = {
+    "title": 3,
+    "artist": 2,
+    "group_name": 2,
+}
+
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_CHOSEONG_FIRST = 0x1100
+# 음절 = 초성 * 588 + 중성 * 28 + 종성
+_CHOSEONG_STEP = 588
+
+
+def to_choseong(text) -> str:
+    """
+    "뮤지컬 시카고" -> "ᄆᄌᄏᄉᄏᄀ" (한글 음절 외 문자는 제외)
+    """
+    return "".join(
+        chr(_CHOSEONG_FIRST + (ord(c) - _HANGUL_FIRST) // _CHOSEONG_STEP)
+        for c in normalize_search_text(text)
+        if _HANGUL_FIRST <= ord(c) <= _HANGUL_LAST
+    )
+
+
+def _event_tokens(e) -> dict:
+    """
+    Event 1건 -> {token: weight}
+    같은 토큰이 여러 필드에 있으면 가중치 합산 (초성 토큰 포함)
+    """
+    tokens = {}
+    for field, weight in SEARCH_FIELD_WEIGHTS.items():
+        for gram in _text_grams(getattr(e, field, None)):
+            tokens[gram] = tokens.get(gram, 0) + weight
+    for field, weight in CHOSEONG_FIELD_WEIGHTS.items():
+        for gram in _text_grams(to_choseong(getattr(e, field, None))):
+            tokens[gram] = tokens.get(gram, 0) + weight
+    return tokens
+
+
+def _build_token_rows(events) -> list:
+    # (event_id, token, weight) 튜플 목록
+    rows = []
+    for e in events:
+        for token, weight in _event_tokens(e).items():
+            rows.append((e.event_id, token, weight))
+    return rows
+
+
+def _insert_token_rows(rows) -> None:
+    """
+    토큰 행 대량 INSERT
+    - 공연 1건당 수십 개라 모델 객체(bulk_create) 생성 비용이 커서 executemany 사용
+    """
+    if not rows:
+        return
+    table = connection.ops.quote_name(EventSearchToken._meta.db_table)
+    sql = f"INSERT INTO {table} (event_id, token, weight) VALUES (%s, %s, %s)"
+    with connection.cursor() as cursor:
+        for i in range(0, len(rows), _TOKEN_BATCH_SIZE):
+            cursor.executemany(sql, rows[i:i + _TOKEN_BATCH_SIZE])
+
+
+def index_events(events) -> int:
+    """
+    주어진 Event 객체들의 검색 토큰을 교체 (삭제 후 재생성)
+    - 저장 직후(signals) / 적재 후 호출
+    """
+    events = list(events)
+    if not events:
+        return 0
+
+    rows = _build_token_rows(events)
+    with transaction.atomic():
+        EventSearchToken.objects.filter(event_id__in=[e.event_id for e in events]).delete()
+        _insert_token_rows(rows)
+    return len(rows)
+
+
+def refresh_event_search_index(event_ids=None) -> int:
+    """
+    event_ids 지정 시 해당 공연만, None이면 전체 재색인
+    """
+    fields = tuple(dict.fromkeys(("event_id", *SEARCH_FIELD_WEIGHTS, *CHOSEONG_FIELD_WEIGHTS)))
+    qs = Event.objects.only(*fields).order_by("event_id")
+
+    if event_ids is not None:
+        ids = list(event_ids)
+        total = 0
+        for i in range(0, len(ids), _TOKEN_BATCH_SIZE):
+            total += index_events(qs.filter(event_id__in=ids[i:i + _TOKEN_BATCH_SIZE]))
+        # 검색 결과가 바뀌므로 캐시된 검색어별 total_count 무효화
+        invalidate_counts("events")
+        return total
+
+    total = 0
+    with transaction.atomic():
+        EventSearchToken.objects.all().delete()
+        batch = []
+        for e in qs.iterator(chunk_size=_TOKEN_BATCH_SIZE):
+            batch.append(e)
+            if len(batch) >= _TOKEN_BATCH_SIZE:
+                rows = _build_token_rows(batch)
+                _insert_token_rows(rows)
+                total += len(rows)
+                batch = []
+        if batch:
+            rows = _build_token_rows(batch)
+            _insert_token_rows(rows)
+            total += len(rows)
+    invalidate_counts("events")
+    return total
+
+
+def search_match_queryset(search: str):
+    """
+    검색어 -> (event_id, score) 집계 QuerySet, 매칭 없음이면 None
+    - 2글자 이상: 검색어의 모든 bigram을 포함하는 공연만 (hits == len(grams))
+    - 1글자: 해당 글자로 시작하는 토큰 (토큰 인덱스 prefix 조회)
+    - 초성만 입력("ㅅㅋㄱ")해도 같은 방식 (초성 토큰과 매칭)
+    """
+    s = normalize_search_text(search)
+    if not s:
+        return None
+
+    if len(s) == 1:
+        return (
+            EventSearchToken.objects
+            .filter(Q(token=s) | Q(token__startswith=s))
+            .values("event_id")
+            .annotate(score=Sum("weight"))
+        )
+
+    grams = {s[i:i + 2] for i in range(len(s) - 1)}
+    return (
+        EventSearchToken.objects
+        .filter(token__in=grams)
+        .values("event_id")
+        .annotate(hits=Count("token"), score=Sum("weight"))
+        .filter(hits=len(grams))
+    )
+
+
+def _is_choseong_text(s: str) -> bool:
+    return all(_CHOSEONG_FIRST <= ord(c) <= _CHOSEONG_FIRST + 18 for c in s)
+
+
+def _substring_match_condition(match, s: str) -> Q:
+    """
+    토큰 매칭 후보 중 실제로 한 필드 안에 검색어(정규화)가 연속으로 있는 공연만
+    - 토큰은 필드 구분 없이 공연 단위로 모여 있어 "시카" (제목) + "카고" (장소)도 후보가 됨
+    - 3글자 미만은 bigram 하나/1글자 매칭이라 후보 = 결과
+    - 색인과 같은 normalize_search_text(NFKC + 소문자 + 공백 전부 제거)로 비교해야 해서
+      후보만 읽어 Python에서 확인 (DB 함수로는 NFKC/탭/개행 처리가 색인과 달라짐)
+    """
+    if len(s) < 3:
+        return Q()
+
+    if _is_choseong_text(s):
+        # 초성 문자열은 DB 컬럼이 없으므로 초성 필드 기준
+        fields = tuple(CHOSEONG_FIELD_WEIGHTS)
+        normalize = to_choseong
+    else:
+        fields = tuple(SEARCH_FIELD_WEIGHTS)
+        normalize = normalize_search_text
+
+    candidates = Event.objects.filter(event_id__in=match.values("event_id")).only("event_id", *fields)
+    ids = [
+        e.event_id for e in candidates.iterator()
+        if any(s in normalize(getattr(e, f)) for f in fields)
+    ]
+    return Q(event_id__in=ids)
+
+
+# 아티스트 별칭(ArtistMapping) 일치 시 관련도 가산점
+ALIAS_MATCH_WEIGHT = 10
+
+
+def apply_event_search(qs, search: str):
+    """
+    Event QuerySet에 검색 필터 + 관련도(search_score) annotate
+    - 토큰 인덱스 매칭(+ 필드 내 부분 일치 확인) OR 아티스트 별칭 매칭(group_name/artist, 조인 없이 IN 목록)
+    """
+    match = search_match_queryset(search)
+    stage_names = artist_resolver.stage_names_for(search)
+    raw_names = [raw for stage in stage_names for raw in artist_resolver.aliases(stage)]
+
+    cond = Q()
+    if match is not None:
+        cond |= Q(event_id__in=match.values("event_id")) & _substring_match_condition(
+            match, normalize_search_text(search),
+        )
+    if stage_names:
+        cond |= Q(group_name__in=stage_names) | Q(artist__in=raw_names)
+    if not cond:
+        return qs.none()
+
+    score = Value(0)
+    if match is not None:
+        score = Coalesce(
+            Subquery(match.filter(event_id=OuterRef("event_id")).values("score")[:1]), Value(0),
+        )
+    if stage_names:
+        score = score + Case(
+            When(Q(group_name__in=stage_names) | Q(artist__in=raw_names), then=Value(ALIAS_MATCH_WEIGHT)),
+            default=Value(0),
+        )
+    return qs.filter(cond).annotate(search_score=score)
+
+
+# ---------------------------------------------------------------------------
+# 아티스트 매핑 resolver (ArtistMapping 전체를 프로세스 메모리에 dict로 보관)
+# - raw_name -> stage_name / stage_name -> [raw_name, ...]
+# - ArtistMapping 저장/삭제 시 캐시의 버전 카운터 증가 -> 각 프로세스가 다음 조회 때 재적재
+# - 버전 카운터를 못 보는 경우(워커별 locmem 캐시, bulk 수정 등)에도 _ARTIST_MAPPING_MAX_AGE마다 재적재
+# ---------------------------------------------------------------------------
+
+ARTIST_MAPPING_VERSION_KEY = "artist_mapping:version"
+
+# 버전 확인 주기(초): 공유 캐시 조회를 요청마다 하지 않도록
+_VERSION_CHECK_INTERVAL = 5
+# 버전 카운터와 무관하게 재적재하는 주기(초)
+## 버전 카운터는 CACHES(default)에 있으므로 워커 간 공유 캐시(redis/memcached)가 필요
+## locmem(워커별 캐시)이면 다른 워커의 변경은 이 주기 안에만 반영됨
+_ARTIST_MAPPING_MAX_AGE = 300
+
+
+def _shared_version(key: str):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def _bump_shared_version(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+        cache.incr(key)
+
+
+def bump_artist_mapping_version() -> None:
+    _bump_shared_version(ARTIST_MAPPING_VERSION_KEY)
+    # 같은 프로세스는 즉시 반영
+    artist_resolver.invalidate()
+
+
+class ArtistResolver:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+        self._raw_to_stage = {}
+        self._stage_to_raws = {}
+        self._stages = {}
+
+    def invalidate(self) -> None:
+        self._checked_at = 0.0
+        self._version = None
+
+    def _load(self) -> None:
+        raw_to_stage, stage_to_raws, stages = {}, {}, {}
+        for raw, stage in ArtistMapping.objects.values_list("raw_name", "stage_name").iterator():
+            key = normalize_search_text(raw)
+            stage_key = normalize_search_text(stage)
+            raw_to_stage[key] = stage
+            stages[stage_key] = stage
+            stage_to_raws.setdefault(stage_key, []).append(raw)
+        self._raw_to_stage, self._stage_to_raws, self._stages = raw_to_stage, stage_to_raws, stages
+
+    def _ensure_loaded(self) -> None:
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < _VERSION_CHECK_INTERVAL:
+            return
+        with self._lock:
+            if self._version is not None and now - self._checked_at < _VERSION_CHECK_INTERVAL:
+                return
+            version = _shared_version(ARTIST_MAPPING_VERSION_KEY)
+            if version != self._version or now - self._loaded_at >= _ARTIST_MAPPING_MAX_AGE:
+                self._load()
+                self._version = version
+                self._loaded_at = now
+            self._checked_at = now
+
+    def resolve(self, name):
+        if not name:
+            return None
+        self._ensure_loaded()
+        return self._raw_to_stage.get(normalize_search_text(name))
+
+    def resolve_many(self, names) -> dict:
+        """
+        names -> {name: stage_name} (매핑 없는 이름은 제외)
+        """
+        self._ensure_loaded()
+        result = {}
+        for name in names:
+            stage = self._raw_to_stage.get(normalize_search_text(name)) if name else None
+            if stage:
+                result[name] = stage
+        return result
+
+    def aliases(self, stage_name) -> list:
+        # stage_name -> 매핑된 raw_name 전체
+        self._ensure_loaded()
+        return list(self._stage_to_raws.get(normalize_search_text(stage_name), []))
+
+    def stage_names_for(self, text) -> set:
+        """
+        검색어가 raw_name 또는 stage_name과 일치하면 해당 stage_name 집합
+        """
+        key = normalize_search_text(text)
+        if not key:
+            return set()
+        self._ensure_loaded()
+        names = set()
+        if key in self._raw_to_stage:
+            names.add(self._raw_to_stage[key])
+        if key in self._stages:
+            names.add(self._stages[key])
+        return names
+
+
+artist_resolver = ArtistResolver()
+
+
+# ---------------------------------------------------------------------------
+# 변경 감지용 content_hash
+# - update_date/favorite_count 등 표시 내용이 아닌 값은 제외
+# ---------------------------------------------------------------------------
+
+CONTENT_HASH_FIELDS = (
+    "title", "artist", "start_date", "end_date", "venue", "area", "age", "poster",
+    "time", "price", "relate_url", "host", "genre", "group_name",
+)
+
+
+def event_content_hash(values) -> str:
+    """
+    values: Event 객체 또는 필드 dict
+    """
+    get = values.get if isinstance(values, dict) else (lambda name: getattr(values, name, None))
+    payload = []
+    for name in CONTENT_HASH_FIELDS:
+        v = get(name)
+        payload.append(v.isoformat() if hasattr(v, "isoformat") else v)
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# 즐겨찾기 수(favorite_count) 정합성 보정
+# - 실제 bookmark 집계와 비교해 다른 행만 갱신
+# ---------------------------------------------------------------------------
+
+def reconcile_favorite_counts(dry_run: bool = False, batch_size: int = 1000) -> list:
+    """
+    반환: [(event_id, 저장된 값, 실제 값), ...] 불일치 목록
+    """
+    from bookmarks.models import Bookmark
+
+    actual = dict(
+        Bookmark.objects.order_by()
+        .values("event_id")
+        .annotate(c=Count("bookmark_id"))
+        .values_list("event_id", "c")
+    )
+
+    drift = []
+    stale = []
+    qs = Event.objects.only("event_id", "favorite_count").order_by("event_id")
+    for e in qs.iterator(chunk_size=batch_size):
+        real = actual.get(e.event_id, 0)
+        if e.favorite_count != real:
+            drift.append((e.event_id, e.favorite_count, real))
+            e.favorite_count = real
+            stale.append(e)
+
+    if stale and not dry_run:
+        with transaction.atomic():
+            Event.objects.bulk_update(stale, ["favorite_count"], batch_size=batch_size)
+    return drift
+
+
+# ---------------------------------------------------------------------------
+# 공연 상세(event_detail) 응답 캐시
+# ---------------------------------------------------------------------------
+
+def event_detail_cache_key(event_id: int) -> str:
+    return f"event_detail:{event_id}"
+
+
+def invalidate_event_details(event_ids) -> None:
+    cache.delete_many([event_detail_cache_key(i) for i in event_ids])
+
+
+# ---------------------------------------------------------------------------
+# 필터 / facet 집계
+# - status: 오늘(Asia/Seoul) 기준 ongoing(진행중) / upcoming(예정) / ended(종료)
+# - facet 집계는 event_facet_counts 테이블에 저장 (적재 후 + 하루 1회 refresh 권장)
+# ---------------------------------------------------------------------------
+
+EVENT_STATUSES = ("ongoing", "upcoming", "ended")
+FACET_FIELDS = ("area", "genre")
+
+
+def event_status_q(status: str, today=None) -> Q:
+    today = today or timezone.localdate()
+    if status == "ongoing":
+        return Q(start_date__lte=today, end_date__gte=today)
+    if status == "upcoming":
+        return Q(start_date__gt=today)
+    if status == "ended":
+        return Q(end_date__lt=today)
+    raise ValueError(f"알 수 없는 status: {status}")
+
+
+def apply_event_filters(qs, area=None, genre=None, status=None, age=None):
+    if area:
+        qs = qs.filter(area=area)
+    if genre:
+        qs = qs.filter(genre=genre)
+    if age:
+        qs = qs.filter(age=age)
+    if status:
+        qs = qs.filter(event_status_q(status))
+    return qs
+
+
+def refresh_event_facets() -> int:
+    """
+    area/genre/status 별 공연 수 재계산 (테이블 전체 교체)
+    """
+    now = timezone.now()
+    today = timezone.localdate()
+    rows = []
+
+    for field in FACET_FIELDS:
+        counts = (
+            Event.objects.exclude(**{f"{field}__isnull": True}).exclude(**{field: ""})
+            .order_by().values_list(field).annotate(c=Count("event_id"))
+        )
+        for value, c in counts:
+            rows.append(EventFacetCount(facet=field, value=value, count=c, refreshed_at=now))
+
+    status_counts = Event.objects.aggregate(**{
+        status: Count("event_id", filter=event_status_q(status, today)) for status in EVENT_STATUSES
+    })
+    for status in EVENT_STATUSES:
+        rows.append(EventFacetCount(facet="status", value=status, count=status_counts[status] or 0, refreshed_at=now))
+
+    with transaction.atomic():
+        EventFacetCount.objects.all().delete()
+        EventFacetCount.objects.bulk_create(rows)
+    return len(rows)
+
+
+def get_event_facets() -> dict:
+    facets = {field: [] for field in FACET_FIELDS}
+    facets["status"] = {status: 0 for status in EVENT_STATUSES}
+    refreshed_at = None
+
+    for f in EventFacetCount.objects.order_by("facet", "-count", "value"):
+        if f.facet == "status":
+            facets["status"][f.value] = f.count
+        elif f.facet in facets:
+            facets[f.facet].append({"value": f.value, "count": f.count})
+        refreshed_at = f.refreshed_at
+
+    facets["refreshed_at"] = refreshed_at.isoformat() if refreshed_at else None
+    return facets
+
+
+# ---------------------------------------------------------------------------
+# 트렌딩 랭킹 (sort=trending)
+# - score = Σ 0.5 ^ (bookmark 경과시간 / 반감기)   (최근 북마크일수록 가중치 큼)
+# - 워터마크는 bookmark created_at (bookmark_id는 커밋 전에 할당되어 늦게 커밋된 행을 건너뛸 수 있음)
+#     - settled_score: settled_until 이전 bookmark 합 -> 매 실행 경과시간만큼 감쇠 곱 + 새로 확정된 구간만 가산
+#     - 최근 overlap_minutes 구간은 확정하지 않고 매 실행 다시 집계 (늦게 커밋된 행 포함, 중복 가산 없음)
+#     - score = settled_score + 최근 구간 합
+# - 확정 구간의 북마크 취소는 증분에 반영되지 않으므로 --full 재계산(하루 1회 등)으로 보정
+# ---------------------------------------------------------------------------
+
+# 이 값보다 작아진 점수는 랭킹에서 제거
+TRENDING_MIN_SCORE = 0.01
+
+
+def _decay(age: datetime.timedelta, half_life_hours: float) -> float:
+    hours = max(age.total_seconds(), 0) / 3600
+    return 0.5 ** (hours / half_life_hours)
+
+
+def _trending_gain(bookmarks, now, half_life_hours: float) -> dict:
+    # {event_id: Σ 감쇠 가중치}
+    gained = {}
+    rows = bookmarks.order_by().values_list("event_id", "created_at")
+    for event_id, created_at in rows.iterator(chunk_size=2000):
+        gained[event_id] = gained.get(event_id, 0) + _decay(now - created_at, half_life_hours)
+    return gained
+
+
+def compute_trending_events(
+    half_life_hours: float = 72, window_days: int = 14, full: bool = False, overlap_minutes: float = 10,
+) -> dict:
+    from bookmarks.models import Bookmark
+
+    now = timezone.now()
+    settled_until = now - datetime.timedelta(minutes=overlap_minutes)
+    with transaction.atomic():
+        state, _ = EventTrendingState.objects.select_for_update().get_or_create(state_id=1)
+        full = full or state.computed_at is None or state.settled_until is None
+
+        if full:
+            # 윈도우 내 bookmark로 처음부터 계산
+            EventTrending.objects.all().delete()
+            settling = Bookmark.objects.filter(
+                created_at__gte=now - datetime.timedelta(days=window_days), created_at__lte=settled_until,
+            )
+        else:
+            settled_until = max(settled_until, state.settled_until)
+            decay = _decay(now - state.computed_at, half_life_hours)
+            EventTrending.objects.update(
+                settled_score=F("settled_score") * decay, score=F("settled_score") * decay, updated_at=now,
+            )
+            settling = Bookmark.objects.filter(created_at__gt=state.settled_until, created_at__lte=settled_until)
+
+        settled_gain = _trending_gain(settling, now, half_life_hours)
+        recent_gain = _trending_gain(Bookmark.objects.filter(created_at__gt=settled_until), now, half_life_hours)
+
+        touched = settled_gain.keys() | recent_gain.keys()
+        existing = EventTrending.objects.in_bulk(list(touched))
+        to_update, to_create = [], []
+        for event_id in touched:
+            row = existing.get(event_id)
+            if row is None:
+                row = EventTrending(event_id=event_id, settled_score=0)
+                to_create.append(row)
+            else:
+                to_update.append(row)
+            row.settled_score += settled_gain.get(event_id, 0)
+            row.score = row.settled_score + recent_gain.get(event_id, 0)
+            row.updated_at = now
+        EventTrending.objects.bulk_update(to_update, ["settled_score", "score", "updated_at"], batch_size=1000)
+        EventTrending.objects.bulk_create(to_create, batch_size=1000)
+        EventTrending.objects.filter(score__lt=TRENDING_MIN_SCORE).delete()
+
+        state.settled_until = settled_until
+        state.computed_at = now
+        state.save()
+
+    # sort=trending 목록의 total_count(랭킹에 있는 공연 수)가 바뀜
+    invalidate_counts("events")
+    return {"full": full, "events": len(touched), "settled_until": settled_until}
+
+
+# ---------------------------------------------------------------------------
+# 월 달력 (/api/events/calendar)
+# - event_calendar_months: 공연이 걸치는 월 버킷 (공연 변경 시 해당 공연만 재생성)
+# - 응답 본문은 월별 캐시, 버킷이 바뀐 월(이전 기간 + 새 기간)만 무효화
+# ---------------------------------------------------------------------------
+
+def event_calendar_cache_key(month: datetime.date) -> str:
+    return f"event_calendar:{month:%Y-%m}"
+
+
+def _month_start(d: datetime.date) -> datetime.date:
+    return d.replace(day=1)
+
+
+def _next_month(d: datetime.date) -> datetime.date:
+    return (d.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+
+
+def event_months(start_date, end_date) -> list:
+    """
+    공연 기간이 걸치는 월(1일) 목록 (end_date < start_date면 시작 월만)
+    """
+    month = _month_start(start_date)
+    last = _month_start(max(start_date, end_date or start_date))
+    months = []
+    while month <= last:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+
+def invalidate_event_calendar(months) -> None:
+    cache.delete_many([event_calendar_cache_key(m) for m in set(months)])
+
+
+def rebuild_event_calendar(event_ids=None) -> int:
+    """
+    event_ids 공연의 월 버킷 재생성 (None이면 전체)
+    반환: 생성한 버킷 행 수
+    """
+    old = EventCalendarMonth.objects.all()
+    events = Event.objects.all()
+    if event_ids is not None:
+        event_ids = list(event_ids)
+        old = old.filter(event_id__in=event_ids)
+        events = events.filter(event_id__in=event_ids)
+
+    touched = set(old.order_by().values_list("month", flat=True).distinct())
+    rows = []
+    for event_id, start_date, end_date in events.values_list("event_id", "start_date", "end_date").iterator():
+        for month in event_months(start_date, end_date):
+            rows.append(EventCalendarMonth(month=month, event_id=event_id))
+            touched.add(month)
+
+    with transaction.atomic():
+        old.delete()
+        EventCalendarMonth.objects.bulk_create(rows, batch_size=1000)
+    # 커밋 후 무효화 (커밋 전 요청이 이전 버킷으로 캐시를 다시 채우는 것 방지)
+    transaction.on_commit(lambda: invalidate_event_calendar(touched))
+    return len(rows)
+
+
+def get_event_calendar(year: int, month: int) -> dict:
+    """
+    {"year", "month", "events": [{event_id, title, poster}], "days": {"1": [event_id, ...], ...}}
+    - 공연 정보는 events에 한 번만, days는 날짜별 event_id 목록 (기간이 그 날을 포함)
+    """
+    first = datetime.date(year, month, 1)
+    key = event_calendar_cache_key(first)
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    last = _next_month(first) - datetime.timedelta(days=1)
+    rows = (
+        Event.objects.filter(calendar_months__month=first)
+        .order_by("start_date", "event_id")
+        .values_list("event_id", "title", "poster", "start_date", "end_date")
+    )
+
+    events = []
+    days = {str(d): [] for d in range(1, last.day + 1)}
+    for event_id, title, poster, start_date, end_date in rows:
+        events.append({"event_id": event_id, "title": title, "poster": poster})
+        begin = max(start_date, first).day
+        end = min(max(end_date or start_date, start_date), last).day
+        for d in range(begin, end + 1):
+            days[str(d)].append(event_id)
+
+    data = {"year": year, "month": month, "events": events, "days": days}
+    cache.set(key, data, timeout=settings.EVENT_CALENDAR_CACHE_TTL)
+    return data
+
+
+# ---------------------------------------------------------------------------
+# 자동완성 (/api/events/suggest)
+# - 공연 제목(단어 시작 위치별 접미사 포함) / artist / group_name / ArtistMapping.stage_name을
+#   정규화 키(+ 초성 키)로 정렬한 배열을 프로세스 메모리에 보관 -> bisect로 접두사 범위 조회 (DB 조회 없음)
+# - 가중치: favorite_count (아티스트는 출연 공연 합)
+# - 1~3글자 접두사는 적재 시 상위 결과를 미리 계산 (범위가 넓어 정렬 비용이 큼)
+# - 공연/매핑 변경 시 버전 증가 -> 각 프로세스가 다음 조회 때 재적재, 인기도 반영을 위해 주기적으로도 재적재
+# ---------------------------------------------------------------------------
+
+EVENT_SUGGEST_VERSION_KEY = "event_suggest:version"
+
+SUGGEST_MAX_LIMIT = 20
+_SUGGEST_MAX_AGE = 600
+# 이 길이까지의 접두사는 상위 결과를 적재 시 미리 계산
+## 더 긴 접두사는 일치 범위가 작으므로 범위 전체를 가중치로 선별 (앞부분만 자르면 인기 항목 누락)
+_SUGGEST_PRECOMPUTED_PREFIX_LEN = 3
+
+
+def bump_event_suggest_version() -> None:
+    _bump_shared_version(EVENT_SUGGEST_VERSION_KEY)
+    event_suggester.invalidate()
+
+
+def _title_keys(title) -> set:
+    """
+    "뮤지컬 시카고" -> {"뮤지컬시카고", "시카고", "ᄆᄌᄏᄉᄏᄀ", "ᄉᄏᄀ"} (단어 중간부터/초성 입력도 매칭)
+    """
+    words = str(title or "").split()
+    keys = set()
+    for i in range(len(words)):
+        suffix = "".join(words[i:])
+        keys.update((normalize_search_text(suffix), to_choseong(suffix)))
+    keys.discard("")
+    return keys
+
+
+def _split_artists(artist) -> list:
+    return [name.strip() for name in str(artist or "").split(",") if name.strip()]
+
+
+def _best_suggestions(items, limit: int) -> list:
+    # items: (-weight, label, kind, ident) -> 가중치 높은 순, 같은 대상 중복 제거
+    # 상위 일부만 뽑아 보고 중복 제거 후 부족하면 전체 정렬
+    candidates = heapq.nsmallest(limit * 2, items)
+    if len({(item[2], item[3]) for item in candidates}) < limit:
+        candidates = sorted(items)
+
+    result, seen = [], set()
+    for item in candidates:
+        if (item[2], item[3]) in seen:
+            continue
+        seen.add((item[2], item[3]))
+        result.append(item)
+        if len(result) >= limit:
+            break
+    return result
+
+
+class EventSuggester:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+        # (정렬된 키, 키별 항목, 짧은 접두사별 상위 목록) 한 묶음: 재적재 시 한 번에 교체
+        self._index = ([], [], {})
+
+    def invalidate(self) -> None:
+        self._checked_at = 0.0
+        self._version = None
+
+    def _load(self) -> None:
+        entries = []
+        artists = {}  # 정규화 키 -> [표시 이름, 가중치]
+
+        def add_artist(name, weight):
+            key = normalize_search_text(name)
+            if key:
+                artists.setdefault(key, [name, 0])[1] += weight
+
+        rows = Event.objects.values_list("event_id", "title", "artist", "group_name", "favorite_count")
+        for event_id, title, artist, group_name, favorite_count in rows.iterator(chunk_size=2000):
+            weight = favorite_count or 0
+            for key in _title_keys(title):
+                entries.append((key, (-weight, title, "event", event_id)))
+            for name in {*_split_artists(artist), *([group_name] if group_name else [])}:
+                add_artist(name, weight)
+
+        for stage in ArtistMapping.objects.values_list("stage_name", flat=True).distinct().iterator():
+            add_artist(stage, 0)
+        for key, (name, weight) in artists.items():
+            item = (-weight, name, "artist", name)
+            entries.append((key, item))
+            choseong = to_choseong(name)
+            if choseong and choseong != key:
+                entries.append((choseong, item))
+
+        entries.sort(key=lambda entry: entry[0])
+        keys = [key for key, _ in entries]
+        items = [item for _, item in entries]
+
+        buckets = {}
+        for key, item in entries:
+            for n in range(1, _SUGGEST_PRECOMPUTED_PREFIX_LEN + 1):
+                if len(key) >= n:
+                    buckets.setdefault(key[:n], []).append(item)
+        top = {prefix: _best_suggestions(bucket, SUGGEST_MAX_LIMIT) for prefix, bucket in buckets.items()}
+
+        # 조회 중인 스레드는 이전 묶음을 그대로 사용 (참조 1번 교체라 새 키 + 이전 항목이 섞이지 않음)
+        self._index = (keys, items, top)
+
+    def _ensure_loaded(self) -> None:
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < _VERSION_CHECK_INTERVAL:
+            return
+        with self._lock:
+            if self._version is not None and now - self._checked_at < _VERSION_CHECK_INTERVAL:
+                return
+            version = _shared_version(EVENT_SUGGEST_VERSION_KEY)
+            if version != self._version or now - self._loaded_at >= _SUGGEST_MAX_AGE:
+                self._load()
+                self._version = version
+                self._loaded_at = now
+            self._checked_at = now
+
+    def suggest(self, text, limit: int = 10) -> list:
+        """
+        text 접두사와 일치하는 공연/아티스트 (가중치 높은 순)
+        [{"type": "event", "event_id", "title"} | {"type": "artist", "name"}]
+        """
+        key = normalize_search_text(text)
+        if not key:
+            return []
+        self._ensure_loaded()
+        limit = min(limit, SUGGEST_MAX_LIMIT)
+        keys, items, top = self._index
+
+        if len(key) <= _SUGGEST_PRECOMPUTED_PREFIX_LEN:
+            best = top.get(key, [])[:limit]
+        else:
+            lo = bisect.bisect_left(keys, key)
+            hi = bisect.bisect_left(keys, key + "\U0010ffff", lo)
+            best = _best_suggestions(items[lo:hi], limit)
+
+        return [
+            {"type": "event", "event_id": ident, "title": label} if kind == "event"
+            else {"type": "artist", "name": label}
+            for _, label, kind, ident in best
+        ]
+
+
+event_suggester = EventSuggester()
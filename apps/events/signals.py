@@ -0,0 +1,95 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from common.pagination import invalidate_counts
+from .models import ArtistMapping, Event
+from .services import (
+    bump_artist_mapping_version,
+    bump_event_suggest_version,
+    event_content_hash,
+    index_events,
+    event_months,
+    invalidate_event_calendar,
+    invalidate_event_details,
+    rebuild_event_calendar,
+    refresh_event_search_index,
+)
+
+
+# 대량 적재(bulk upsert)처럼 post_save가 발생하지 않는 공연 변경 통지
+## kwargs: event_ids (변경된 event_id 목록)
+events_changed = Signal()
+
+
+# 표시 필드 해시 갱신 (ingest_events 변경 감지용)
+## 해시가 바뀌면 content_updated_at도 갱신 (instance.content_hash는 조회 시점의 저장값)
+@receiver(pre_save, sender=Event)
+def set_content_hash(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    content_hash = event_content_hash(instance)
+    if content_hash != instance.content_hash or instance.content_updated_at is None:
+        instance.content_updated_at = timezone.now()
+    instance.content_hash = content_hash
+
+
+# Event 저장(admin/ORM) 시 검색 토큰 즉시 갱신
+## 삭제는 FK CASCADE로 토큰도 같이 삭제됨
+@receiver(post_save, sender=Event)
+def refresh_search_tokens_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index_events([instance])
+
+
+# 목록 total_count 캐시 무효화
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_event_counts(sender, instance, **kwargs):
+    invalidate_counts("events")
+
+
+# 공연 상세 캐시 무효화 (다음 요청에서 새 ETag로 재생성)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_event_detail_cache(sender, instance, **kwargs):
+    invalidate_event_details([instance.event_id])
+
+
+# 달력 월 버킷 재생성 (이전/새 기간의 월 캐시 무효화)
+## 삭제는 버킷이 CASCADE로 지워지므로 공연 기간의 월 캐시만 무효화
+@receiver(post_save, sender=Event)
+def rebuild_calendar_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    rebuild_event_calendar([instance.event_id])
+
+
+@receiver(post_delete, sender=Event)
+def invalidate_calendar_on_delete(sender, instance, **kwargs):
+    invalidate_event_calendar(event_months(instance.start_date, instance.end_date))
+
+
+# 자동완성 인덱스 재적재 (각 프로세스가 다음 조회 때)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_event_suggest(sender, instance, **kwargs):
+    bump_event_suggest_version()
+
+
+@receiver(events_changed)
+def refresh_derived_on_events_changed(sender, event_ids, **kwargs):
+    refresh_event_search_index(event_ids)
+    rebuild_event_calendar(event_ids)
+    bump_event_suggest_version()
+    invalidate_event_details(event_ids)
+    invalidate_counts("events")
+
+
+# 아티스트 매핑 변경 -> resolver 버전 증가 (각 프로세스가 다음 조회 때 재적재)
+@receiver(post_save, sender=ArtistMapping)
+@receiver(post_delete, sender=ArtistMapping)
+def invalidate_artist_resolver(sender, instance, **kwargs):
+    bump_artist_mapping_version()
+    bump_event_suggest_version()
@@ -1,3 +1,637 @@
+import bisect
+import datetime
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from django.utils.http import http_date
+
+from common.pagination import cached_count, encode_cursor
+from common.testing import QueryPlanAssertionsMixin
+from bookmarks.models import Bookmark
+from users.models import User
+from .models import ArtistMapping, Event, EventCalendarMonth, EventSearchToken, EventTrending
+from .services import (
+    _ARTIST_MAPPING_MAX_AGE,
+    artist_resolver,
+    compute_trending_events,
+    event_suggester,
+    invalidate_event_details,
+)
+from .views import _event_list_queryset
+
+TESTDATA = Path(__file__).resolve().parent / "testdata"
+
+
+class IngestEventsCommandTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        ArtistMapping.objects.create(raw_name="방탄소년단", stage_name="BTS")
+
+    def _ingest(self, name, *args):
+        out = StringIO()
+        call_command("ingest_events", str(TESTDATA / name), *args, stdout=out)
+        return out.getvalue()
+
+    def test_xml_dump_upserts_events(self):
+        out = self._ingest("kopis_dump.xml")
+
+        self.assertIn("rows/s", out)
+        self.assertEqual(Event.objects.count(), 2)
+
+        e = Event.objects.get(kopis_id="PF000001")
+        self.assertEqual(e.title, "뮤지컬 시카고")
+        self.assertEqual(e.start_date, datetime.date(2026, 1, 10))
+        self.assertEqual(e.end_date, datetime.date(2026, 3, 31))
+        self.assertEqual(e.relate_url, "https://tickets.example.com/PF000001")
+        self.assertIsNotNone(e.update_date)
+
+        # artist -> group_name (ArtistMapping)
+        self.assertEqual(Event.objects.get(kopis_id="PF000002").group_name, "BTS")
+
+        # bulk upsert도 검색 인덱스 반영
+        self.assertTrue(EventSearchToken.objects.filter(event=e, token="시카").exists())
+
+    def test_json_lines_reload_updates_in_place(self):
+        self._ingest("kopis_dump.xml")
+        event_id = Event.objects.get(kopis_id="PF000002").event_id
+
+        self._ingest("kopis_dump.jsonl", "--batch-size", "1")
+
+        self.assertEqual(Event.objects.count(), 3)
+        e = Event.objects.get(kopis_id="PF000002")
+        self.assertEqual(e.event_id, event_id)
+        self.assertEqual(e.title, "방탄소년단 월드투어 (추가 회차)")
+        self.assertEqual(e.end_date, datetime.date(2026, 4, 3))
+        self.assertEqual(Event.objects.get(kopis_id="PF000003").start_date, datetime.date(2026, 6, 1))
+
+    def test_reload_skips_unchanged_rows(self):
+        self._ingest("kopis_dump.xml")
+        unchanged = Event.objects.get(kopis_id="PF000001")
+        update_date = unchanged.update_date
+        first_update = Event.objects.get(kopis_id="PF000002").update_date
+
+        with tempfile.NamedTemporaryFile("r", suffix=".txt") as f:
+            out = self._ingest("kopis_dump.xml", "--changed-ids-out", f.name)
+            self.assertEqual(f.read(), "")
+        self.assertIn("변경 없음 2건", out)
+
+        with tempfile.NamedTemporaryFile("r", suffix=".txt") as f:
+            self._ingest("kopis_dump.jsonl", "--changed-ids-out", f.name)
+            changed = {int(line) for line in f.read().split()}
+
+        self.assertEqual(changed, set(Event.objects.filter(
+            kopis_id__in=["PF000002", "PF000003"]).values_list("event_id", flat=True)))
+
+        unchanged.refresh_from_db()
+        self.assertEqual(unchanged.update_date, update_date)
+        self.assertGreater(Event.objects.get(kopis_id="PF000002").update_date, first_update)
+
+
+class EventListQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    """
+    event_list 정렬별 쿼리가 정렬 인덱스를 타는지 (SQLite/MariaDB EXPLAIN)
+    - 뷰와 같은 _event_list_queryset으로 QuerySet 생성
+    - search/area/genre 조건은 후보를 좁힌 뒤 정렬하므로 대상 아님
+    """
+
+    SORTS = ("latest", "update", "favorite", "name", "trending")
+    NO_FILTERS = {"area": "", "genre": "", "age": "", "status": ""}
+
+    def test_sorts_use_index_order(self):
+        for sort in self.SORTS:
+            with self.subTest(sort=sort):
+                qs, _, ordering = _event_list_queryset("", self.NO_FILTERS, sort)
+                self.assertIndexOrdered(qs.order_by(*ordering)[:10])
+
+    def test_status_filter_keeps_index_order(self):
+        for sort in ("latest", "update", "favorite"):
+            with self.subTest(sort=sort):
+                qs, _, ordering = _event_list_queryset("", {**self.NO_FILTERS, "status": "ongoing"}, sort)
+                self.assertIndexOrdered(qs.order_by(*ordering)[:10])
+
+
+class TrendingEventsTests(TestCase):
+    def setUp(self):
+        self.events = [
+            Event.objects.create(
+                kopis_id=f"PF9{i}", title=f"공연{i}",
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+            for i in range(2)
+        ]
+        self.users = [
+            User.objects.create_user(email=f"u{i}@example.com", nickname=f"u{i}", provider="kakao", provider_id=str(i))
+            for i in range(3)
+        ]
+
+    def _bookmark(self, user, event, hours_ago=0):
+        b = Bookmark.objects.create(user=user, event=event)
+        Bookmark.objects.filter(pk=b.pk).update(created_at=timezone.now() - datetime.timedelta(hours=hours_ago))
+
+    def test_incremental_matches_full(self):
+        hot, cold = self.events
+        self._bookmark(self.users[0], cold, hours_ago=72)
+        self._bookmark(self.users[1], hot, hours_ago=1)
+        compute_trending_events(half_life_hours=72)
+
+        # 확정 구간 이후 bookmark만 가산
+        self._bookmark(self.users[2], hot)
+        result = compute_trending_events(half_life_hours=72)
+        self.assertFalse(result["full"])
+        self.assertEqual(result["events"], 1)
+        incremental = dict(EventTrending.objects.values_list("event_id", "score"))
+
+        compute_trending_events(half_life_hours=72, full=True)
+        full = dict(EventTrending.objects.values_list("event_id", "score"))
+
+        self.assertEqual(incremental.keys(), full.keys())
+        for event_id, score in full.items():
+            self.assertAlmostEqual(incremental[event_id], score, places=3)
+        self.assertGreater(full[hot.event_id], full[cold.event_id])
+        self.assertAlmostEqual(full[cold.event_id], 0.5, places=3)
+
+
+    def _scores(self):
+        return dict(EventTrending.objects.values_list("event_id", "score"))
+
+    def test_late_committed_bookmark_is_counted(self):
+        hot, cold = self.events
+        self._bookmark(self.users[0], cold, hours_ago=1)
+        compute_trending_events(half_life_hours=72)
+
+        # 이전 실행보다 먼저 created_at이 찍혔지만 이후에 커밋된 bookmark
+        self._bookmark(self.users[1], hot, hours_ago=0.05)
+        compute_trending_events(half_life_hours=72)
+        self.assertIn(hot.event_id, self._scores())
+
+    def test_rerun_does_not_double_count_recent_bookmarks(self):
+        hot, _ = self.events
+        self._bookmark(self.users[0], hot)
+        compute_trending_events(half_life_hours=72)
+        compute_trending_events(half_life_hours=72)
+        self.assertAlmostEqual(self._scores()[hot.event_id], 1.0, places=3)
+
+        # 확정 구간으로 넘어간 뒤에도 한 번만
+        compute_trending_events(half_life_hours=72, overlap_minutes=0)
+        compute_trending_events(half_life_hours=72, overlap_minutes=0)
+        self.assertAlmostEqual(self._scores()[hot.event_id], 1.0, places=3)
+
+    def test_command_runs_once_without_interval(self):
+        self._bookmark(self.users[0], self.events[0])
+        out = StringIO()
+        call_command("compute_trending_events", stdout=out)
+        self.assertIn("트렌딩 전체 계산 완료: 공연 1개 반영", out.getvalue())
+
+class TrendingCountCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.events = [
+            Event.objects.create(
+                kopis_id=f"PF95{i}", title=f"공연{i}",
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+            for i in range(5)
+        ]
+        self.users = [
+            User.objects.create_user(email=f"u{i}@example.com", nickname=f"u{i}", provider="kakao", provider_id=str(i))
+            for i in range(2)
+        ]
+        Bookmark.objects.create(user=self.users[0], event=self.events[0])
+        compute_trending_events()
+
+    def _total(self, sort):
+        data = self.client.get("/api/events", {"sort": sort}).json()["data"]
+        return data["total_count"], data["total_pages"], len(data["events"])
+
+    def test_trending_and_latest_counts_are_separate(self):
+        self.assertEqual(self._total("trending"), (1, 1, 1))
+        self.assertEqual(self._total("latest"), (5, 1, 5))
+
+        cache.clear()
+        self.assertEqual(self._total("latest"), (5, 1, 5))
+        self.assertEqual(self._total("trending"), (1, 1, 1))
+
+    def test_recompute_invalidates_trending_count(self):
+        self.assertEqual(self._total("trending"), (1, 1, 1))
+
+        Bookmark.objects.create(user=self.users[1], event=self.events[1])
+        compute_trending_events()
+        self.assertEqual(self._total("trending"), (2, 1, 2))
+
+
+class EventCalendarTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.event = Event.objects.create(
+            kopis_id="PF100", title="달력 공연", poster="p.jpg",
+            start_date=datetime.date(2026, 1, 30), end_date=datetime.date(2026, 2, 2),
+        )
+
+    def _calendar(self, year, month):
+        res = self.client.get("/api/events/calendar", {"year": year, "month": month})
+        self.assertEqual(res.status_code, 200)
+        return res.json()["data"]
+
+    def test_days_cover_event_range(self):
+        self.assertEqual(
+            set(EventCalendarMonth.objects.values_list("month", flat=True)),
+            {datetime.date(2026, 1, 1), datetime.date(2026, 2, 1)},
+        )
+        jan = self._calendar(2026, 1)
+        self.assertEqual(jan["events"], [{"event_id": self.event.event_id, "title": "달력 공연", "poster": "p.jpg"}])
+        self.assertEqual(jan["days"]["30"], [self.event.event_id])
+        self.assertEqual(jan["days"]["29"], [])
+        self.assertEqual(self._calendar(2026, 2)["days"]["2"], [self.event.event_id])
+
+    def test_moving_event_invalidates_old_and_new_months(self):
+        self._calendar(2026, 1)
+        self._calendar(2026, 3)
+
+        self.event.start_date = datetime.date(2026, 3, 1)
+        self.event.end_date = datetime.date(2026, 3, 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.save()
+
+        self.assertEqual(self._calendar(2026, 1)["events"], [])
+        self.assertEqual(self._calendar(2026, 3)["days"]["1"], [self.event.event_id])
+
+    def test_invalid_month(self):
+        res = self.client.get("/api/events/calendar", {"year": 2026, "month": 13})
+        self.assertEqual(res.status_code, 400)
+
+
+class EventBatchTests(TestCase):
+    def test_returns_summaries_in_request_order(self):
+        events = [
+            Event.objects.create(
+                kopis_id=f"PF20{i}", title=f"공연{i}",
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+            for i in range(3)
+        ]
+        ids = [events[2].event_id, events[0].event_id, 999999, events[2].event_id]
+
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/events/batch", {"ids": ",".join(map(str, ids))})
+
+        data = res.json()["data"]
+        self.assertEqual([e["event_id"] for e in data["events"]], [events[2].event_id, events[0].event_id])
+        self.assertEqual(data["missing_ids"], [999999])
+
+    def test_rejects_too_many_ids(self):
+        ids = ",".join(str(i) for i in range(1, 202))
+        self.assertEqual(self.client.get("/api/events/batch", {"ids": ids}).status_code, 400)
+
+
+class EventSuggestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        ArtistMapping.objects.create(raw_name="방탄소년단", stage_name="BTS")
+        for i, (title, artist, favorite_count) in enumerate([
+            ("뮤지컬 시카고", "최재림", 5),
+            ("시카고 콘서트", "방탄소년단", 50),
+        ]):
+            Event.objects.create(
+                kopis_id=f"PF30{i}", title=title, artist=artist, group_name=None, favorite_count=favorite_count,
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+        event_suggester.invalidate()
+
+    def _suggest(self, q):
+        res = self.client.get("/api/events/suggest", {"q": q})
+        self.assertEqual(res.status_code, 200)
+        return res.json()["data"]["suggestions"]
+
+    def test_prefix_matches_title_words_by_popularity(self):
+        titles = [s["title"] for s in self._suggest("시카고") if s["type"] == "event"]
+        self.assertEqual(titles, ["시카고 콘서트", "뮤지컬 시카고"])
+
+    def test_artist_and_stage_name(self):
+        self.assertIn({"type": "artist", "name": "BTS"}, self._suggest("bt"))
+        self.assertIn({"type": "artist", "name": "방탄소년단"}, self._suggest("방탄"))
+
+    def test_choseong_prefix(self):
+        titles = [s["title"] for s in self._suggest("ㅅㅋㄱ") if s["type"] == "event"]
+        self.assertEqual(titles, ["시카고 콘서트", "뮤지컬 시카고"])
+        self.assertIn({"type": "artist", "name": "방탄소년단"}, self._suggest("ㅂㅌ"))
+
+    def test_popular_event_beyond_alphabetical_window(self):
+        # 같은 접두사의 비인기 공연이 많아도 가중치 높은 공연이 먼저
+        Event.objects.bulk_create([
+            Event(
+                kopis_id=f"PF31{i:04d}", title=f"시카고공연{i:04d}",
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+            for i in range(2100)
+        ])
+        Event.objects.create(
+            kopis_id="PF3199999", title="시카고공연zz", favorite_count=100,
+            start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        for q in ("시카고", "시카고공", "시카고공연"):
+            with self.subTest(q=q):
+                self.assertEqual(self._suggest(q)[0]["title"], "시카고공연zz")
+
+    def test_non_integer_size(self):
+        self.assertEqual(self.client.get("/api/events/suggest", {"q": "시", "size": "ten"}).status_code, 400)
+
+    def test_reload_during_lookup_uses_one_snapshot(self):
+        self._suggest("시")
+        real_bisect_left = bisect.bisect_left
+
+        def bisect_then_reload(*args, **kwargs):
+            # 조회 도중 다른 스레드가 새(빈) 인덱스로 교체
+            event_suggester._index = ([], [], {})
+            return real_bisect_left(*args, **kwargs)
+
+        with mock.patch("events.services.bisect.bisect_left", side_effect=bisect_then_reload):
+            titles = [s["title"] for s in event_suggester.suggest("시카고 콘", 10) if s["type"] == "event"]
+        self.assertEqual(titles, ["시카고 콘서트"])
+
+    def test_no_queries_after_load(self):
+        self._suggest("시")
+        with self.assertNumQueries(0):
+            self._suggest("뮤지컬")
+
+
+class ChoseongSearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for i, (title, group_name) in enumerate([("뮤지컬 시카고", None), ("월드투어", "방탄소년단"), ("시카", "고고")]):
+            Event.objects.create(
+                kopis_id=f"PF40{i}", title=title, group_name=group_name,
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+
+    def _titles(self, search):
+        res = self.client.get("/api/events", {"search": search})
+        return [e["title"] for e in res.json()["data"]["events"]]
+
+    def test_event_list_matches_choseong(self):
+        self.assertEqual(self._titles("ㅅㅋㄱ"), ["뮤지컬 시카고"])
+        self.assertEqual(self._titles("ㅁㅈㅋ ㅅㅋ"), ["뮤지컬 시카고"])
+        self.assertEqual(self._titles("ㅂㅌㅅㄴㄷ"), ["월드투어"])
+        self.assertEqual(self._titles("ㅅㄱㅋ"), [])
+
+
+class EventSearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for i, (title, venue) in enumerate([
+            ("뮤지컬 시카고", "샤롯데씨어터"),
+            ("시카 단독 공연", "카고홀"),
+            ("Chicago Live", "블루스퀘어"),
+        ]):
+            Event.objects.create(
+                kopis_id=f"PF50{i}", title=title, venue=venue,
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+
+    def _titles(self, search):
+        res = self.client.get("/api/events", {"search": search})
+        self.assertEqual(res.status_code, 200)
+        return sorted(e["title"] for e in res.json()["data"]["events"])
+
+    def test_bigrams_split_across_fields_do_not_match(self):
+        # "시카"(제목) + "카고"(장소)는 "시카고"가 아님
+        self.assertEqual(self._titles("시카고"), ["뮤지컬 시카고"])
+        self.assertEqual(self._titles("뮤지컬시카고"), ["뮤지컬 시카고"])
+        self.assertEqual(self._titles("카고홀"), ["시카 단독 공연"])
+        self.assertEqual(self._titles("chicago"), ["Chicago Live"])
+
+    def test_query_normalized_like_index(self):
+        # 전각 문자/탭/개행도 색인과 같은 정규화(NFKC + 공백 제거) 후 비교
+        self.assertEqual(self._titles("Ｃｈｉｃａｇｏ"), ["Chicago Live"])
+        self.assertEqual(self._titles("뮤지컬\t시카고"), ["뮤지컬 시카고"])
+        self.assertEqual(self._titles("뮤지컬\n시카"), ["뮤지컬 시카고"])
+
+    def test_short_queries_match_any_field(self):
+        self.assertEqual(self._titles("시카"), ["뮤지컬 시카고", "시카 단독 공연"])
+        self.assertEqual(self._titles("홀"), ["시카 단독 공연"])
+
+    def test_rebuild_command_restores_tokens(self):
+        EventSearchToken.objects.all().delete()
+        self.assertEqual(self._titles("시카고"), [])
+
+        out = StringIO()
+        call_command("rebuild_event_search_index", stdout=out)
+        self.assertIn("검색 토큰", out.getvalue())
+        self.assertEqual(self._titles("시카고"), ["뮤지컬 시카고"])
+
+    def test_rebuild_single_event(self):
+        e = Event.objects.get(kopis_id="PF500")
+        Event.objects.filter(pk=e.pk).update(title="오페라의 유령")
+        call_command("rebuild_event_search_index", "--event-id", str(e.event_id), stdout=StringIO())
+
+        self.assertEqual(self._titles("시카고"), [])
+        self.assertEqual(self._titles("오페라"), ["오페라의 유령"])
+
+
+class EventCursorTests(TestCase):
+    def setUp(self):
+        for i in range(3):
+            Event.objects.create(
+                kopis_id=f"PF60{i}", title=f"공연{i}",
+                start_date=datetime.date(2026, 1, 1 + i), end_date=datetime.date(2026, 1, 5),
+            )
+
+    def test_walks_all_pages(self):
+        ids, cursor = [], ""
+        while True:
+            data = self.client.get("/api/events", {"sort": "latest", "size": 2, "cursor": cursor}).json()["data"]
+            ids += [e["event_id"] for e in data["events"]]
+            if not data["has_next"]:
+                break
+            cursor = data["next_cursor"]
+        self.assertEqual(ids, list(Event.objects.order_by("-start_date", "-event_id").values_list("event_id", flat=True)))
+
+    def test_tampered_cursor_is_rejected(self):
+        for values in (["garbage", 4], [{"a": 1}, 4], ["2026-01-04", "x"], [None, 4], ["2026-01-04"]):
+            with self.subTest(values=values):
+                res = self.client.get("/api/events", {"sort": "latest", "cursor": encode_cursor("latest", values)})
+                self.assertEqual(res.status_code, 400)
+        res = self.client.get("/api/events", {"sort": "trending", "cursor": encode_cursor("trending", ["1.5", 4])})
+        self.assertEqual(res.status_code, 400)
+
+
+class CachedCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for i in range(2):
+            self._create(i)
+
+    def _create(self, i):
+        return Event.objects.create(
+            kopis_id=f"PF70{i}", title=f"공연{i}", area="서울",
+            start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+
+    def _count(self, filters=None):
+        return cached_count(Event.objects.all(), "events", "test", filters)
+
+    def test_second_count_is_cache_hit(self):
+        self.assertEqual(self._count(), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._count(), 2)
+
+    def test_save_and_delete_invalidate(self):
+        self.assertEqual(self.client.get("/api/events").json()["data"]["total_count"], 2)
+
+        e = self._create(2)
+        self.assertEqual(self.client.get("/api/events").json()["data"]["total_count"], 3)
+
+        e.delete()
+        self.assertEqual(self.client.get("/api/events").json()["data"]["total_count"], 2)
+
+    def test_filters_key_is_normalized(self):
+        self.assertEqual(self._count({"area": "서울", "genre": ""}), 2)
+        # 빈 값/None 제외, 순서 무관 -> 같은 키
+        with self.assertNumQueries(0):
+            self.assertEqual(self._count({"genre": None, "area": "서울"}), 2)
+        # 다른 값은 다른 키
+        with self.assertNumQueries(1):
+            self._count({"area": "부산"})
+        # 필터 없음 == 빈 값만 있는 필터
+        self._count()
+        with self.assertNumQueries(0):
+            self._count({"search": ""})
+
+
+class EventDetailConditionalTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.event = Event.objects.create(
+            kopis_id="PF800", title="공연", artist="배우", update_date=timezone.now(),
+            start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.url = f"/api/events/{self.event.event_id}"
+
+    def test_etag_returns_304_until_edited(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, 200)
+        etag, last_modified = res["ETag"], res["Last-Modified"]
+
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        # update_date는 그대로인 ORM 수정
+        self.event.artist = "다른 배우"
+        self.event.save()
+
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.json()["data"]["artist"], "다른 배우")
+
+
+    def test_last_modified_is_stable_across_cache_refill(self):
+        changed = datetime.datetime(2026, 1, 1, 9, 0, tzinfo=datetime.timezone.utc)
+        Event.objects.filter(pk=self.event.pk).update(update_date=None, content_updated_at=changed)
+        invalidate_event_details([self.event.event_id])
+
+        first = self.client.get(self.url)
+        self.assertEqual(first["Last-Modified"], http_date(changed.timestamp()))
+
+        # 캐시 재생성(TTL 만료/다른 워커) 후에도 같은 값
+        invalidate_event_details([self.event.event_id])
+        second = self.client.get(self.url)
+        self.assertEqual(second["Last-Modified"], first["Last-Modified"])
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 304,
+        )
+
+    def test_last_modified_moves_only_when_content_changes(self):
+        before = Event.objects.get(pk=self.event.pk).content_updated_at
+        Event.objects.get(pk=self.event.pk).save()
+        self.assertEqual(Event.objects.get(pk=self.event.pk).content_updated_at, before)
+
+        self.event.refresh_from_db()
+        self.event.artist = "다른 배우"
+        self.event.save()
+        self.assertGreater(Event.objects.get(pk=self.event.pk).content_updated_at, before)
+
+class ArtistResolverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        ArtistMapping.objects.create(raw_name="방탄소년단", stage_name="BTS")
+        ArtistMapping.objects.create(raw_name="Bangtan Boys", stage_name="BTS")
+        artist_resolver.invalidate()
+
+    def test_resolve_many_and_stage_names(self):
+        self.assertEqual(
+            artist_resolver.resolve_many(["방탄 소년단", "bangtan boys", "아이유", None]),
+            {"방탄 소년단": "BTS", "bangtan boys": "BTS"},
+        )
+        self.assertEqual(artist_resolver.stage_names_for("bts"), {"BTS"})
+        self.assertEqual(artist_resolver.stage_names_for("방탄소년단"), {"BTS"})
+        self.assertEqual(artist_resolver.stage_names_for("아이유"), set())
+        self.assertEqual(sorted(artist_resolver.aliases("BTS")), ["Bangtan Boys", "방탄소년단"])
+
+    def test_mapping_change_is_picked_up(self):
+        self.assertEqual(artist_resolver.resolve("아이유"), None)
+        ArtistMapping.objects.create(raw_name="아이유", stage_name="IU")
+        self.assertEqual(artist_resolver.resolve("아이유"), "IU")
+
+    def test_reloads_after_max_age_without_version_bump(self):
+        artist_resolver.resolve("아이유")
+        # 다른 워커의 변경 (이 프로세스의 버전 카운터는 그대로)
+        ArtistMapping.objects.bulk_create([ArtistMapping(raw_name="아이유", stage_name="IU")])
+        artist_resolver._checked_at = 0.0
+        self.assertEqual(artist_resolver.resolve("아이유"), None)
+
+        artist_resolver._loaded_at -= _ARTIST_MAPPING_MAX_AGE
+        artist_resolver._checked_at = 0.0
+        self.assertEqual(artist_resolver.resolve("아이유"), "IU")
+
+    def test_alias_search(self):
+        for i, (title, artist, group_name) in enumerate([
+            ("월드투어", "방탄소년단", None),
+            ("팬미팅", "Bangtan Boys", None),
+            ("콘서트", "정국", "BTS"),
+            ("단독 공연", "아이유", None),
+        ]):
+            Event.objects.create(
+                kopis_id=f"PF90{i}", title=title, artist=artist, group_name=group_name,
+                start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+            )
+        res = self.client.get("/api/events", {"search": "BTS"})
+        titles = sorted(e["title"] for e in res.json()["data"]["events"])
+        self.assertEqual(titles, ["월드투어", "콘서트", "팬미팅"])
+
+
+class EventFilterFacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _list(self, **params):
+        return self.client.get("/api/events", params)
+
+    def test_invalid_filters_return_400(self):
+        for params in ({"status": "soon"}, {"area": "가" * 256}, {"genre": "x" * 300}, {"age": "1" * 256}):
+            with self.subTest(params=params):
+                self.assertEqual(self._list(**params).status_code, 400)
+
+    def test_filters_and_facets_after_ingest(self):
+        call_command("ingest_events", str(TESTDATA / "kopis_dump.xml"), stdout=StringIO())
+
+        titles = [e["title"] for e in self._list(genre="뮤지컬").json()["data"]["events"]]
+        self.assertEqual(titles, ["뮤지컬 시카고"])
+        self.assertEqual(self._list(area="서울특별시", genre="연극").json()["data"]["events"], [])
+
+        facets = self._list(facets="1").json()["data"]["facets"]
+        self.assertIn({"value": "뮤지컬", "count": 1}, facets["genre"])
+        self.assertEqual(sum(facets["status"].values()), Event.objects.count())
+        self.assertIsNotNone(facets["refreshed_at"])
 
-# Create your tests here.
+        # 이후 적재(공연 추가)도 집계에 반영
+        call_command("ingest_events", str(TESTDATA / "kopis_dump.jsonl"), stdout=StringIO())
+        facets = self._list(facets="1").json()["data"]["facets"]
+        self.assertEqual(sum(facets["status"].values()), 3)
+        self.assertIn({"value": "뮤지컬", "count": 2}, facets["genre"])
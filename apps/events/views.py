@@ -1,9 +1,26 @@
-from django.core.paginator import Paginator
-from django.db.models import Q, Count
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django.views.decorators.http import require_GET
 
 from common.utils import common_response
+from common.pagination import CachedCountPaginator, InvalidCursor, cursor_paginate
 from .models import Event
+from .services import (
+    EVENT_STATUSES,
+    SUGGEST_MAX_LIMIT,
+    apply_event_filters,
+    apply_event_search,
+    event_detail_cache_key,
+    event_suggester,
+    get_event_calendar,
+    get_event_facets,
+)
 from django.shortcuts import render
 
 # Create your views here.
@@ -22,9 +39,8 @@ def _event_summary(e: Event) -> dict:
 
         "group_name": e.group_name,
 
-        # 즐겨찾기 갯수 포함 (없으면 0)
-        ## Event 객체에 favorite_coute 속성이 있으면 값을 내리고 없으면 0 내림
-        "favorite_count": int(getattr(e, "favorite_count", 0) or 0),
+        # 즐겨찾기 갯수 (비정규화 컬럼 events.favorite_count)
+        "favorite_count": e.favorite_count or 0,
     }
 
 def _event_detail(e: Event) -> dict:
@@ -49,11 +65,67 @@ def _event_detail(e: Event) -> dict:
     }
 
 
+# sort 표준값 -> (정렬 식별자, ORDER BY)
+## sort=latest(기본), sort=favorite, sort=update, sort=name +) 내부 alias: fav, popular
+## sort=relevance: 검색어가 있을 때만 의미 있음 (검색 시 기본값)
+## 모든 정렬은 event_id로 끝나야 함 (cursor 모드의 유일한 tie-breaker)
+def _event_ordering(sort: str, search: str):
+    if sort in ("relevance", "score") and search:
+        return "relevance", ("-search_score", "-start_date", "-event_id")
+    if sort in ("favorite", "fav", "bookmark", "popular", "popularity"):
+        return "favorite", ("-favorite_count", "-update_date", "-event_id")
+    if sort in ("trending", "hot"):
+        # trending_score: event_trending 조인 (랭킹에 있는 공연만)
+        return "trending", ("-trending_score", "-event_id")
+    if sort in ("latest", "recent"):
+        return "latest", ("-start_date", "-event_id")
+    if sort in ("update",):
+        return "update", ("-update_date", "-event_id")
+    return "name", ("title", "event_id")
+
+
+# event_list 조회 QuerySet (EventListQueryPlanTests도 이 함수로 검증)
+## 반환: (qs, 정렬 식별자, ORDER BY), filters는 검증된 값
+def _event_list_queryset(search: str, filters: dict, sort: str):
+    qs = Event.objects.all()
+
+    # 검색: bigram 검색 인덱스(event_search_tokens) 조회 + 관련도(search_score)
+    if search:
+        qs = apply_event_search(qs, search)
+
+    qs = apply_event_filters(qs, **filters)
+
+    sort_tag, ordering = _event_ordering(sort, search)
+    if sort_tag == "trending":
+        qs = qs.filter(trending__isnull=False).annotate(trending_score=F("trending__score"))
+    return qs, sort_tag, ordering
+
+
 @require_GET
 def event_list(request):
     search = (request.GET.get("search") or "").strip()
-    # 기본 최신순
-    sort = (request.GET.get("sort") or "latest").strip().lower()
+    # 기본 최신순 (검색어가 있으면 관련도순)
+    sort = (request.GET.get("sort") or ("relevance" if search else "latest")).strip().lower()
+
+    # 필터: area/genre/age 정확히 일치, status=ongoing|upcoming|ended (오늘 기준)
+    filters = {
+        "area": (request.GET.get("area") or "").strip(),
+        "genre": (request.GET.get("genre") or "").strip(),
+        "age": (request.GET.get("age") or "").strip(),
+        "status": (request.GET.get("status") or "").strip().lower(),
+    }
+    if filters["status"] and filters["status"] not in EVENT_STATUSES:
+        return common_response(False, message="status는 ongoing/upcoming/ended 중 하나여야 합니다.", status=400)
+    for name in ("area", "genre", "age"):
+        if len(filters[name]) > Event._meta.get_field(name).max_length:
+            return common_response(False, message=f"{name} 값이 너무 깁니다.", status=400)
+
+    # facets=1: area/genre/status 별 공연 수(event_facet_counts) 같이 내려주기
+    with_facets = request.GET.get("facets") in ("1", "true")
+
+    # cursor 모드: cursor 파라미터가 있으면 (빈 값 = 첫 페이지) keyset 페이지네이션
+    use_cursor = "cursor" in request.GET
+    cursor = (request.GET.get("cursor") or "").strip()
 
     #page/size 기본값
     try:
@@ -65,30 +137,33 @@ def event_list(request):
     if page <= 0 or size <= 0 or size > 100:
         return common_response(False, message="page는 1 이상, size는 1~100 범위에 포함되어야 합니다.", status=400)
     
-    qs = Event.objects.all()
+    qs, sort_tag, ordering = _event_list_queryset(search, filters, sort)
 
-    if search:
-        qs = qs.filter(
-            Q(title__icontains=search) |
-            Q(artist__icontains=search) |
-            Q(venue__icontains=search)
-        )
+    # cursor 모드: COUNT/OFFSET 없이 정렬 키 + event_id 이후만 조회 (깊은 페이지도 비용 동일)
+    if use_cursor:
+        try:
+            rows, next_cursor = cursor_paginate(qs, ordering, sort_tag, cursor, size)
+        except InvalidCursor as e:
+            return common_response(False, message=str(e), status=400)
 
-    # 항상 favorite_count 내려주기 (annotate 고정)
-    qs = qs. annotate(favorite_count=Count("bookmarks"))
+        data = {
+            "events": [_event_summary(e) for e in rows],
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None,
+            "size": size,
+        }
+        if with_facets:
+            data["facets"] = get_event_facets()
+        return common_response(True, data=data, message="성공적으로 목록을 불러옴", status=200)
 
-    # sort 표준값
-    ## sort=latest(기본), sort=favorite, sort=update, sort=name +) 내부 alias: fav, popular
-    if sort in ("favorite", "fav", "bookmark", "popular", "popularity"):
-        qs = qs.order_by("-favorite_count", "-update_date", "-event_id")
-    elif sort in ("latest", "recent"):
-        qs = qs.order_by("-start_date", "-event_id")
-    elif sort in ("update",):
-        qs = qs.order_by("-update_date", "-event_id")
-    else:
-        qs = qs.order_by("title", "event_id")
-
-    paginator = Paginator(qs, size)
+    qs = qs.order_by(*ordering)
+
+    # total_count: 검색어/필터별 캐시 (Event 저장 시 무효화)
+    ## trending은 랭킹에 있는 공연만 조회하므로 별도 키 (compute_trending_events 후 무효화)
+    paginator = CachedCountPaginator(
+        qs, size, namespace="events", endpoint="event_list",
+        filters={"search": search, **filters, "ranked": sort_tag == "trending" or None},
+    )
     page_obj = paginator.get_page(page)
 
     data = {
@@ -98,14 +173,113 @@ def event_list(request):
         "page": page_obj.number,
         "size": size,
     }
+    if with_facets:
+        data["facets"] = get_event_facets()
     return common_response(True, data=data, message="성공적으로 목록을 불러옴", status=200)
 
 
+def _detail_etag(e: Event, body: bytes) -> str:
+    # strong ETag: 직렬화된 본문 해시
+    ## update_date는 KOPIS 원본 시각이라 ORM/admin 수정(artist, group_name 등)에는 바뀌지 않음
+    return f'"e{e.event_id}-{hashlib.sha1(body).hexdigest()[:16]}"'
+
+
+def _detail_last_modified(e: Event):
+    # 본문 필드 중 content_hash에 없는 update_date까지 포함한 마지막 변경 시각
+    stamps = [t for t in (e.content_updated_at, e.update_date) if t is not None]
+    return int(max(stamps).timestamp()) if stamps else None
+
+
+def _with_validators(response, entry: dict):
+    response["ETag"] = entry["etag"]
+    if entry["last_modified"] is not None:
+        response["Last-Modified"] = http_date(entry["last_modified"])
+    return response
+
+
+# 조건부 GET: If-None-Match / If-Modified-Since 일치 시 304 (본문 생성 X)
+## 직렬화된 본문은 공연별 캐시 (Event 저장/삭제 시 signals에서 무효화)
 @require_GET
 def event_detail(request, event_id: int):
+    key = event_detail_cache_key(event_id)
+    entry = cache.get(key)
+
+    if entry is None:
+        try:
+            e = Event.objects.get(event_id=event_id)
+        except Event.DoesNotExist:
+            return common_response(False, message="존재하지 않는 공연 ID", status=404)
+
+        body = common_response(True, data=_event_detail(e), message="성공적으로 데이터 반환", status=200).content
+        entry = {
+            "etag": _detail_etag(e, body),
+            # 저장된 변경 시각 (캐시 재생성/워커와 무관하게 같은 값)
+            "last_modified": _detail_last_modified(e),
+            "body": body,
+        }
+        cache.set(key, entry, timeout=settings.EVENT_DETAIL_CACHE_TTL)
+
+    not_modified = get_conditional_response(
+        request, etag=entry["etag"], last_modified=entry["last_modified"],
+    )
+    if not_modified is not None:
+        return _with_validators(not_modified, entry)
+
+    response = HttpResponse(entry["body"], content_type="application/json")
+    return _with_validators(response, entry)
+
+
+# 월 달력: 날짜별 공연 id 목록 (event_calendar_months 버킷 + 월별 캐시)
+@require_GET
+def event_calendar(request):
     try:
-        e = Event.objects.get(event_id=event_id)
-    except Event.DoesNotExist:
-        return common_response(False, message="존재하지 않는 공연 ID", status=404)
+        year = int(request.GET.get("year", ""))
+        month = int(request.GET.get("month", ""))
+    except ValueError:
+        return common_response(False, message="year, month는 숫자여야 합니다.", status=400)
+    if not (1 <= month <= 12) or not (1900 <= year <= 2100):
+        return common_response(False, message="year 또는 month 값이 올바르지 않습니다.", status=400)
+
+    return common_response(True, data=get_event_calendar(year, month), message="성공적으로 데이터 반환", status=200)
+
+
+# 여러 공연 요약 한 번에 조회 (북마크 카드 등) -> 요청 순서대로, IN 쿼리 1번
+EVENT_BATCH_MAX_IDS = 200
+
+
+@require_GET
+def event_batch(request):
+    raw = request.GET.get("ids", "")
+    try:
+        ids = [int(v) for v in raw.split(",") if v.strip()]
+    except ValueError:
+        return common_response(False, message="ids는 콤마로 구분된 숫자여야 합니다.", status=400)
+    if not ids:
+        return common_response(False, message="ids를 입력해주세요.", status=400)
+
+    # 중복 제거 (순서 유지)
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > EVENT_BATCH_MAX_IDS:
+        return common_response(False, message=f"ids는 최대 {EVENT_BATCH_MAX_IDS}개까지 조회할 수 있습니다.", status=400)
+
+    found = Event.objects.in_bulk(ids)
+    data = {
+        "events": [_event_summary(found[i]) for i in ids if i in found],
+        # 삭제 등으로 없는 공연
+        "missing_ids": [i for i in ids if i not in found],
+    }
+    return common_response(True, data=data, message="성공적으로 데이터 반환", status=200)
+
+
+# 검색창 자동완성: 프로세스 메모리 접두사 인덱스 조회 (DB 조회 없음)
+@require_GET
+def event_suggest(request):
+    q = request.GET.get("q", "").strip()
+    try:
+        size = int(request.GET.get("size") or 10)
+    except ValueError:
+        return common_response(False, message="size는 정수여야 합니다.", status=400)
+    size = max(1, min(size, SUGGEST_MAX_LIMIT))
 
-    return common_response(True, data=_event_detail(e), message="성공적으로 데이터 반환", status=200)
+    data = {"query": q, "suggestions": event_suggester.suggest(q, size) if q else []}
+    return common_response(True, data=data, message="성공적으로 데이터 반환", status=200)
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from notifications.services import process_notification_outbox
+
+
+class Command(BaseCommand):
+    help = "알림 outbox(notification_outbox) 처리 워커"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--interval", type=float, default=1.0, help="outbox가 비었을 때 대기(초)")
+        parser.add_argument("--once", action="store_true", help="쌓인 outbox만 처리하고 종료 (cron용)")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        try:
+            while True:
+                close_old_connections()
+                processed = process_notification_outbox(batch_size)
+                total += processed
+                if processed < batch_size:
+                    if options["once"]:
+                        break
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"알림 {total}건 생성"))
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-18 15:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_event_calendar_months'),
+        ('notifications', '0004_notification_relate_url_alter_notification_type'),
+        ('posts', '0004_post_reaction_deltas'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('outbox_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('comment', 'Comment'), ('event', 'Event'), ('post_like', 'Postlike'), ('post_dislike', 'Postdislike'), ('notice', 'Notice')], max_length=20)),
+                ('message', models.CharField(max_length=255)),
+                ('relate_url', models.CharField(blank=True, max_length=255, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(blank=True, db_column='event_id', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notification_outbox', to='events.event')),
+                ('post', models.ForeignKey(blank=True, db_column='post_id', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notification_outbox', to='posts.post')),
+                ('user', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='notification_outbox', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'notification_outbox',
+            },
+        ),
+    ]
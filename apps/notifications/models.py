@@ -57,4 +57,45 @@ class Notification(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return f"Noti[{self.notification_id}] User[{self.user_id}] : {self.message}"
\ No newline at end of file
+        return f"Noti[{self.notification_id}] User[{self.user_id}] : {self.message}"
+
+# 알림 outbox: 본 작업(댓글/리액션/레벨업)과 같은 트랜잭션에 기록
+## run_notification_worker가 모아서 notifications에 bulk_create 후 삭제 (요청 처리 시간에서 알림 생성 제외)
+class NotificationOutbox(models.Model):
+    outbox_id = models.BigAutoField(primary_key=True)
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_outbox',
+        db_column='user_id'
+    )
+
+    post = models.ForeignKey(
+        'posts.Post',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='notification_outbox',
+        db_column='post_id'
+    )
+
+    event = models.ForeignKey(
+        'events.Event',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='notification_outbox',
+        db_column='event_id'
+    )
+
+    type = models.CharField(max_length=20, choices=Notification.Type.choices)
+    message = models.CharField(max_length=255)
+    relate_url = models.CharField(max_length=255, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'notification_outbox'
+
+    def __str__(self):
+        return f"Outbox[{self.outbox_id}] User[{self.user_id}] : {self.message}"
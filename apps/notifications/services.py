@@ -3,7 +3,10 @@
 from typing import Optional
 #추가
 from django.contrib.auth import get_user_model
-from notifications.models import Notification
+from django.db import transaction
+
+from common.pagination import invalidate_counts
+from notifications.models import Notification, NotificationOutbox
 # 제거: from users.models import User
 from posts.models import Post
 # 제거: from posts.models import Comment
@@ -76,4 +79,60 @@ def create_notification(
             is_read=False
         )
     except Exception as e:
-        print(f"알림 생성 실패: {e}")
\ No newline at end of file
+        print(f"알림 생성 실패: {e}")
+
+
+def enqueue_notification(
+    user_id: int,
+    type: str,
+    message: str,
+    relate_url: Optional[str] = None,
+    post_id: Optional[int] = None,
+    event_id: Optional[int] = None,
+):
+    """
+    알림을 outbox에 기록 (호출한 쪽 트랜잭션에 포함 -> 본 작업이 롤백되면 알림도 생성되지 않음)
+    실제 notifications 생성은 run_notification_worker에서 처리
+    """
+    NotificationOutbox.objects.create(
+        user_id=user_id,
+        type=type,
+        message=message,
+        relate_url=relate_url,
+        post_id=post_id,
+        event_id=event_id,
+    )
+
+
+def process_notification_outbox(batch_size: int = 500) -> int:
+    """
+    outbox를 batch_size건씩 notifications에 bulk_create 후 삭제 (같은 트랜잭션)
+    - 워커 여러 개가 동시에 돌아도 잠긴 행은 건너뜀 (SKIP LOCKED)
+    반환: 처리한 건수
+    """
+    with transaction.atomic():
+        rows = list(
+            NotificationOutbox.objects.select_for_update(skip_locked=True)
+            .order_by("outbox_id")[:batch_size]
+        )
+        if not rows:
+            return 0
+
+        Notification.objects.bulk_create([
+            Notification(
+                user_id=r.user_id,
+                type=r.type,
+                message=r.message,
+                relate_url=r.relate_url,
+                post_id=r.post_id,
+                event_id=r.event_id,
+                is_read=False,
+            )
+            for r in rows
+        ])
+        NotificationOutbox.objects.filter(outbox_id__in=[r.outbox_id for r in rows]).delete()
+
+    # bulk_create는 post_save가 없으므로 알림 목록 count 캐시 직접 무효화
+    for user_id in {r.user_id for r in rows}:
+        invalidate_counts(f"notifications:{user_id}")
+    return len(rows)
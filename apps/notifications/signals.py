@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.pagination import invalidate_counts
+from .models import Notification
+
+
+# 알림 목록 total_count 캐시 무효화 (읽음 처리는 개수 변화 없음)
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def invalidate_notification_counts(sender, instance, created=True, **kwargs):
+    if created:
+        invalidate_counts(f"notifications:{instance.user_id}")
@@ -1,3 +1,46 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from common.utils import create_access_token
+from events.models import Event
+from posts.models import Post
+from users.models import User
+from .models import Notification, NotificationOutbox
+
+
+class NotificationOutboxTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        self.reader = User.objects.create_user(email="b@example.com", nickname="b", provider="kakao", provider_id="2")
+        event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.post = Post.objects.create(event=event, user=self.author, category="후기", title="제목", content="내용")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.reader.user_id)}"}
+
+    def test_like_and_comment_go_through_outbox(self):
+        res = self.client.post(f"/api/posts/{self.post.post_id}/reactions/like", **self.auth)
+        self.assertEqual(res.status_code, 200)
+        res = self.client.post(
+            f"/api/posts/{self.post.post_id}/comments", data={"content": "댓글"},
+            content_type="application/json", **self.auth,
+        )
+        self.assertEqual(res.status_code, 201)
+
+        # 요청 중에는 outbox만 기록
+        self.assertFalse(Notification.objects.exists())
+        self.assertEqual(
+            sorted(NotificationOutbox.objects.values_list("type", flat=True)), ["comment", "post_like"],
+        )
+
+        call_command("run_notification_worker", "--once", stdout=StringIO())
+
+        self.assertFalse(NotificationOutbox.objects.exists())
+        self.assertEqual(
+            sorted(Notification.objects.filter(user=self.author).values_list("type", flat=True)),
+            ["comment", "post_like"],
+        )
+        self.assertEqual(Notification.objects.get(type="post_like").event_id, self.post.event_id)
@@ -1,7 +1,7 @@
-from django.core.paginator import Paginator
 from django.http import JsonResponse
 from .models import Notification
 from common.utils import common_response, login_check
+from common.pagination import CachedCountPaginator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_safe, require_http_methods 
 
@@ -36,8 +36,13 @@ def get_notification_list(request):
         type_param = (request.GET.get('type') or "").strip()
         if type_param and type_param in Notification.Type.values:
             qs = qs.filter(type=type_param)
+        else:
+            type_param = ""
 
-        paginator = Paginator(qs, size)
+        paginator = CachedCountPaginator(
+            qs, size, namespace=f"notifications:{user_id}", endpoint="get_notification_list",
+            filters={"user_id": user_id, "type": type_param},
+        )
         page_obj = paginator.get_page(page)
 
         data = {
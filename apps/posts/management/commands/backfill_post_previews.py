@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+from django.db.models.functions import Substr
+
+from posts.models import CONTENT_PREVIEW_LENGTH, Post
+
+
+class Command(BaseCommand):
+    help = "게시글 목록용 미리보기(content_preview)를 content로부터 다시 채움"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="post_id 구간 크기 (UPDATE 1번당)")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = Post.objects.aggregate(m=Max("post_id"))["m"] or 0
+
+        total = 0
+        # post_id 구간별 UPDATE (긴 트랜잭션/테이블 잠금 방지)
+        for start in range(0, last_id + 1, batch_size):
+            total += Post.objects.filter(post_id__gte=start, post_id__lt=start + batch_size).update(
+                content_preview=Substr("content", 1, CONTENT_PREVIEW_LENGTH),
+            )
+        self.stdout.write(self.style.SUCCESS(f"미리보기 {total}건 갱신 완료"))
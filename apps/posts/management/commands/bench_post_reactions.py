@@ -0,0 +1,81 @@
+# 단일 게시글 좋아요 처리량 측정 (워커 스레드 수별 likes/sec)
+## 벤치용 공연/게시글/유저를 만들고 끝나면 삭제 -> 운영 DB에서 실행 금지
+import datetime
+import threading
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from events.models import Event
+from posts.models import Post, PostReaction, ReactionType
+from posts.services import ReactionConflict, fold_reaction_deltas, toggle_post_reaction
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "단일 게시글 좋아요 동시 처리량 벤치마크 (워커 수별 likes/sec)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+        parser.add_argument("--likes", type=int, default=400, help="워커 수별 실행마다 좋아요 수 (유저 수)")
+
+    def handle(self, *args, **options):
+        if connection.vendor == "sqlite":
+            self.stderr.write("SQLite는 쓰기가 직렬화되어 워커 수에 따른 확장이 측정되지 않습니다.")
+
+        tag = uuid.uuid4().hex[:8]
+        event = Event.objects.create(
+            kopis_id=f"BENCH{tag}", title="bench", start_date=datetime.date.today(), end_date=datetime.date.today(),
+        )
+        User.objects.bulk_create([
+            User(email=f"bench-{tag}-{i}@example.com", nickname=f"bench{tag}{i}", provider="bench", provider_id=f"{tag}-{i}")
+            for i in range(options["likes"])
+        ])
+        users = list(User.objects.filter(provider="bench", provider_id__startswith=f"{tag}-"))
+
+        try:
+            for workers in options["workers"]:
+                self._run(event, users, workers)
+        finally:
+            event.delete()
+            User.objects.filter(provider="bench", provider_id__startswith=f"{tag}-").delete()
+
+    def _run(self, event, users, workers):
+        post = Post.objects.create(event=event, user=users[0], category="정보", title="bench", content="bench")
+        chunks = [users[i::workers] for i in range(workers)]
+        errors = []
+
+        def work(chunk):
+            try:
+                for user in chunk:
+                    try:
+                        toggle_post_reaction(post.post_id, user.user_id, ReactionType.LIKE)
+                    except ReactionConflict:
+                        errors.append(user.user_id)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=work, args=(chunk,)) for chunk in chunks]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+
+        while fold_reaction_deltas():
+            pass
+        post.refresh_from_db()
+        reactions = PostReaction.objects.filter(post=post).count()
+        if post.like_count != reactions:
+            raise CommandError(f"like_count 불일치: {post.like_count} != {reactions}")
+
+        self.stdout.write(
+            f"workers={workers:<3} likes={reactions:<6} {reactions / elapsed:,.0f} likes/s"
+            f" ({elapsed:.2f}s, 충돌 {len(errors)}건)"
+        )
+        post.delete()
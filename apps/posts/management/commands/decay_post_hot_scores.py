@@ -0,0 +1,16 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts.services import decay_hot_scores
+
+
+class Command(BaseCommand):
+    help = "게시글 hot_score 시간 감쇠 반영 (주기 실행, 예: 10분마다)"
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        updated = decay_hot_scores()
+        self.stdout.write(self.style.SUCCESS(
+            f"hot_score {updated}건 갱신 ({time.monotonic() - started:.2f}s)"
+        ))
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from posts.services import fold_reaction_deltas
+
+
+class Command(BaseCommand):
+    help = "리액션 증감 로그(post_reaction_deltas)를 like_count/dislike_count에 반영 (운영 필수 워커)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--interval", type=float, default=0,
+            help="반영 주기(초), 0이면 쌓인 로그만 반영하고 종료 (cron용)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        interval = options["interval"]
+        total = 0
+        try:
+            while True:
+                close_old_connections()
+                folded = fold_reaction_deltas(limit=batch_size)
+                total += folded
+                if folded < batch_size:
+                    if interval <= 0:
+                        break
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"증감 로그 {total}건 반영 완료"))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from posts.models import Post
+from posts.services import reconcile_comment_counts
+
+
+class Command(BaseCommand):
+    help = "게시글 comment_count를 comments 실제 개수로 보정 (주기 실행, 예: 하루 1번)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="post_id 구간 크기 (보정 쿼리 1번당)")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = Post.objects.aggregate(m=Max("post_id"))["m"] or 0
+
+        total = 0
+        for start in range(0, last_id + 1, batch_size):
+            total += len(reconcile_comment_counts(start, start + batch_size))
+        self.stdout.write(self.style.SUCCESS(f"comment_count {total}건 보정 완료"))
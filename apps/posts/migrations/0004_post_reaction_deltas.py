@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 15:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0003_list_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostReactionDelta',
+            fields=[
+                ('delta_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('like_delta', models.SmallIntegerField(default=0)),
+                ('dislike_delta', models.SmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('post', models.ForeignKey(db_column='post_id', on_delete=django.db.models.deletion.CASCADE, related_name='reaction_deltas', to='posts.post')),
+            ],
+            options={
+                'db_table': 'post_reaction_deltas',
+                'indexes': [models.Index(fields=['post'], name='post_reacti_post_id_b400e1_idx')],
+            },
+        ),
+    ]
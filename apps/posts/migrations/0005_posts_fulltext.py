@@ -0,0 +1,66 @@
+# 게시글 전문 검색 인덱스 (posts/search.py)
+## MySQL: FULLTEXT (ngram 파서) / MariaDB: FULLTEXT (기본 파서) / SQLite: FTS5 trigram + 트리거
+## DDL은 마이그레이션 시점의 고정본 (posts/search.py가 바뀌어도 이 마이그레이션은 그대로)
+
+from django.db import OperationalError, migrations
+
+FULLTEXT_INDEX = 'posts_fulltext_idx'
+
+SQLITE_FTS_TABLE = (
+    "CREATE VIRTUAL TABLE posts_fts USING fts5("
+    "title, content, content='posts', content_rowid='post_id', tokenize='trigram')"
+)
+
+SQLITE_FTS_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content)
+        VALUES ('delete', old.post_id, old.title, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content)
+        VALUES ('delete', old.post_id, old.title, old.content);
+        INSERT INTO posts_fts(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+]
+
+
+def create_search_index(apps, schema_editor):
+    conn = schema_editor.connection
+    if conn.vendor == 'sqlite':
+        with conn.cursor() as cursor:
+            try:
+                cursor.execute(SQLITE_FTS_TABLE)
+            except OperationalError:
+                # FTS5/trigram 미지원 SQLite: 인덱스 없이 icontains 폴백
+                return
+            for sql in SQLITE_FTS_TRIGGERS:
+                cursor.execute(sql)
+            cursor.execute("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+    elif conn.vendor == 'mysql':
+        parser = '' if conn.mysql_is_mariadb else ' WITH PARSER ngram'
+        schema_editor.execute(f'CREATE FULLTEXT INDEX {FULLTEXT_INDEX} ON posts (title, content){parser}')
+
+
+def drop_search_index(apps, schema_editor):
+    conn = schema_editor.connection
+    if conn.vendor == 'sqlite':
+        with conn.cursor() as cursor:
+            for suffix in ('ai', 'ad', 'au'):
+                cursor.execute(f'DROP TRIGGER IF EXISTS posts_fts_{suffix}')
+            cursor.execute('DROP TABLE IF EXISTS posts_fts')
+    elif conn.vendor == 'mysql':
+        schema_editor.execute(f'DROP INDEX {FULLTEXT_INDEX} ON posts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0004_post_reaction_deltas'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
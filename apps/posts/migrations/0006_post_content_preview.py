@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-18 15:51
+
+from django.db import migrations, models
+from django.db.models.functions import Substr
+
+
+def backfill_content_preview(apps, schema_editor):
+    Post = apps.get_model('posts', 'Post')
+    Post.objects.update(content_preview=Substr('content', 1, 250))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0005_posts_fulltext'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_preview',
+            field=models.CharField(blank=True, default='', max_length=250),
+        ),
+        migrations.RunPython(backfill_content_preview, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 15:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_event_calendar_months'),
+        ('posts', '0006_post_content_preview'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['event', 'created_at', 'post_id'], name='posts_event_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['event', 'like_count', 'created_at', 'post_id'], name='posts_event_popular_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['event', 'views', 'created_at', 'post_id'], name='posts_event_views_idx'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 6.0 on 2026-10-18 15:53
+
+import datetime
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+# 마이그레이션 시점의 hot_score 공식 고정본 (posts.services.compute_hot_score가 바뀌어도 이 마이그레이션은 그대로)
+## 이후 공식 변경은 decay_post_hot_scores가 다음 주기에 반영
+def _hot_score(likes, dislikes, views, comments, created_at, now, gravity):
+    points = max(1 + (likes or 0) - 0.5 * (dislikes or 0) + 2 * (comments or 0) + 0.05 * (views or 0), 0)
+    age_hours = max((now - created_at).total_seconds(), 0) / 3600
+    return points / (age_hours + 2) ** gravity
+
+
+def backfill_hot_score(apps, schema_editor):
+    # 윈도우(POST_HOT_WINDOW_DAYS) 안의 게시글만 점수 계산, 나머지는 기본값 0
+    Post = apps.get_model('posts', 'Post')
+    now = timezone.now()
+    since = now - datetime.timedelta(days=getattr(settings, 'POST_HOT_WINDOW_DAYS', 14))
+    gravity = getattr(settings, 'POST_HOT_GRAVITY', 1.5)
+    rows = (
+        Post.objects.filter(created_at__gte=since).order_by()
+        .annotate(n_comments=Count('comments'))
+        .values_list('post_id', 'like_count', 'dislike_count', 'views', 'n_comments', 'created_at')
+    )
+    batch = []
+    for post_id, likes, dislikes, views, comments, created_at in rows.iterator(chunk_size=1000):
+        batch.append(Post(post_id=post_id, hot_score=_hot_score(likes, dislikes, views, comments, created_at, now, gravity)))
+        if len(batch) >= 1000:
+            Post.objects.bulk_update(batch, ['hot_score'])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ['hot_score'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_event_calendar_months'),
+        ('posts', '0007_event_post_sort_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='hot_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.RunPython(backfill_hot_score, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['hot_score', 'created_at', 'post_id'], name='posts_hot_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['event', 'hot_score', 'created_at', 'post_id'], name='posts_event_hot_idx'),
+        ),
+    ]
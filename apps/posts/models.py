@@ -3,6 +3,8 @@ from django.conf import settings
 
 # Create your models here.
 
+CONTENT_PREVIEW_LENGTH = 250
+
 class Post(models.Model):
     post_id = models.BigAutoField(primary_key=True)
 
@@ -25,6 +27,8 @@ class Post(models.Model):
 
     title = models.CharField(max_length=255)
     content = models.TextField()
+    # 목록용 본문 미리보기 (content 앞 250자, 저장 시 signals에서 갱신) -> 목록 조회는 content를 읽지 않음
+    content_preview = models.CharField(max_length=CONTENT_PREVIEW_LENGTH, blank=True, default="")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -32,6 +36,10 @@ class Post(models.Model):
     like_count = models.IntegerField(default=0)
     dislike_count = models.IntegerField(default=0)
     views = models.IntegerField(default=0)
+    # 댓글 수 (comment_create/comment_detail DELETE에서 증감, 어긋나면 reconcile_post_comment_counts)
+    comment_count = models.IntegerField(default=0)
+    # sort=hot 점수 (반응/댓글/조회수 + 경과 시간, posts.services에서 갱신)
+    hot_score = models.FloatField(default=0)
 
     # 260107: 게시판 이미지 추가 기능 미팅에 따라 추가
     # [ERD v3 최신 반영]
@@ -43,6 +51,16 @@ class Post(models.Model):
             models.Index(fields=["event"]),
             models.Index(fields=["user"]),
             models.Index(fields=["category"]),
+            # posts_list 정렬별 인덱스 (최신/인기/조회수)
+            models.Index(fields=["created_at", "post_id"], name="posts_latest_idx"),
+            models.Index(fields=["like_count", "created_at", "post_id"], name="posts_popular_idx"),
+            models.Index(fields=["views", "created_at", "post_id"], name="posts_views_idx"),
+            models.Index(fields=["hot_score", "created_at", "post_id"], name="posts_hot_idx"),
+            # event_posts_list 정렬별 인덱스 (공연별 최신/인기/조회수, cursor 모드 range scan)
+            models.Index(fields=["event", "created_at", "post_id"], name="posts_event_latest_idx"),
+            models.Index(fields=["event", "like_count", "created_at", "post_id"], name="posts_event_popular_idx"),
+            models.Index(fields=["event", "views", "created_at", "post_id"], name="posts_event_views_idx"),
+            models.Index(fields=["event", "hot_score", "created_at", "post_id"], name="posts_event_hot_idx"),
         ]
 
     def __str__(self):
@@ -76,6 +94,8 @@ class Comment(models.Model):
             models.Index(fields=["post"]),
             models.Index(fields=["user"]),
             models.Index(fields=["created_at"]),
+            # post_comments_list: post_id 필터 + (created_at, comment_id) 정렬/cursor range scan
+            models.Index(fields=["post", "created_at", "comment_id"], name="comments_post_created_idx"),
         ]
 
     def __str__(self):
@@ -121,6 +141,32 @@ class PostReaction(models.Model):
         return f"PostReaction({self.reaction_id}) user_id={self.user_id} post_id={self.post_id} type={self.type}"
     
 
+# 리액션 증감 로그 (append-only)
+## 리액션 토글은 Post 행을 잠그지 않고 여기에 증감만 INSERT -> fold_reaction_deltas가 모아서 like_count/dislike_count에 반영
+class PostReactionDelta(models.Model):
+    delta_id = models.BigAutoField(primary_key=True)
+
+    post = models.ForeignKey(
+        "posts.Post",
+        on_delete=models.CASCADE,
+        db_column="post_id",
+        related_name="reaction_deltas",
+    )
+
+    like_delta = models.SmallIntegerField(default=0)
+    dislike_delta = models.SmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "post_reaction_deltas"
+        indexes = [
+            models.Index(fields=["post"]),
+        ]
+
+    def __str__(self):
+        return f"PostReactionDelta({self.delta_id}) post_id={self.post_id} like={self.like_delta} dislike={self.dislike_delta}"
+
+
 class Report(models.Model):
     report_id = models.BigAutoField(primary_key=True)
 
@@ -0,0 +1,171 @@
+# 설명: 게시글 전문 검색 백엔드 (posts_list / event_posts_list의 search=)
+## - MySQL/MariaDB: posts(title, content) FULLTEXT 인덱스 + MATCH ... AGAINST (BOOLEAN MODE)
+##     MySQL은 ngram 파서(2글자 단위), MariaDB는 ngram 파서가 없어 기본 파서(단어 단위, 접두사 검색)
+## - SQLite: FTS5(trigram) external content 테이블 posts_fts (트리거로 posts와 동기화)
+## - 인덱스로 찾을 수 없는 짧은 검색어 / 그 외 DB: icontains 폴백
+## - 모든 백엔드가 search_score(클수록 관련도 높음)를 annotate -> sort=relevance
+import functools
+
+from django.conf import settings
+from django.db import OperationalError, connection
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+POSTS_FTS_TABLE = "posts_fts"
+POSTS_FULLTEXT_INDEX = "posts_fulltext_idx"
+
+# bm25/MATCH 점수 계산 시 제목 가중치 (본문 1 기준)
+TITLE_WEIGHT = 2.0
+
+
+def _terms(search: str) -> list:
+    # 검색어를 공백 기준 단어로 (따옴표 등 쿼리 문법 문자 제거)
+    return [t for t in (w.strip('"*+-<>()~@') for w in search.split()) if t]
+
+
+class IcontainsSearchBackend:
+    """
+    title/content LIKE '%검색어%' (인덱스 없음, 폴백용)
+    """
+
+    def apply(self, qs, search: str):
+        return qs.filter(Q(title__icontains=search) | Q(content__icontains=search)).annotate(
+            search_score=Case(
+                When(title__icontains=search, then=Value(TITLE_WEIGHT)),
+                default=Value(1.0),
+                output_field=FloatField(),
+            )
+        )
+
+
+class SQLiteFTS5SearchBackend:
+    # trigram 토크나이저는 3글자 미만 단어를 찾지 못함
+    MIN_TERM_LENGTH = 3
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def apply(self, qs, search: str):
+        terms = _terms(search)
+        if not terms or min(len(t) for t in terms) < self.MIN_TERM_LENGTH:
+            return self.fallback.apply(qs, search)
+
+        # 단어별 phrase를 AND (FTS5 문법: 큰따옴표 안의 " 는 "" 로)
+        match = " AND ".join('"{}"'.format(t.replace('"', '""')) for t in terms)
+        post_id = f"{connection.ops.quote_name(qs.model._meta.db_table)}.{connection.ops.quote_name('post_id')}"
+        # bm25는 작을수록 관련도 높음 -> 부호 반전
+        score = RawSQL(
+            f"SELECT -bm25({POSTS_FTS_TABLE}, %s, 1.0) FROM {POSTS_FTS_TABLE} "
+            f"WHERE {POSTS_FTS_TABLE} MATCH %s AND {POSTS_FTS_TABLE}.rowid = {post_id}",
+            (TITLE_WEIGHT, match),
+            output_field=FloatField(),
+        )
+        matched = RawSQL(f"SELECT rowid FROM {POSTS_FTS_TABLE} WHERE {POSTS_FTS_TABLE} MATCH %s", (match,))
+        return qs.filter(post_id__in=matched).annotate(search_score=score)
+
+
+class MySQLFulltextSearchBackend:
+    def __init__(self, fallback, ngram: bool, min_term_length: int):
+        self.fallback = fallback
+        self.ngram = ngram
+        self.min_term_length = min_term_length
+
+    def apply(self, qs, search: str):
+        terms = _terms(search)
+        if not terms or min(len(t) for t in terms) < self.min_term_length:
+            return self.fallback.apply(qs, search)
+
+        # ngram: 단어를 phrase로 (연속 2글자 토큰 순서 일치) / 기본 파서: 접두사 일치 (조사 붙은 단어 대응)
+        if self.ngram:
+            against = " ".join('+"{}"'.format(t.replace('"', "")) for t in terms)
+        else:
+            against = " ".join(f"+{t}*" for t in terms)
+
+        table = connection.ops.quote_name(qs.model._meta.db_table)
+        score = RawSQL(
+            f"MATCH ({table}.`title`, {table}.`content`) AGAINST (%s IN BOOLEAN MODE)",
+            (against,),
+            output_field=FloatField(),
+        )
+        return qs.annotate(search_score=score).filter(search_score__gt=0)
+
+
+# ---------------------------------------------------------------------------
+# SQLite FTS 트리거 재확인 (post_migrate)
+## 최초 생성은 migrations/0005_posts_fulltext (DDL 고정본, 여기를 바꾸면 같이 확인)
+# ---------------------------------------------------------------------------
+
+_SQLITE_FTS_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS {POSTS_FTS_TABLE}_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO {POSTS_FTS_TABLE}(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {POSTS_FTS_TABLE}_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO {POSTS_FTS_TABLE}({POSTS_FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.post_id, old.title, old.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {POSTS_FTS_TABLE}_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO {POSTS_FTS_TABLE}({POSTS_FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.post_id, old.title, old.content);
+        INSERT INTO {POSTS_FTS_TABLE}(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+]
+
+
+def ensure_sqlite_fts(conn, create: bool = True) -> None:
+    """
+    posts_fts 가상 테이블 + 동기화 트리거
+    - SQLite는 ALTER 시 테이블을 다시 만들면서 트리거가 사라지므로 migrate 후마다 트리거 재확인 (create=False)
+    - FTS5/trigram을 지원하지 않는 SQLite면 생성하지 않음 (icontains 폴백)
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [POSTS_FTS_TABLE])
+        exists = cursor.fetchone() is not None
+        if not exists:
+            if not create:
+                return
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE {POSTS_FTS_TABLE} USING fts5("
+                    "title, content, content='posts', content_rowid='post_id', tokenize='trigram')"
+                )
+            except OperationalError:
+                return
+        for sql in _SQLITE_FTS_TRIGGERS:
+            cursor.execute(sql)
+        if not exists:
+            cursor.execute(f"INSERT INTO {POSTS_FTS_TABLE}({POSTS_FTS_TABLE}) VALUES ('rebuild')")
+    _sqlite_fts_available.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _sqlite_fts_available() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [POSTS_FTS_TABLE])
+        return cursor.fetchone() is not None
+
+
+def get_post_search_backend():
+    """
+    POST_SEARCH_BACKEND: auto(기본, DB에 맞춰 선택) | icontains
+    """
+    fallback = IcontainsSearchBackend()
+    if getattr(settings, "POST_SEARCH_BACKEND", "auto") == "icontains":
+        return fallback
+
+    if connection.vendor == "sqlite" and _sqlite_fts_available():
+        return SQLiteFTS5SearchBackend(fallback)
+    if connection.vendor == "mysql":
+        # MariaDB 기본 파서는 innodb_ft_min_token_size(기본 3)보다 짧은 단어를 색인하지 않음
+        return MySQLFulltextSearchBackend(
+            fallback,
+            ngram=not connection.mysql_is_mariadb,
+            min_term_length=3 if connection.mysql_is_mariadb else 2,
+        )
+    return fallback
+
+
+def apply_post_search(qs, search: str):
+    """
+    Post QuerySet에 검색 필터 + search_score annotate
+    """
+    return get_post_search_backend().apply(qs, search)
@@ -0,0 +1,311 @@
+# 설명: 게시글 쓰기 부하 분산
+## 1) 조회수 write-behind 버퍼
+##    post_detail GET마다 UPDATE 하지 않고 프로세스 메모리에 누적 -> 주기적으로 게시글별 UPDATE 1번
+##    응답의 views = DB 값 + 이 프로세스에서 아직 반영 안 된 증가분
+##    프로세스 비정상 종료 시 최대 POST_VIEW_FLUSH_INTERVAL초 / POST_VIEW_MAX_PENDING회 분량 유실 가능
+## 2) 리액션(좋아요/싫어요) 토글: Post 행 잠금 없이 증감 로그(post_reaction_deltas)에 INSERT
+##    동시성 제어는 PostReaction (user, post) 유니크 제약 하나뿐, 카운트는 fold_reaction_deltas가 모아서 반영
+##    반영은 fold_post_reactions 워커(필수, docker-compose의 post-worker)가 담당
+## 3) hot_score (sort=hot): 카운트가 바뀐 게시글만 재계산 + 주기적 감쇠(decay_post_hot_scores)
+## 4) comment_count 보정 (reconcile_post_comment_counts)
+import atexit
+import datetime
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Comment, Post, PostReaction, PostReactionDelta, ReactionType
+
+logger = logging.getLogger(__name__)
+
+
+class PostViewBuffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._flushing = {}
+        self._total = 0
+        self._pid = None
+
+    @staticmethod
+    def _interval() -> float:
+        return getattr(settings, "POST_VIEW_FLUSH_INTERVAL", 0)
+
+    def add(self, post_id: int) -> None:
+        # 주기 0이면 기존처럼 즉시 UPDATE
+        if self._interval() <= 0:
+            Post.objects.filter(post_id=post_id).update(views=F("views") + 1)
+            return
+
+        self._ensure_flusher()
+        with self._lock:
+            self._pending[post_id] = self._pending.get(post_id, 0) + 1
+            self._total += 1
+            full = self._total >= getattr(settings, "POST_VIEW_MAX_PENDING", 1000)
+        if full:
+            self.flush()
+
+    def pending(self, post_id: int) -> int:
+        # 반영 중(flush 트랜잭션 커밋 전)인 분량까지 포함
+        with self._lock:
+            return self._pending.get(post_id, 0) + self._flushing.get(post_id, 0)
+
+    def flush(self) -> int:
+        """
+        누적분을 게시글별 UPDATE 1번으로 반영, 반환: 반영한 게시글 수
+        """
+        with self._lock:
+            if not self._pending or self._flushing:
+                return 0
+            batch = self._flushing = self._pending
+            self._pending = {}
+            self._total = 0
+
+        try:
+            with transaction.atomic():
+                # 여러 프로세스가 동시에 flush해도 같은 순서로 잠금 (데드락 방지)
+                for post_id in sorted(batch):
+                    Post.objects.filter(post_id=post_id).update(views=F("views") + batch[post_id])
+        except DatabaseError:
+            logger.exception("조회수 반영 실패 (다음 주기에 재시도)")
+            with self._lock:
+                for post_id, n in batch.items():
+                    self._pending[post_id] = self._pending.get(post_id, 0) + n
+                    self._total += n
+                self._flushing = {}
+            return 0
+
+        # 커밋 직후 바로 비움 (_flushing은 항상 잠금 안에서 교체)
+        with self._lock:
+            self._flushing = {}
+        refresh_hot_scores(list(batch))
+        return len(batch)
+
+    def _ensure_flusher(self) -> None:
+        # 프로세스당 1개 (gunicorn fork 후에도 워커마다 새로 시작)
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._pending, self._flushing, self._total = {}, {}, 0
+            threading.Thread(target=self._run, name="posts-write-behind", daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(max(self._interval(), 0.1))
+            try:
+                self.flush()
+            except Exception:
+                # 어떤 예외든 스레드가 죽으면 이 프로세스의 조회수는 MAX_PENDING 도달 시에만 반영됨
+                logger.exception("조회수 반영 실패 (다음 주기에 재시도)")
+            finally:
+                connection.close()
+
+
+post_view_buffer = PostViewBuffer()
+
+# 정상 종료 시 남은 분량 반영
+atexit.register(post_view_buffer.flush)
+
+
+# ---------------------------------------------------------------------------
+# 리액션 토글 / 카운트
+# ---------------------------------------------------------------------------
+
+class ReactionConflict(Exception):
+    pass
+
+
+def _reaction_delta(reaction_type: str, n: int) -> dict:
+    if reaction_type == ReactionType.LIKE:
+        return {"like_delta": n}
+    return {"dislike_delta": n}
+
+
+def toggle_post_reaction(post_id: int, user_id: int, target_type: str):
+    """
+    반환: 처리 후 내 리액션 (target_type 또는 None=취소)
+    - 없으면 생성 / 같은 반응이면 취소 / 다른 반응이면 전환
+    - Post 행은 잠그지 않음, 같은 유저의 동시 요청이 엇갈리면 ReactionConflict
+    """
+    with transaction.atomic():
+        try:
+            # 유니크 제약(user, post)이 유일한 직렬화 지점
+            with transaction.atomic():
+                PostReaction.objects.create(post_id=post_id, user_id=user_id, type=target_type)
+            new_state, delta = target_type, _reaction_delta(target_type, 1)
+        except IntegrityError:
+            reactions = PostReaction.objects.filter(post_id=post_id, user_id=user_id)
+            if reactions.filter(type=target_type).delete()[0]:
+                new_state, delta = None, _reaction_delta(target_type, -1)
+            elif reactions.exclude(type=target_type).update(type=target_type):
+                old_type = ReactionType.DISLIKE if target_type == ReactionType.LIKE else ReactionType.LIKE
+                new_state = target_type
+                delta = {**_reaction_delta(old_type, -1), **_reaction_delta(target_type, 1)}
+            else:
+                # 그 사이 다른 요청이 리액션을 지움
+                raise ReactionConflict()
+
+        PostReactionDelta.objects.create(post_id=post_id, **delta)
+    return new_state
+
+
+def with_reaction_counts(qs):
+    """
+    Post QuerySet에 like_total/dislike_total annotate (반영 전 증감 로그 포함)
+    """
+    pending = (
+        PostReactionDelta.objects.filter(post_id=OuterRef("post_id"))
+        .order_by().values("post_id")
+    )
+    return qs.annotate(
+        like_total=F("like_count") + Coalesce(Subquery(pending.annotate(n=Sum("like_delta")).values("n")), Value(0)),
+        dislike_total=F("dislike_count") + Coalesce(Subquery(pending.annotate(n=Sum("dislike_delta")).values("n")), Value(0)),
+    )
+
+
+def fold_reaction_deltas(limit: int = 5000) -> int:
+    """
+    증감 로그를 게시글별로 합산해 like_count/dislike_count에 반영하고 로그 삭제 (같은 트랜잭션)
+    반환: 반영한 로그 수
+    """
+    with transaction.atomic():
+        rows = list(
+            PostReactionDelta.objects.select_for_update(skip_locked=True)
+            .order_by("delta_id")
+            .values_list("delta_id", "post_id", "like_delta", "dislike_delta")[:limit]
+        )
+        if not rows:
+            return 0
+
+        totals = {}
+        for _, post_id, like_delta, dislike_delta in rows:
+            like, dislike = totals.get(post_id, (0, 0))
+            totals[post_id] = (like + like_delta, dislike + dislike_delta)
+
+        for post_id in sorted(totals):
+            like, dislike = totals[post_id]
+            if like or dislike:
+                Post.objects.filter(post_id=post_id).update(
+                    like_count=F("like_count") + like,
+                    dislike_count=F("dislike_count") + dislike,
+                )
+        PostReactionDelta.objects.filter(delta_id__in=[row[0] for row in rows]).delete()
+
+    refresh_hot_scores(list(totals))
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# hot_score (sort=hot)
+# - points = 1 + 좋아요 - 0.5 * 싫어요 + 2 * 댓글 + 0.05 * 조회수 (최소 0)
+# - hot_score = points / (경과 시간 + 2) ^ POST_HOT_GRAVITY  -> 시간이 지나면 내려감
+# - 반응/댓글/조회수 반영 시 해당 게시글만 재계산, 나머지는 decay_post_hot_scores가 주기적으로 재계산
+# - POST_HOT_WINDOW_DAYS보다 오래된 글은 0 (더 이상 재계산하지 않음)
+# ---------------------------------------------------------------------------
+
+HOT_LIKE_WEIGHT = 1.0
+HOT_DISLIKE_WEIGHT = 0.5
+HOT_COMMENT_WEIGHT = 2.0
+HOT_VIEW_WEIGHT = 0.05
+
+_HOT_BATCH_SIZE = 1000
+
+
+def compute_hot_score(like_count, dislike_count, views, comment_count, created_at, now=None) -> float:
+    now = now or timezone.now()
+    window = datetime.timedelta(days=getattr(settings, "POST_HOT_WINDOW_DAYS", 14))
+    if created_at is None or now - created_at > window:
+        return 0.0
+
+    points = max(
+        1
+        + HOT_LIKE_WEIGHT * (like_count or 0)
+        - HOT_DISLIKE_WEIGHT * (dislike_count or 0)
+        + HOT_COMMENT_WEIGHT * (comment_count or 0)
+        + HOT_VIEW_WEIGHT * (views or 0),
+        0,
+    )
+    age_hours = max((now - created_at).total_seconds(), 0) / 3600
+    return points / (age_hours + 2) ** getattr(settings, "POST_HOT_GRAVITY", 1.5)
+
+
+def _update_hot_scores(qs, now) -> int:
+    updated = 0
+    batch = []
+    rows = qs.order_by().values_list(
+        "post_id", "like_count", "dislike_count", "views", "comment_count", "created_at", "hot_score",
+    )
+    for post_id, likes, dislikes, views, comments, created_at, old in rows.iterator(chunk_size=_HOT_BATCH_SIZE):
+        score = compute_hot_score(likes, dislikes, views, comments, created_at, now)
+        if score != old:
+            batch.append(Post(post_id=post_id, hot_score=score))
+        if len(batch) >= _HOT_BATCH_SIZE:
+            Post.objects.bulk_update(batch, ["hot_score"])
+            updated += len(batch)
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ["hot_score"])
+        updated += len(batch)
+    return updated
+
+
+def refresh_hot_scores(post_ids) -> int:
+    """
+    반응/댓글/조회수가 바뀐 게시글의 hot_score 재계산
+    """
+    post_ids = list(post_ids)
+    if not post_ids:
+        return 0
+    return _update_hot_scores(Post.objects.filter(post_id__in=post_ids), timezone.now())
+
+
+def decay_hot_scores() -> int:
+    """
+    시간 경과 반영: 윈도우 안의 게시글 전체 재계산 + 윈도우를 벗어난 게시글 0으로
+    반환: 변경된 게시글 수
+    """
+    now = timezone.now()
+    since = now - datetime.timedelta(days=getattr(settings, "POST_HOT_WINDOW_DAYS", 14))
+    expired = Post.objects.filter(created_at__lt=since, hot_score__gt=0).update(hot_score=0)
+    return expired + _update_hot_scores(Post.objects.filter(created_at__gte=since), now)
+
+
+# ---------------------------------------------------------------------------
+# comment_count 보정
+# - 댓글 작성/삭제 API는 F() 증감으로 유지
+# - 유저 탈퇴(CASCADE) 등 API 밖에서 지워진 댓글은 반영되지 않으므로 주기적으로 실제 COUNT와 맞춤
+# ---------------------------------------------------------------------------
+
+def reconcile_comment_counts(start_id: int = 0, end_id: int = None) -> list:
+    """
+    post_id 구간 [start_id, end_id)의 comment_count를 comments 실제 개수로 보정
+    반환: 보정된 post_id 목록
+    """
+    qs = Post.objects.filter(post_id__gte=start_id)
+    if end_id is not None:
+        qs = qs.filter(post_id__lt=end_id)
+
+    actual = (
+        Comment.objects.filter(post_id=OuterRef("post_id"))
+        .order_by().values("post_id").annotate(n=Count("comment_id")).values("n")
+    )
+    drifted = list(
+        qs.annotate(actual=Coalesce(Subquery(actual), Value(0)))
+        .exclude(comment_count=F("actual"))
+        .values_list("post_id", flat=True)
+    )
+    if drifted:
+        # 조회 시점 이후 증감과 겹치지 않도록 UPDATE 안에서 다시 COUNT
+        Post.objects.filter(post_id__in=drifted).update(comment_count=Coalesce(Subquery(actual), Value(0)))
+        refresh_hot_scores(drifted)
+    return drifted
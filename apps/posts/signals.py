@@ -0,0 +1,49 @@
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from common.pagination import invalidate_counts
+from .models import CONTENT_PREVIEW_LENGTH, Comment, Post
+from .search import ensure_sqlite_fts
+from .services import compute_hot_score
+
+
+# 목록용 본문 미리보기 갱신 (update_fields 지정 저장은 content_preview도 함께 지정해야 반영됨)
+@receiver(pre_save, sender=Post)
+def set_content_preview(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance.content_preview = (instance.content or "")[:CONTENT_PREVIEW_LENGTH]
+
+
+# 새 글의 초기 hot_score (이후는 반응/댓글/조회수 반영 시 및 decay_post_hot_scores에서 갱신)
+@receiver(pre_save, sender=Post)
+def set_initial_hot_score(sender, instance, raw=False, **kwargs):
+    if raw or not instance._state.adding:
+        return
+    instance.hot_score = compute_hot_score(
+        instance.like_count, instance.dislike_count, instance.views, 0, instance.created_at or timezone.now(),
+    )
+
+
+# 목록 total_count 캐시 무효화 (posts_list / event_posts_list / post_comments_list)
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_counts(sender, instance, **kwargs):
+    invalidate_counts("posts")
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_counts(sender, instance, created=True, **kwargs):
+    # 수정(PATCH)은 개수 변화 없음
+    if created:
+        invalidate_counts(f"comments:{instance.post_id}")
+
+
+# SQLite: 마이그레이션이 posts 테이블을 다시 만들면 FTS 동기화 트리거가 사라지므로 재생성
+@receiver(post_migrate)
+def ensure_post_search_triggers(sender, using="default", **kwargs):
+    if sender.name == "posts" and connections[using].vendor == "sqlite":
+        ensure_sqlite_fts(connections[using], create=False)
@@ -1,3 +1,457 @@
-from django.test import TestCase
+import datetime
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from common.pagination import encode_cursor
+from common.testing import QueryPlanAssertionsMixin
+from common.utils import create_access_token
+from events.models import Event
+from users.models import User
+from .models import Comment, Post, PostReaction, PostReactionDelta, ReactionType
+from .services import (
+    PostViewBuffer,
+    decay_hot_scores,
+    fold_reaction_deltas,
+    post_view_buffer,
+    toggle_post_reaction,
+    with_reaction_counts,
+)
+from .views import COMMENT_ORDERING, _post_list_queryset
+
+
+class PostListQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    """
+    posts_list / event_posts_list 정렬별 쿼리가 정렬 인덱스를 타는지 (SQLite/MariaDB EXPLAIN)
+    - 뷰와 같은 _post_list_queryset으로 QuerySet 생성
+    - category/search 조건은 후보를 좁힌 뒤 정렬하므로 대상 아님
+    """
+
+    SORTS = ("latest", "popular", "views", "hot")
+
+    def _assert_sorts(self, **kwargs):
+        for sort in self.SORTS:
+            with self.subTest(sort=sort, **kwargs):
+                qs, _, ordering = _post_list_queryset(sort=sort, **kwargs)
+                self.assertIndexOrdered(qs.order_by(*ordering)[:10])
+
+    def test_posts_list_sorts_use_index_order(self):
+        self._assert_sorts()
+
+    def test_event_posts_list_sorts_use_index_order(self):
+        self._assert_sorts(event_id=1)
+
+
+class PostCursorPaginationTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        self.event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        for i in range(7):
+            Post.objects.create(
+                event=self.event, user=user, category="후기", title=f"글{i}", content="내용",
+                like_count=i % 3, views=i % 2,
+            )
+
+    def _walk(self, url, sort):
+        ids, cursor = [], ""
+        while True:
+            data = self.client.get(url, {"sort": sort, "size": 3, "cursor": cursor}).json()["data"]
+            ids += [p["post_id"] for p in data["posts"]]
+            if not data["has_next"]:
+                self.assertNotIn("total_count", data)
+                return ids
+            cursor = data["next_cursor"]
+
+    def test_cursor_pages_match_offset_order(self):
+        for url in ("/api/posts", f"/api/events/{self.event.event_id}/posts"):
+            for sort in ("latest", "popular", "views", "hot"):
+                with self.subTest(url=url, sort=sort):
+                    offset = self.client.get(url, {"sort": sort, "size": 100}).json()["data"]["posts"]
+                    self.assertEqual(self._walk(url, sort), [p["post_id"] for p in offset])
+
+    def test_tampered_cursor_is_rejected(self):
+        for url in ("/api/posts", f"/api/events/{self.event.event_id}/posts"):
+            for values in (["garbage", 4], [{"a": 1}, 4], ["2026-01-04", "x"]):
+                with self.subTest(url=url, values=values):
+                    res = self.client.get(url, {"sort": "latest", "cursor": encode_cursor("latest", values)})
+                    self.assertEqual(res.status_code, 400)
+
+        comments = f"/api/posts/{Post.objects.first().post_id}/comments"
+        res = self.client.get(comments, {"cursor": encode_cursor("comments", ["x", "y"])})
+        self.assertEqual(res.status_code, 400)
+
+    def test_cursor_from_other_sort_is_rejected(self):
+        data = self.client.get("/api/posts", {"sort": "latest", "size": 3, "cursor": ""}).json()["data"]
+        res = self.client.get("/api/posts", {"sort": "popular", "cursor": data["next_cursor"]})
+        self.assertEqual(res.status_code, 400)
+
+
+@override_settings(POST_VIEW_FLUSH_INTERVAL=3600, POST_VIEW_MAX_PENDING=100)
+class PostViewBufferTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.post = Post.objects.create(event=event, user=user, category="후기", title="제목", content="내용")
+
+    def tearDown(self):
+        post_view_buffer.flush()
+
+    def test_views_are_buffered_and_flushed(self):
+        for expected in (1, 2, 3):
+            res = self.client.get(f"/api/posts/{self.post.post_id}")
+            self.assertEqual(res.json()["data"]["views"], expected)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+
+        self.assertEqual(post_view_buffer.flush(), 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 3)
+        self.assertEqual(post_view_buffer.pending(self.post.post_id), 0)
+
+    def test_flushes_when_pending_limit_reached(self):
+        with self.settings(POST_VIEW_MAX_PENDING=2):
+            post_view_buffer.add(self.post.post_id)
+            post_view_buffer.add(self.post.post_id)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 2)
+
+    def test_missing_post(self):
+        self.assertEqual(self.client.get("/api/posts/999999").status_code, 404)
+
+
+class PostReactionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.post = Post.objects.create(event=event, user=self.user, category="후기", title="제목", content="내용")
+
+    def _counts(self):
+        p = with_reaction_counts(Post.objects.filter(pk=self.post.pk)).get()
+        return p.like_total, p.dislike_total
+
+    def test_toggle_switch_cancel_and_fold(self):
+        post_id, user_id = self.post.post_id, self.user.user_id
+
+        self.assertEqual(toggle_post_reaction(post_id, user_id, ReactionType.LIKE), ReactionType.LIKE)
+        self.assertEqual(self._counts(), (1, 0))
+        self.assertEqual(toggle_post_reaction(post_id, user_id, ReactionType.DISLIKE), ReactionType.DISLIKE)
+        self.assertEqual(self._counts(), (0, 1))
+        self.assertIsNone(toggle_post_reaction(post_id, user_id, ReactionType.DISLIKE))
+        self.assertEqual(self._counts(), (0, 0))
+        self.assertEqual(toggle_post_reaction(post_id, user_id, ReactionType.LIKE), ReactionType.LIKE)
+
+        # Post 행은 fold 전까지 그대로
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.like_count, self.post.dislike_count), (0, 0))
+
+        self.assertEqual(fold_reaction_deltas(), 4)
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.like_count, self.post.dislike_count), (1, 0))
+        self.assertFalse(PostReactionDelta.objects.exists())
+        self.assertEqual(self._counts(), (1, 0))
+        self.assertEqual(PostReaction.objects.get().type, ReactionType.LIKE)
+
+    @override_settings(POST_VIEW_FLUSH_INTERVAL=0)
+    def test_fold_command_works_without_view_buffer(self):
+        # 조회수 버퍼 스레드와 무관하게 워커 커맨드로 반영
+        toggle_post_reaction(self.post.post_id, self.user.user_id, ReactionType.LIKE)
+        out = StringIO()
+        call_command("fold_post_reactions", stdout=out)
+        self.assertIn("1건", out.getvalue())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 1)
+        self.assertFalse(PostReactionDelta.objects.exists())
+
+
+class PostSearchTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.body_hit = Post.objects.create(
+            event=event, user=user, category="후기", title="관람 후기", content="뮤지컬 시카고 재밌었어요",
+        )
+        self.title_hit = Post.objects.create(
+            event=event, user=user, category="정보", title="시카고 티켓 정보", content="오픈 일정 공유",
+        )
+        Post.objects.create(event=event, user=user, category="질문", title="질문", content="좌석 추천")
+
+    def _search(self, **params):
+        res = self.client.get("/api/posts", params)
+        self.assertEqual(res.status_code, 200)
+        return [p["post_id"] for p in res.json()["data"]["posts"]]
+
+    def test_relevance_prefers_title_match(self):
+        self.assertEqual(
+            self._search(search="시카고", sort="relevance"), [self.title_hit.post_id, self.body_hit.post_id],
+        )
+
+    def test_index_follows_update_and_delete(self):
+        self.title_hit.title = "티켓 정보"
+        self.title_hit.content = "오픈 일정"
+        self.title_hit.save()
+        self.assertEqual(self._search(search="시카고"), [self.body_hit.post_id])
+
+        self.body_hit.delete()
+        self.assertEqual(self._search(search="시카고"), [])
+
+    def test_short_query_falls_back_to_icontains(self):
+        self.assertEqual(self._search(search="좌석"), [Post.objects.get(title="질문").post_id])
+
+
+class PostContentPreviewTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        self.event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.post = Post.objects.create(event=self.event, user=user, category="후기", title="제목", content="가" * 1000)
+
+    def test_preview_saved_and_lists_skip_content(self):
+        self.assertEqual(self.post.content_preview, "가" * 250)
+
+        for url in ("/api/posts", f"/api/events/{self.event.event_id}/posts"):
+            with self.subTest(url=url), CaptureQueriesContext(connection) as ctx:
+                res = self.client.get(url)
+            self.assertEqual(res.status_code, 200)
+            self.assertFalse(any('"posts"."content",' in q["sql"] or '"posts"."content" ' in q["sql"]
+                                 for q in ctx.captured_queries))
+
+        self.assertEqual(self.client.get("/api/posts").json()["data"]["posts"][0]["content"], "가" * 250)
+
+
+    def test_event_list_skips_preview(self):
+        # 공연별 목록 응답에는 본문/미리보기가 없으므로 content_preview도 읽지 않음
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(f"/api/events/{self.event.event_id}/posts")
+        self.assertNotIn("content", res.json()["data"]["posts"][0])
+        self.assertFalse(any('"posts"."content_preview"' in q["sql"] for q in ctx.captured_queries))
+
+class PostHotScoreTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        self.event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.posts = [
+            Post.objects.create(event=self.event, user=self.user, category="후기", title=f"글{i}", content="내용")
+            for i in range(3)
+        ]
+
+    def _hot_ids(self):
+        data = self.client.get("/api/posts", {"sort": "hot", "size": 10}).json()["data"]
+        return [p["post_id"] for p in data["posts"]]
+
+    def test_reactions_and_comments_raise_score(self):
+        old, liked, commented = self.posts
+        self.assertGreater(old.hot_score, 0)
+
+        toggle_post_reaction(liked.post_id, self.user.user_id, ReactionType.LIKE)
+        fold_reaction_deltas()
+        res = self.client.post(
+            f"/api/posts/{commented.post_id}/comments", data={"content": "댓글"}, content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {create_access_token(self.user.user_id)}",
+        )
+        self.assertEqual(res.status_code, 201)
+
+        self.assertEqual(self._hot_ids()[0], commented.post_id)
+        self.assertEqual(self._hot_ids()[1], liked.post_id)
+
+    def test_decay_lowers_old_posts_and_expires_outside_window(self):
+        old, recent, expired = self.posts
+        Post.objects.filter(pk=old.pk).update(created_at=old.created_at - datetime.timedelta(days=3))
+        Post.objects.filter(pk=expired.pk).update(created_at=old.created_at - datetime.timedelta(days=30))
+
+        self.assertGreaterEqual(decay_hot_scores(), 2)
+        scores = dict(Post.objects.values_list("post_id", "hot_score"))
+        self.assertLess(scores[old.post_id], scores[recent.post_id])
+        self.assertEqual(scores[expired.post_id], 0)
+        self.assertEqual(self._hot_ids()[0], recent.post_id)
+
+
+# 조회수 버퍼를 다른 테스트와 공유하지 않도록 즉시 반영
+@override_settings(POST_VIEW_FLUSH_INTERVAL=0)
+class PostCommentCountTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        self.event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.post = Post.objects.create(event=self.event, user=self.user, category="후기", title="제목", content="내용")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user.user_id)}"}
+
+    def _counts(self):
+        return [
+            self.client.get("/api/posts").json()["data"]["posts"][0]["comment_count"],
+            self.client.get(f"/api/events/{self.event.event_id}/posts").json()["data"]["posts"][0]["comment_count"],
+            self.client.get(f"/api/posts/{self.post.post_id}").json()["data"]["comment_count"],
+        ]
+
+    def test_create_and_delete_maintain_count(self):
+        ids = []
+        for _ in range(2):
+            res = self.client.post(
+                f"/api/posts/{self.post.post_id}/comments", data={"content": "댓글"},
+                content_type="application/json", **self.auth,
+            )
+            ids.append(res.json()["data"]["comment_id"])
+        self.assertEqual(self._counts(), [2, 2, 2])
+
+        self.assertEqual(self.client.delete(f"/api/comments/{ids[0]}", **self.auth).status_code, 200)
+        self.assertEqual(self.client.delete(f"/api/comments/{ids[0]}", **self.auth).status_code, 404)
+        self.assertEqual(self._counts(), [1, 1, 1])
+
+    def test_reconcile_fixes_drift(self):
+        # API를 거치지 않은 댓글 생성/삭제
+        Comment.objects.create(post=self.post, user=self.user, content="댓글")
+        Comment.objects.create(post=self.post, user=self.user, content="댓글")
+        Post.objects.filter(pk=self.post.pk).update(comment_count=5)
+
+        out = StringIO()
+        call_command("reconcile_post_comment_counts", stdout=out)
+        self.assertIn("1건", out.getvalue())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 2)
+
+
+class CommentCursorTests(QueryPlanAssertionsMixin, TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="a@example.com", nickname="a", provider="kakao", provider_id="1")
+        event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.post = Post.objects.create(event=event, user=user, category="후기", title="제목", content="내용")
+        self.comments = [Comment.objects.create(post=self.post, user=user, content=f"댓글{i}") for i in range(5)]
+        self.url = f"/api/posts/{self.post.post_id}/comments"
+
+    def _get(self, **params):
+        res = self.client.get(self.url, {"size": 2, **params})
+        self.assertEqual(res.status_code, 200)
+        return res.json()["data"]
+
+    def _ids(self, data):
+        return [c["comment_id"] for c in data["comments"]]
+
+    def test_walk_older_then_newer(self):
+        newest_first = [c.comment_id for c in reversed(self.comments)]
+
+        first = self._get(cursor="")
+        self.assertEqual(self._ids(first), newest_first[:2])
+        self.assertFalse(first["has_prev"])
+        second = self._get(cursor=first["next_cursor"])
+        self.assertEqual(self._ids(second), newest_first[2:4])
+        self.assertTrue(second["has_prev"])
+
+        # 두 번째 페이지에서 다시 새 방향으로
+        back = self._get(cursor=second["prev_cursor"], direction="prev")
+        self.assertEqual(self._ids(back), newest_first[:2])
+        self.assertFalse(back["has_prev"])
+
+        # 새 댓글이 없으면 빈 목록 + 같은 prev_cursor로 다시 polling
+        empty = self._get(cursor=first["prev_cursor"], direction="prev")
+        self.assertEqual(empty["comments"], [])
+        self.assertEqual(empty["prev_cursor"], first["prev_cursor"])
+
+        new = Comment.objects.create(post=self.post, user=self.post.user, content="새 댓글")
+        self.assertEqual(self._ids(self._get(cursor=empty["prev_cursor"], direction="prev")), [new.comment_id])
+
+    def test_empty_thread_returns_pollable_prev_cursor(self):
+        Comment.objects.filter(post=self.post).delete()
+        first = self._get(cursor="")
+        self.assertEqual(first["comments"], [])
+        self.assertIsNotNone(first["prev_cursor"])
+
+        # 아직 새 댓글 없음 -> 같은 cursor로 다시 polling
+        empty = self._get(cursor=first["prev_cursor"], direction="prev")
+        self.assertEqual(empty["comments"], [])
+        self.assertEqual(empty["prev_cursor"], first["prev_cursor"])
+
+        added = [Comment.objects.create(post=self.post, user=self.post.user, content=f"새 댓글{i}") for i in range(3)]
+        page = self._get(cursor=first["prev_cursor"], direction="prev")
+        self.assertEqual(self._ids(page), [added[1].comment_id, added[0].comment_id])
+        self.assertTrue(page["has_prev"])
+        rest = self._get(cursor=page["prev_cursor"], direction="prev")
+        self.assertEqual(self._ids(rest), [added[2].comment_id])
+        self.assertFalse(rest["has_prev"])
+
+    def test_after_returns_only_new_comments_in_order(self):
+        data = self._get(after=self.comments[1].comment_id)
+        self.assertEqual(self._ids(data), [c.comment_id for c in self.comments[2:4]])
+        self.assertTrue(data["has_more"])
+
+        data = self._get(after=data["last_comment_id"])
+        self.assertEqual(self._ids(data), [self.comments[4].comment_id])
+        self.assertFalse(data["has_more"])
+        self.assertEqual(self._get(after=data["last_comment_id"])["comments"], [])
+
+    def test_cursor_query_uses_composite_index(self):
+        qs = Comment.objects.filter(post_id=self.post.post_id).order_by(*COMMENT_ORDERING)[:10]
+        self.assertIn("comments_post_created_idx", self.assertIndexOrdered(qs))
+
+
+@override_settings(POST_VIEW_FLUSH_INTERVAL=3600)
+class PostDetailQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@example.com", nickname="작성자", provider="kakao", provider_id="1")
+        event = Event.objects.create(
+            kopis_id="PF1", title="공연", start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 1, 2),
+        )
+        self.post = Post.objects.create(event=event, user=self.user, category="후기", title="제목", content="내용")
+        self.url = f"/api/posts/{self.post.post_id}"
+        # 버퍼 flush 스레드 시작 (첫 요청의 쿼리 수에 섞이지 않도록)
+        post_view_buffer.add(self.post.post_id)
+
+    def tearDown(self):
+        post_view_buffer.flush()
+
+    def test_anonymous_detail_is_one_query(self):
+        with self.assertNumQueries(1):
+            res = self.client.get(self.url)
+        data = res.json()["data"]
+        self.assertEqual(data["nickname"], "작성자")
+        self.assertEqual(data["content"], "내용")
+        self.assertNotIn("my_reaction", data)
+
+    def test_authenticated_detail_includes_my_reaction_in_one_query(self):
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user.user_id)}"}
+        with self.assertNumQueries(1):
+            data = self.client.get(self.url, **auth).json()["data"]
+        self.assertIsNone(data["my_reaction"])
+
+        toggle_post_reaction(self.post.post_id, self.user.user_id, ReactionType.LIKE)
+        with self.assertNumQueries(1):
+            data = self.client.get(self.url, **auth).json()["data"]
+        self.assertEqual(data["my_reaction"], {"like": True, "dislike": False})
+        self.assertEqual(data["like"], 1)
+
+
+class PostWriteBehindThreadTests(TestCase):
+    def test_loop_survives_unexpected_errors(self):
+        buffer = PostViewBuffer()
+        calls = []
+
+        def flush():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            raise SystemExit  # 두 번째 주기에서 루프 종료
+
+        with mock.patch.object(buffer, "flush", side_effect=flush), \
+                mock.patch("posts.services.time.sleep"), \
+                mock.patch("posts.services.connection"), \
+                self.assertLogs("posts.services", level="ERROR"):
+            with self.assertRaises(SystemExit):
+                buffer._run()
+        self.assertEqual(len(calls), 2)
@@ -1,20 +1,34 @@
 import json
 
 from django.shortcuts import render
-from django.core.paginator import Paginator
-from django.db.models import Q, F
 from django.views.decorators.http import require_GET, require_POST, require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.db import transaction, IntegrityError
+from django.db.models import F, OuterRef, Subquery
 
 from common.utils import common_response, login_check, get_optional_user_id
-from notifications.services import create_notification
+from common.pagination import (
+    CachedCountPaginator,
+    InvalidCursor,
+    cursor_paginate,
+    cursor_paginate_both,
+    keyset_filter,
+)
+from notifications.services import enqueue_notification
 from django.contrib.auth import get_user_model
 from users.services import apply_user_exp, ExpPolicy
 from events.models import Event
 
 User = get_user_model()
 from .models import Post, Comment, PostReaction, Report, ReactionType
+from .search import apply_post_search
+from .services import (
+    ReactionConflict,
+    post_view_buffer,
+    refresh_hot_scores,
+    toggle_post_reaction,
+    with_reaction_counts,
+)
 
 # Create your views here.
 
@@ -41,12 +55,6 @@ def _parse_json(request):
     except json.JSONDecodeError:
         return None
 
-# 게시글 목록의 게시글 내용(content) 250자 Preview 로직
-def _truncate_250(text: str) -> str:
-    if not text:
-        return ""
-    return text[:250]
-
 def _post_summary(p: Post) -> dict:
     return {
         "post_id": p.post_id,
@@ -57,9 +65,28 @@ def _post_summary(p: Post) -> dict:
         "title": p.title,
         "created_at": p.created_at.isoformat() if p.created_at else None,
         "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-        "views": p.views,
-        "like": p.like_count,
-        "dislike": p.dislike_count,
+        # DB 값 + 아직 반영 안 된 조회수
+        "views": p.views + post_view_buffer.pending(p.post_id),
+        # with_reaction_counts로 조회한 경우 반영 전 증감 로그 포함
+        "like": getattr(p, "like_total", p.like_count),
+        "dislike": getattr(p, "dislike_total", p.dislike_count),
+        "comment_count": p.comment_count,
+    }
+
+# 전체 게시글 목록 항목: 요약 + 본문 미리보기 + 공연 정보
+def _post_list_item(p: Post) -> dict:
+    return {
+        **_post_summary(p),
+
+        # 전체 게시글 목록: content는 250자 프리뷰 (posts.content_preview)
+        "content": p.content_preview,
+
+        # 커뮤니티 리스트에 “어느 공연 글인지” 필요
+        "event": {
+            "event_id": p.event_id,
+            "title": getattr(p.event, "title", None),
+            "poster": getattr(p.event, "poster", None),
+        }
     }
 
 def _post_detail(p: Post) -> dict:
@@ -69,6 +96,54 @@ def _post_detail(p: Post) -> dict:
         "image_url": p.image_url,  # null 가능
     }
 
+# 공연별 목록 조회 컬럼 (_post_summary, 작성자는 nickname만)
+POST_SUMMARY_FIELDS = (
+    "post_id", "event", "user", "category", "title",
+    "created_at", "updated_at", "views", "like_count", "dislike_count", "comment_count", "user__nickname",
+)
+
+# 전체 목록 조회 컬럼 (_post_list_item: 요약 + content_preview, 본문 content 제외)
+POST_LIST_FIELDS = (*POST_SUMMARY_FIELDS, "content_preview")
+
+# 상세 조회 컬럼
+POST_DETAIL_FIELDS = (*POST_SUMMARY_FIELDS, "content", "image_url")
+
+# 정렬: 최신/인기(좋아요)/조회수/hot/관련도 -> (정렬 식별자, ORDER BY)
+## posts 모델의 정렬 인덱스(posts_latest_idx 등)와 맞춰 둘 것
+def _post_ordering(sort: str, search: str = ""):
+    # 관련도순은 검색어가 있을 때만 (search_score: posts.search 백엔드에서 annotate)
+    if sort == "relevance" and search:
+        return "relevance", ("-search_score", "-created_at", "-post_id")
+    if sort == "hot":
+        return "hot", ("-hot_score", "-created_at", "-post_id")
+    if sort in ("popular", "like", "likes"):
+        return "popular", ("-like_count", "-created_at", "-post_id")
+    if sort in ("views", "view"):
+        return "views", ("-views", "-created_at", "-post_id")
+    return "latest", ("-created_at", "-post_id")
+
+# 댓글 정렬 (comments_post_created_idx와 맞춰 둘 것)
+COMMENT_ORDERING = ("-created_at", "-comment_id")
+COMMENT_ORDERING_ASC = ("created_at", "comment_id")
+
+POST_CATEGORIES = ("후기", "질문", "정보")
+
+# posts_list(event_id=None) / event_posts_list 조회 QuerySet (PostListQueryPlanTests도 이 함수로 검증)
+## 반환: (qs, 정렬 식별자, ORDER BY), category는 검증된 값
+def _post_list_queryset(event_id=None, category=None, search: str = "", sort: str = "latest"):
+    if event_id is None:
+        qs = Post.objects.select_related("user", "event").only(*POST_LIST_FIELDS, "event__title", "event__poster")
+    else:
+        qs = Post.objects.filter(event_id=event_id).select_related("user").only(*POST_SUMMARY_FIELDS)
+
+    if category:
+        qs = qs.filter(category=category)
+    if search:
+        qs = apply_post_search(qs, search)
+
+    sort_tag, ordering = _post_ordering(sort, search)
+    return qs, sort_tag, ordering
+
 def _comment_item(c: Comment) -> dict:
     return {
         "comment_id": c.comment_id,
@@ -88,6 +163,10 @@ def posts_list(request):
     search = (request.GET.get("search") or "").strip()
     sort  = (request.GET.get("sort") or "latest").strip().lower()
 
+    # cursor 모드: cursor 파라미터가 있으면 (빈 값 = 첫 페이지) keyset 페이지네이션
+    use_cursor = "cursor" in request.GET
+    cursor = (request.GET.get("cursor") or "").strip()
+
     try:
         page = int(request.GET.get("page") or 1)
         size = int(request.GET.get("size") or 10)
@@ -97,44 +176,36 @@ def posts_list(request):
     if page <= 0 or size <= 0 or size > 100:
         return common_response(False, message="page는 1 이상, size는 1~100 범위에 포함되어야 합니다.", status=400)
 
-    qs = Post.objects.select_related("user", "event")
-
-    if category:
-        if category not in ("후기", "질문", "정보"):
-            return common_response(False, message="category는 전체/후기/질문/정보 중 하나여야 합니다.", status=400)
-        qs = qs.filter(category=category)
-
-    if search:
-        qs = qs.filter(Q(title__icontains=search) | Q(content__icontains=search))
+    if category and category not in POST_CATEGORIES:
+        return common_response(False, message="category는 전체/후기/질문/정보 중 하나여야 합니다.", status=400)
 
-    if sort in ("popular", "like", "likes"):
-        qs = qs.order_by("-like_count", "-created_at", "-post_id")
-    elif sort in ("views", "view"):
-        qs = qs.order_by("-views", "-created_at", "-post_id")
-    else:
-        qs = qs.order_by("-created_at", "-post_id")
+    qs, sort_tag, ordering = _post_list_queryset(category=category, search=search, sort=sort)
 
-    paginator = Paginator(qs, size)
-    page_obj = paginator.get_page(page)
+    # cursor 모드: COUNT/OFFSET 없이 (정렬 키, created_at, post_id) 이후만 조회
+    if use_cursor:
+        try:
+            rows, next_cursor = cursor_paginate(qs, ordering, sort_tag, cursor, size)
+        except InvalidCursor as e:
+            return common_response(False, message=str(e), status=400)
 
-    posts = []
-    for p in page_obj.object_list:
-        posts.append({
-            **_post_summary(p),
+        data = {
+            "posts": [_post_list_item(p) for p in rows],
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None,
+            "size": size,
+        }
+        return common_response(True, data=data, message="전체 게시글 목록 조회 성공", status=200)
 
-            # 전체 게시글 목록: content는 250자 프리뷰 제한
-            "content": _truncate_250(p.content),
+    qs = qs.order_by(*ordering)
 
-            # 커뮤니티 리스트에 “어느 공연 글인지” 필요
-            "event": {
-                "event_id": p.event_id,
-                "title": getattr(p.event, "title", None),
-                "poster": getattr(p.event, "poster", None),
-            }
-        })
+    paginator = CachedCountPaginator(
+        qs, size, namespace="posts", endpoint="posts_list",
+        filters={"category": category, "search": search},
+    )
+    page_obj = paginator.get_page(page)
 
     data = {
-        "posts": posts,
+        "posts": [_post_list_item(p) for p in page_obj.object_list],
         "total_count": paginator.count,
         "total_pages": paginator.num_pages,
         "page": page_obj.number,
@@ -173,32 +244,47 @@ def event_posts_list(request, event_id: int):
     search = (request.GET.get("search") or "").strip()
     sort  = (request.GET.get("sort") or "latest").strip().lower()
 
+    # cursor 모드: cursor 파라미터가 있으면 (빈 값 = 첫 페이지) keyset 페이지네이션
+    use_cursor = "cursor" in request.GET
+    cursor = (request.GET.get("cursor") or "").strip()
+
     try:
         page = int(request.GET.get("page") or 1)
         size = int(request.GET.get("size") or 10) #(optinal: size)
     except ValueError:
         return common_response(False, message="page/size는 정수여야 합니다.", status=400)
 
-    qs = Post.objects.filter(event_id=event_id).select_related("user")
-
     # '전체'는 category 파라미터 안보내는 방식으로 처리
-    if category:
-        if category not in ("후기", "질문", "정보"):
-            return common_response(False, message="category는 전체/후기/질문/정보 중 하나여야 합니다.", status=400)
-        qs = qs.filter(category=category)
+    if category and category not in POST_CATEGORIES:
+        return common_response(False, message="category는 전체/후기/질문/정보 중 하나여야 합니다.", status=400)
 
-    if search:
-        qs = qs.filter(Q(title__icontains=search) | Q(content__icontains=search))
+    # 정렬: 최신/인기(좋아요)/조회수/hot/관련도(검색 시)
+    qs, sort_tag, ordering = _post_list_queryset(event_id=event_id, category=category, search=search, sort=sort)
 
-    # 정렬: 최신/인기(좋아요)/조회수
-    if sort in ("popular", "like", "likes"):
-        qs = qs.order_by("-like_count", "-created_at", "-post_id")
-    elif sort in ("views", "view"):
-        qs = qs.order_by("-views", "-created_at", "-post_id")
-    else:
-        qs = qs.order_by("-created_at", "-post_id")
+    # cursor 모드: (event_id, 정렬 키, created_at, post_id) 인덱스 range scan, COUNT 없음
+    if use_cursor:
+        if size <= 0 or size > 100:
+            return common_response(False, message="size는 1~100 범위에 포함되어야 합니다.", status=400)
+        try:
+            rows, next_cursor = cursor_paginate(qs, ordering, sort_tag, cursor, size)
+        except InvalidCursor as e:
+            return common_response(False, message=str(e), status=400)
+
+        data = {
+            "event": event_meta,
+            "posts": [_post_summary(p) for p in rows],
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None,
+            "size": size,
+        }
+        return common_response(True, data=data, message="공연별 게시글 목록 조회 성공", status=200)
+
+    qs = qs.order_by(*ordering)
     
-    paginator = Paginator(qs, size)
+    paginator = CachedCountPaginator(
+        qs, size, namespace="posts", endpoint="event_posts_list",
+        filters={"event_id": event_id, "category": category, "search": search},
+    )
     page_obj = paginator.get_page(page)
 
     data = {
@@ -277,24 +363,30 @@ def post_detail(request, post_id: int):
         if user_id is None:
             return common_response(False, message="토큰에 user_id가 없습니다.", status=401)
 
-    # 조회수 +1 (동시성 안전)
-    updated = Post.objects.filter(post_id=post_id).update(views=F("views") + 1)
-    if updated == 0:
+    # 게시글 + 작성자 닉네임(JOIN) + 반영 전 리액션 증감 + 내 리액션(서브쿼리)을 쿼리 1번으로
+    qs = with_reaction_counts(Post.objects.select_related("user").only(*POST_DETAIL_FIELDS))
+    if auth_header:
+        qs = qs.annotate(my_reaction_type=Subquery(
+            PostReaction.objects.filter(post_id=OuterRef("post_id"), user_id=user_id).values("type")[:1]
+        ))
+    try:
+        p = qs.get(post_id=post_id)
+    except Post.DoesNotExist:
         return common_response(False, message="존재하지 않는 게시글입니다.", status=404)
-    
-    p = Post.objects.select_related("user").get(post_id=post_id)
+
+    # 조회수 +1: write-behind 버퍼에 누적 (주기적으로 게시글별 UPDATE 1번, 요청 중 쿼리 없음)
+    post_view_buffer.add(post_id)
 
     detail = _post_detail(p)
 
     # Authorization이 있을 때만 my_reaction 추가
     if auth_header:
-        r = PostReaction.objects.filter(post_id=post_id, user_id=user_id).first()
-        if r is None:
+        if p.my_reaction_type is None:
             detail["my_reaction"] = None
         else:
             detail["my_reaction"] = {
-                "like": r.type ==  ReactionType.LIKE,
-                "dislike": r.type ==ReactionType.DISLIKE,
+                "like": p.my_reaction_type == ReactionType.LIKE,
+                "dislike": p.my_reaction_type == ReactionType.DISLIKE,
             }
 
     return common_response(True, data=detail, message="게시글 상세 조회 성공", status=200)
@@ -317,7 +409,7 @@ def post_update(request, post_id: int):
         return common_response(False, message="수정 권한이 없습니다.", status=403)
 
     # 부분 수정(PATCH) + bugfix2: value가 정의되지 않은 상태(UnboundLocalError)
-    changed = False
+    changed_fields = []
     for field in ("category", "title", "content", "image_url"):
         if field not in data:
             continue
@@ -333,12 +425,15 @@ def post_update(request, post_id: int):
                 value = value.strip()
 
         setattr(p, field, value)
-        changed = True
+        changed_fields.append(field)
 
-    if not changed:
+    if not changed_fields:
         return common_response(False, message="수정할 필드가 없습니다.", status=400)
 
-    p.save()
+    # 바뀐 컬럼만 저장 (조회수/리액션 카운트를 읽은 시점 값으로 덮어쓰지 않도록)
+    if "content" in changed_fields:
+        changed_fields.append("content_preview")
+    p.save(update_fields=[*changed_fields, "updated_at"])
     p = Post.objects.select_related("user").get(post_id=post_id)
     return common_response(True, data=_post_detail(p), message="게시글 수정 성공", status=200)
 
@@ -367,14 +462,52 @@ def post_comments_list(request, post_id: int):
         return comment_create(request, post_id)
 
     # GET: 목록 + 페이지네이션
+    ## cursor 모드: cursor 파라미터가 있으면 (빈 값 = 최신 페이지), direction=next(이전 댓글)/prev(새 댓글)
+    ## after 모드: after=<comment_id> 이후 새 댓글만 작성순으로 (열린 스레드 polling)
+    use_cursor = "cursor" in request.GET
+    cursor = (request.GET.get("cursor") or "").strip()
+    direction = (request.GET.get("direction") or "next").strip().lower()
+
     try:
         page = int(request.GET.get("page") or 1)
         size = int(request.GET.get("size") or 10)
+        after = int(request.GET["after"]) if request.GET.get("after") else None
     except ValueError:
-        return common_response(False, message="page/size는 정수여야 합니다.", status=400)
+        return common_response(False, message="page/size/after는 정수여야 합니다.", status=400)
+
+    qs = Comment.objects.filter(post_id=post_id).select_related("user")
+
+    if (after is not None or use_cursor) and (size <= 0 or size > 100):
+        return common_response(False, message="size는 1~100 범위에 포함되어야 합니다.", status=400)
+
+    if after is not None:
+        return _comment_updates(qs, post_id, after, size)
+
+    # cursor 모드: (post_id, created_at, comment_id) 인덱스 range scan, COUNT/OFFSET 없음
+    if use_cursor:
+        try:
+            rows, next_cursor, prev_cursor, has_next, has_prev = cursor_paginate_both(
+                qs, COMMENT_ORDERING, "comments", cursor, size, direction,
+            )
+        except InvalidCursor as e:
+            return common_response(False, message=str(e), status=400)
+
+        data = {
+            "post_id": post_id,
+            "comments": [_comment_item(c) for c in rows],
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+            "has_next": has_next,
+            "has_prev": has_prev,
+            "size": size,
+        }
+        return common_response(True, data=data, message="댓글 목록 조회 성공", status=200)
 
-    qs = Comment.objects.filter(post_id=post_id).select_related("user").order_by("-created_at", "-comment_id")
-    paginator = Paginator(qs, size)
+    qs = qs.order_by(*COMMENT_ORDERING)
+    paginator = CachedCountPaginator(
+        qs, size, namespace=f"comments:{post_id}", endpoint="post_comments_list",
+        filters={"post_id": post_id},
+    )
     page_obj = paginator.get_page(page)
 
     data = {
@@ -388,12 +521,32 @@ def post_comments_list(request, post_id: int):
     return common_response(True, data=data, message="댓글 목록 조회 성공", status=200)
 
 
+def _comment_updates(qs, post_id: int, after: int, size: int):
+    # after 댓글 이후 작성된 댓글 (작성순), 다음 polling은 응답의 last_comment_id로
+    anchor = Comment.objects.filter(post_id=post_id, comment_id=after).values_list("created_at", flat=True).first()
+    if anchor is None:
+        # 기준 댓글이 삭제된 경우: comment_id는 작성 순서대로 증가하므로 id 기준
+        qs = qs.filter(comment_id__gt=after)
+    else:
+        qs = qs.filter(keyset_filter(Comment, COMMENT_ORDERING_ASC, [anchor, after]))
+
+    rows = list(qs.order_by(*COMMENT_ORDERING_ASC)[:size + 1])
+    data = {
+        "post_id": post_id,
+        "comments": [_comment_item(c) for c in rows[:size]],
+        "last_comment_id": rows[:size][-1].comment_id if rows else after,
+        "has_more": len(rows) > size,
+        "size": size,
+    }
+    return common_response(True, data=data, message="새 댓글 조회 성공", status=200)
+
+
 @csrf_exempt
 @login_check
 @require_POST
 def comment_create(request, post_id: int):
     try:
-        post = Post.objects.select_related("user", "event").get(post_id=post_id)
+        post = Post.objects.only("post_id", "user_id", "event_id").get(post_id=post_id)
     except Post.DoesNotExist:
         return common_response(False, message="존재하지 않는 게시글입니다.", status=404)
 
@@ -405,27 +558,27 @@ def comment_create(request, post_id: int):
     if not content:
         return common_response(False, message="content는 필수입니다.", status=400)
 
-    c = Comment.objects.create(
-        post_id=post_id,
-        user_id=request.user_id,
-        content=content,
-    )
-    c = Comment.objects.select_related("user").get(comment_id=c.comment_id)
+    with transaction.atomic():
+        c = Comment.objects.create(
+            post_id=post_id,
+            user_id=request.user_id,
+            content=content,
+        )
+        Post.objects.filter(post_id=post_id).update(comment_count=F("comment_count") + 1)
 
-    # 댓글 작성 성공 후: 게시글 작성자에게 알림 (자기 글에 자기 댓글은 제외)
-    if post.user_id != request.user_id:
-        # create_notification 내부에서도 try/except 처리+호출도 안전하게 유지
-        try:
-            create_notification(
-                user=post.user,
+        # 게시글 작성자에게 알림 (자기 글에 자기 댓글은 제외) -> outbox 기록, 생성은 run_notification_worker
+        if post.user_id != request.user_id:
+            enqueue_notification(
+                user_id=post.user_id,
                 type="comment",
                 message="회원님의 게시글에 새로운 댓글이 달렸어요.",
                 relate_url=f"/posts/{post.post_id}#comment-{c.comment_id}",
-                post=post,
-                event=getattr(post, "event", None),
+                post_id=post.post_id,
+                event_id=post.event_id,
             )
-        except Exception:
-            pass
+    c = Comment.objects.select_related("user").get(comment_id=c.comment_id)
+    refresh_hot_scores([post_id])
+
     # 댓글 작성 exp 반영 (실패해도 댓글 작성은 성공하도록)
     exp_result = None
     try:
@@ -454,7 +607,12 @@ def comment_detail(request, comment_id: int):
         return common_response(False, message="권한이 없습니다.", status=403)
 
     if request.method == "DELETE":
-        c.delete()
+        with transaction.atomic():
+            # 동시에 같은 댓글을 지운 경우 한 번만 차감
+            deleted, _ = Comment.objects.filter(comment_id=comment_id).delete()
+            if deleted:
+                Post.objects.filter(post_id=c.post_id).update(comment_count=F("comment_count") - 1)
+        refresh_hot_scores([c.post_id])
         return common_response(True, data={"comment_id": comment_id}, message="댓글 삭제 성공", status=200)
 
     # PATCH
@@ -488,89 +646,42 @@ def post_dislike(request, post_id: int):
 
 
 def _toggle_reaction(request, post_id: int, target_type: str):
-    try:
-        # author_id는 트랜잭션 안에서 확보 (알림 조건 판단용)
-        author_id = None
+    # 존재 확인 + 알림 대상(작성자) 확보 (잠금 없음)
+    post = Post.objects.filter(post_id=post_id).values("user_id", "event_id").first()
+    if post is None:
+        return common_response(False, message="존재하지 않는 게시글입니다.", status=404)
 
+    try:
         with transaction.atomic():
-            # 게시글 row lock (카운트 정합성)
-            p = Post.objects.select_for_update().get(post_id=post_id)
-            author_id = p.user_id
-
-            r = PostReaction.objects.select_for_update().filter(
-                post_id=post_id, user_id=request.user_id
-            ).first()
-
-            if r is None:
-                # 신규
-                PostReaction.objects.create(post_id=post_id, user_id=request.user_id, type=target_type)
-                if target_type == ReactionType.LIKE:
-                    Post.objects.filter(post_id=post_id).update(like_count=F("like_count") + 1)
-                else:
-                    Post.objects.filter(post_id=post_id).update(dislike_count=F("dislike_count") + 1)
-                new_state = target_type
-
-            else:
-                # 토글/스위치
-                if r.type == target_type:
-                    # 같은 반응이면 취소
-                    r.delete()
-                    if target_type == ReactionType.LIKE:
-                        Post.objects.filter(post_id=post_id).update(like_count=F("like_count") - 1)
-                    else:
-                        Post.objects.filter(post_id=post_id).update(dislike_count=F("dislike_count") - 1)
-                    new_state = None
-                else:
-                    # dislike -> like 또는 like -> dislike
-                    old = r.type
-                    r.type = target_type
-                    r.save(update_fields=["type"])
-                    if old == ReactionType.LIKE:
-                        Post.objects.filter(post_id=post_id).update(
-                            like_count=F("like_count") - 1,
-                            dislike_count=F("dislike_count") + 1,
-                        )
-                    else:
-                        Post.objects.filter(post_id=post_id).update(
-                            dislike_count=F("dislike_count") - 1,
-                            like_count=F("like_count") + 1,
-                        )
-                    new_state = target_type
-
-        # 트랜잭션 밖에서 최신 카운트 조회
-        p2 = Post.objects.get(post_id=post_id)
-        data = {
-            "post_id": post_id,
-            "reaction": new_state,
-            "like": p2.like_count,
-            "dislike": p2.dislike_count,
-        }
-
-        # 리액션 성공 후: 게시글 작성자에게 알림 (자기 글에 자기 반응 제외)
-        if author_id is not None and author_id != request.user_id and new_state in (ReactionType.LIKE, ReactionType.DISLIKE):
-            try:
-                post_obj = Post.objects.select_related("user", "event").get(post_id=post_id)
-
-                noti_type = "post_like" if new_state == ReactionType.LIKE else "post_dislike"
-                noti_msg = "회원님의 게시글에 👍 좋아요가 눌렸어요." if new_state == ReactionType.LIKE else "회원님의 게시글에 👎 싫어요가 눌렸어요."
-
-                create_notification(
-                    user=post_obj.user,
-                    type=noti_type,
-                    message=noti_msg,
-                    relate_url=f"/posts/{post_obj.post_id}",
-                    post=post_obj,
-                    event=getattr(post_obj, "event", None),
+            # Post 행 잠금 없이 리액션 행 + 증감 로그만 기록 (카운트는 주기적으로 반영)
+            new_state = toggle_post_reaction(post_id, request.user_id, target_type)
+
+            # 게시글 작성자에게 알림 (자기 글에 자기 반응, 취소 제외) -> 같은 트랜잭션에 outbox 기록
+            if post["user_id"] != request.user_id and new_state in (ReactionType.LIKE, ReactionType.DISLIKE):
+                is_like = new_state == ReactionType.LIKE
+                enqueue_notification(
+                    user_id=post["user_id"],
+                    type="post_like" if is_like else "post_dislike",
+                    message="회원님의 게시글에 👍 좋아요가 눌렸어요." if is_like else "회원님의 게시글에 👎 싫어요가 눌렸어요.",
+                    relate_url=f"/posts/{post_id}",
+                    post_id=post_id,
+                    event_id=post["event_id"],
                 )
-            except Exception:
-                pass
-
-        return common_response(True, data=data, message="리액션 처리 성공", status=200)
+    except (ReactionConflict, IntegrityError):
+        return common_response(False, message="리액션 처리 중 충돌이 발생했습니다.", status=409)
 
-    except Post.DoesNotExist:
+    # 반영 전 증감 로그까지 포함한 최신 카운트
+    p2 = with_reaction_counts(Post.objects.filter(post_id=post_id)).values("like_total", "dislike_total").first()
+    if p2 is None:
         return common_response(False, message="존재하지 않는 게시글입니다.", status=404)
-    except IntegrityError:
-        return common_response(False, message="리액션 처리 중 충돌이 발생했습니다.", status=409)
+    data = {
+        "post_id": post_id,
+        "reaction": new_state,
+        "like": p2["like_total"],
+        "dislike": p2["dislike_total"],
+    }
+
+    return common_response(True, data=data, message="리액션 처리 성공", status=200)
 
 
 
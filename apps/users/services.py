@@ -1,7 +1,7 @@
 import math
 from users.models import User
 from notifications.models import Notification
-from notifications.services import create_notification
+from notifications.services import enqueue_notification
 from django.db import transaction, models
 
 """ 사용 예시
@@ -72,8 +72,9 @@ def apply_user_exp(user: User, type: ExpPolicy):
     user.save()
 
     if is_levelup:
-        create_notification(
-            user=user,
+        # 같은 트랜잭션에 outbox 기록 (생성은 run_notification_worker)
+        enqueue_notification(
+            user_id=user.user_id,
             type=Notification.Type.NOTICE,
             message=f"레벨이 {user.level} 로 올랐습니다!",
             relate_url="/api/users/me"
@@ -157,4 +157,44 @@ S3_UPLOAD_PREFIX = env("S3_UPLOAD_PREFIX", default="uploads/")
 S3_PRESIGN_EXPIRES = env.int("S3_PRESIGN_EXPIRES", default=300)
 
 # <-- (추후 커스텀 도메인/CloudFront 대응용, 여기에 base URL 지정) -->
-# S3_PUBLIC_BASE_URL = env("S3_PUBLIC_BASE_URL", default=None)
\ No newline at end of file
+# S3_PUBLIC_BASE_URL = env("S3_PUBLIC_BASE_URL", default=None)
+
+# 13. 캐시 (기본: 프로세스 로컬 메모리, 운영 다중 워커는 CACHE_URL로 redis/memcached 지정 필수)
+## 아티스트 매핑/자동완성의 무효화 버전 카운터도 이 캐시에 있음
+## locmem이면 다른 워커에서의 변경이 재적재 주기(최대 5~10분) 뒤에야 반영됨
+CACHES = {
+    "default": env.cache_url("CACHE_URL", default="locmemcache://"),
+}
+
+# 13-1. 목록 API total_count 캐시 (초)
+COUNT_CACHE_TTL = env.int("COUNT_CACHE_TTL", default=60)
+# 필터 없는 목록은 테이블 통계 근사치 사용 (MariaDB information_schema, 기본 비활성)
+COUNT_CACHE_ESTIMATE_UNFILTERED = env.bool("COUNT_CACHE_ESTIMATE_UNFILTERED", default=False)
+
+# 13-2. 공연 상세 응답 캐시 (초, Event 저장 시 무효화)
+EVENT_DETAIL_CACHE_TTL = env.int("EVENT_DETAIL_CACHE_TTL", default=60 * 10)
+
+# 14. 트렌딩 랭킹 (compute_trending_events)
+TRENDING_HALF_LIFE_HOURS = env.float("TRENDING_HALF_LIFE_HOURS", default=72)
+TRENDING_WINDOW_DAYS = env.int("TRENDING_WINDOW_DAYS", default=14)
+# 매 실행 다시 집계하는 최근 구간(분): bookmark 커밋 지연보다 길게
+TRENDING_OVERLAP_MINUTES = env.float("TRENDING_OVERLAP_MINUTES", default=10)
+# trending-worker(--interval 실행)의 전체 재계산 주기(초), 북마크 취소 반영
+TRENDING_FULL_INTERVAL = env.float("TRENDING_FULL_INTERVAL", default=60 * 60 * 24)
+
+# 14-2. 월 달력 응답 캐시 (공연 변경 시 해당 월만 무효화되므로 길게 유지)
+EVENT_CALENDAR_CACHE_TTL = env.int("EVENT_CALENDAR_CACHE_TTL", default=60 * 60 * 24)
+
+# 15. 게시글 조회수 write-behind (posts.services.post_view_buffer)
+## 반영 주기(초), 0이면 조회마다 즉시 UPDATE
+POST_VIEW_FLUSH_INTERVAL = env.float("POST_VIEW_FLUSH_INTERVAL", default=5)
+## 프로세스당 미반영 조회수가 이 값에 도달하면 주기와 관계없이 즉시 반영 (비정상 종료 시 유실 상한)
+POST_VIEW_MAX_PENDING = env.int("POST_VIEW_MAX_PENDING", default=1000)
+
+# 16. 게시글 검색 백엔드 (posts.search): auto(MySQL/MariaDB FULLTEXT, SQLite FTS5) | icontains
+POST_SEARCH_BACKEND = env("POST_SEARCH_BACKEND", default="auto")
+
+# 17. 게시글 sort=hot 점수 (posts.services.compute_hot_score)
+## 경과 시간 감쇠 지수 / 재계산 대상 기간(일, 이보다 오래된 글은 0)
+POST_HOT_GRAVITY = env.float("POST_HOT_GRAVITY", default=1.5)
+POST_HOT_WINDOW_DAYS = env.int("POST_HOT_WINDOW_DAYS", default=14)